@@ -0,0 +1,96 @@
+"""Benchmark of decoding a discovery snapshot device by device and in batches.
+
+Run from the repository root:
+
+    python benchmarks/batch_decode_benchmark.py [--devices 2000]
+"""
+import argparse
+import logging
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from inelsmqtt import batch  # noqa: E402
+from inelsmqtt.const import (  # noqa: E402
+    DA3_66M,
+    IOU3_108M,
+    JA3_018M,
+    SA3_04M,
+    SA3_012M,
+    WSB3_20H,
+    COVER,
+    LIGHT,
+    SENSOR,
+    SWITCH,
+)
+from inelsmqtt.util import DeviceValue  # noqa: E402
+
+# device type, inels type, payload length in bytes
+TYPES = [
+    (SWITCH, SA3_04M, 8),
+    (SWITCH, SA3_012M, 16),
+    (SWITCH, IOU3_108M, 24),
+    (LIGHT, DA3_66M, 8),
+    (COVER, JA3_018M, 20),
+    (SENSOR, WSB3_20H, 16),
+]
+
+
+def best_of(repeat: int, fnc) -> float:
+    """Best process time of several runs in seconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.process_time()
+        fnc()
+        best = min(best, time.process_time() - start)
+    return best
+
+
+def main() -> None:
+    """Print decode time of the whole snapshot."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--devices", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    rnd = random.Random(0)
+    groups = {}
+    for i in range(args.devices):
+        device_type, inels_type, length = TYPES[i % len(TYPES)]
+        payload = "".join(f"{rnd.randint(0, 255):02X}\n" for _ in range(length)).encode()
+        groups.setdefault((device_type, inels_type), []).append(payload)
+
+    def one_by_one() -> None:
+        for (device_type, inels_type), payloads in groups.items():
+            for payload in payloads:
+                DeviceValue(device_type, inels_type, inels_value=payload)
+
+    def batched() -> None:
+        for (device_type, inels_type), payloads in groups.items():
+            batch.decode_batch(device_type, inels_type, payloads)
+
+    def parse_only() -> None:
+        for payloads in groups.values():
+            batch.parse_status_batch(payloads)
+
+    numpy = batch.np
+    results = [("device by device", best_of(args.repeat, one_by_one))]
+    if numpy is not None:
+        results.append(("batch, numpy", best_of(args.repeat, batched)))
+        results.append(("  parsing only, numpy", best_of(args.repeat, parse_only)))
+    batch.np = None
+    results.append(("batch, no numpy", best_of(args.repeat, batched)))
+    results.append(("  parsing only, no numpy", best_of(args.repeat, parse_only)))
+    batch.np = numpy
+
+    print(f"devices {args.devices}")
+    for name, seconds in results:
+        print(f"{name:26} {seconds * 1e3:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""Benchmark of decoding button and input bits of an installation.
+
+Run from the repository root:
+
+    python benchmarks/bit_decode_benchmark.py [--messages 20000]
+"""
+import argparse
+import logging
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from inelsmqtt.const import (  # noqa: E402
+    DA3_66M,
+    GSB3_90SX_V2,
+    IM3_140M,
+    SA3_012M,
+    WSB3_40,
+    LIGHT,
+    SENSOR,
+    SWITCH,
+)
+from inelsmqtt.util import DeviceValue  # noqa: E402
+
+# device type, inels type, payload length in bytes, share of messages
+INSTALLATION = [
+    (SENSOR, GSB3_90SX_V2, 14, 6),
+    (SENSOR, WSB3_40, 16, 1),
+    (SENSOR, IM3_140M, 16, 1),
+    (SWITCH, SA3_012M, 16, 1),
+    (LIGHT, DA3_66M, 8, 1),
+]
+
+
+def best_of(repeat: int, fnc) -> float:
+    """Best process time of several runs in seconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.process_time()
+        fnc()
+        best = min(best, time.process_time() - start)
+    return best
+
+
+def main() -> None:
+    """Print decode time per message of every type and of the whole mix."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--messages", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    rnd = random.Random(0)
+    total_share = sum(share for *_, share in INSTALLATION)
+    mix = []
+    print(f"{'type':>14} {'us/message':>11}")
+    for device_type, inels_type, length, share in INSTALLATION:
+        payloads = [
+            "".join(f"{rnd.randint(0, 255):02X}\n" for _ in range(length)).encode()
+            for _ in range(args.messages)
+        ]
+        mix.extend(
+            (device_type, inels_type, p)
+            for p in payloads[: args.messages * share // total_share]
+        )
+
+        def decode() -> None:
+            for payload in payloads:
+                DeviceValue(device_type, inels_type, inels_value=payload)
+
+        seconds = best_of(args.repeat, decode)
+        print(f"{inels_type:>14} {seconds / args.messages * 1e6:11.2f}")
+
+    rnd.shuffle(mix)
+
+    def decode_mix() -> None:
+        for device_type, inels_type, payload in mix:
+            DeviceValue(device_type, inels_type, inels_value=payload)
+
+    seconds = best_of(args.repeat, decode_mix)
+    print(f"{'installation':>14} {seconds / len(mix) * 1e6:11.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""Micro-benchmark of DeviceValue decode cost per supported inels type.
+
+Run from the repository root:
+
+    python benchmarks/decode_benchmark.py [--number N]
+"""
+import argparse
+import json
+import logging
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from inelsmqtt.const import (  # noqa: E402
+    BITS,
+    DEVICE_TYPE_DICT,
+    INELS_DEVICE_TYPE_DICT,
+    INTEGERS,
+)
+from inelsmqtt.util import DeviceValue  # noqa: E402
+
+HEX_PAYLOAD = "00\n" * 64
+JSON_PAYLOAD = json.dumps({"state": {str(addr): 0 for addr in range(8)}})
+
+
+def cases() -> "list[tuple[str, str, str]]":
+    """Every (device type, inels type, payload) the library decodes."""
+    result = []
+    for code, inels_type in INELS_DEVICE_TYPE_DICT.items():
+        device_type = DEVICE_TYPE_DICT.get(code)
+        if device_type is not None:
+            payload = JSON_PAYLOAD if inels_type in (BITS, INTEGERS) else HEX_PAYLOAD
+            result.append((device_type, inels_type, payload))
+    return result
+
+
+def main() -> None:
+    """Print per-message decode time in microseconds for each type."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=2000)
+    args = parser.parse_args()
+
+    # malformed payloads for some types log an error on every decode
+    logging.disable(logging.CRITICAL)
+
+    total = 0.0
+    for device_type, inels_type, payload in cases():
+        elapsed = min(
+            timeit.repeat(
+                lambda: DeviceValue(device_type, inels_type, inels_value=payload),
+                number=args.number,
+                repeat=5,
+            )
+        )
+        per_message = elapsed / args.number * 1e6
+        total += per_message
+        print(f"{inels_type:<50} {per_message:8.2f} us")
+
+    print(f"{'mean':<50} {total / len(cases()):8.2f} us")
+
+
+if __name__ == "__main__":
+    main()
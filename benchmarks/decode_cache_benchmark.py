@@ -0,0 +1,81 @@
+"""Benchmark of decoding status messages of an installation through the decode cache.
+
+Most devices of one type report one of a few payloads, e.g. every switched
+off relay, so the same payloads are decoded over and over.
+
+Run from the repository root:
+
+    python benchmarks/decode_cache_benchmark.py [--messages 20000]
+"""
+import argparse
+import logging
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from inelsmqtt.cache import DecodeCache  # noqa: E402
+from inelsmqtt.const import (  # noqa: E402
+    DA3_22M,
+    LIGHT,
+    SA3_04M,
+    SA3_022M,
+    SWITCH,
+)
+
+# device type, inels type, status payload length in bytes, distinct payloads
+TYPES = [
+    (SWITCH, SA3_04M, 5, 4),
+    (SWITCH, SA3_022M, 40, 8),
+    (LIGHT, DA3_22M, 8, 16),
+]
+
+
+def best_of(repeat: int, fnc) -> float:
+    """Best process time of several runs in seconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.process_time()
+        fnc()
+        best = min(best, time.process_time() - start)
+    return best
+
+
+def main() -> None:
+    """Print time of decoding one message of every type, uncached and cached."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--messages", type=int, default=20000)
+    parser.add_argument("--capacity", type=int, default=256)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    rnd = random.Random(0)
+    print(f"{'type':>12} {'us/uncached':>12} {'us/cached':>10} {'hit rate':>9}")
+    for device_type, inels_type, length, distinct in TYPES:
+        payloads = [
+            "".join(f"{rnd.randint(0, 1):02X}\n" for _ in range(length))
+            for _ in range(distinct)
+        ]
+        messages = [rnd.choice(payloads) for _ in range(args.messages)]
+
+        def decode(cache: DecodeCache) -> None:
+            cache.clear()
+            for payload in messages:
+                cache.decode(device_type, inels_type, payload)
+
+        uncached = best_of(args.repeat, lambda: decode(DecodeCache(0)))
+        cache = DecodeCache(args.capacity)
+        cached = best_of(args.repeat, lambda: decode(cache))
+        stats = cache.stats
+        print(
+            f"{inels_type:>12} {uncached / args.messages * 1e6:12.2f}"
+            f" {cached / args.messages * 1e6:10.2f}"
+            f" {stats.hits / (stats.hits + stats.misses):9.1%}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""Memory benchmark of decoded HA values over a replay of status messages.
+
+Run from the repository root:
+
+    python benchmarks/ha_value_memory_benchmark.py [--messages N]
+"""
+import argparse
+import gc
+import logging
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from inelsmqtt.const import (  # noqa: E402
+    DEVICE_TYPE_DICT,
+    INELS_DEVICE_TYPE_DICT,
+    BITS,
+    INTEGERS,
+)
+from inelsmqtt.util import DeviceValue  # noqa: E402
+
+
+def replay(count: int) -> "list[tuple[str, str, str]]":
+    """Deterministic stream of status messages over every hex payload type."""
+    types = [
+        (DEVICE_TYPE_DICT[code], inels_type)
+        for code, inels_type in INELS_DEVICE_TYPE_DICT.items()
+        if code in DEVICE_TYPE_DICT and inels_type not in (BITS, INTEGERS)
+    ]
+    rnd = random.Random(0)
+    messages = []
+    for i in range(count):
+        device_type, inels_type = types[i % len(types)]
+        payload = "".join(f"{rnd.randrange(256):02X}\n" for _ in range(64))
+        messages.append((device_type, inels_type, payload))
+    return messages
+
+
+def main() -> None:
+    """Print memory held and GC activity for decoding the replay."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--messages", type=int, default=10000)
+    args = parser.parse_args()
+
+    # malformed payloads for some types log an error on every decode
+    logging.disable(logging.CRITICAL)
+    messages = replay(args.messages)
+
+    gc.collect()
+    collections = sum(stat["collections"] for stat in gc.get_stats())
+    tracemalloc.start()
+    start = time.perf_counter()
+    values = [
+        DeviceValue(device_type, inels_type, inels_value=payload).ha_value
+        for device_type, inels_type, payload in messages
+    ]
+    elapsed = time.perf_counter() - start
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    collections = sum(stat["collections"] for stat in gc.get_stats()) - collections
+
+    print(f"messages          {len(values)}")
+    print(f"held              {current / 1024:10.1f} KiB")
+    print(f"held per message  {current / len(values):10.1f} B")
+    print(f"peak              {peak / 1024:10.1f} KiB")
+    print(f"gc collections    {collections}")
+    print(f"decode time       {elapsed * 1e6 / len(values):10.2f} us/message (traced)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""Benchmark of decoding and encoding the types read through compiled layouts.
+
+Run from the repository root, on this tree and on one with the
+hand-written decoders to compare them:
+
+    python benchmarks/layout_decode_benchmark.py [--messages 20000]
+"""
+import argparse
+import logging
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from inelsmqtt.const import (  # noqa: E402
+    GSB3_90SX_V2,
+    SA3_022M,
+    VIRT_CONTR,
+    CLIMATE,
+    SENSOR,
+    SWITCH,
+)
+from inelsmqtt.util import DeviceValue  # noqa: E402
+
+# device type, inels type, payload length in bytes
+TYPES = [
+    (SWITCH, SA3_022M, 29),
+    (SENSOR, GSB3_90SX_V2, 14),
+    (CLIMATE, VIRT_CONTR, 31),
+]
+
+
+def best_of(repeat: int, fnc) -> float:
+    """Best process time of several runs in seconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.process_time()
+        fnc()
+        best = min(best, time.process_time() - start)
+    return best
+
+
+def main() -> None:
+    """Print decode and encode time per message for every type."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--messages", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    rnd = random.Random(0)
+    print(f"{'type':>18} {'decode us':>10} {'encode us':>10}")
+    for device_type, inels_type, length in TYPES:
+        payloads = [
+            "".join(f"{rnd.randint(0, 100):02X}\n" for _ in range(length)).encode()
+            for _ in range(args.messages)
+        ]
+        values = [
+            DeviceValue(device_type, inels_type, inels_value=p).ha_value for p in payloads
+        ]
+
+        def decode() -> None:
+            for payload in payloads:
+                DeviceValue(device_type, inels_type, inels_value=payload)
+
+        def encode() -> None:
+            for value in values:
+                DeviceValue(device_type, inels_type, ha_value=value)
+
+        decode_us = best_of(args.repeat, decode) / args.messages * 1e6
+        encode_us = best_of(args.repeat, encode) / args.messages * 1e6
+        print(f"{inels_type:>18} {decode_us:10.2f} {encode_us:10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""Benchmark of InelsMqtt message routing at a given message rate.
+
+Run from the repository root:
+
+    python benchmarks/on_message_benchmark.py [--rate 5000] [--devices 1000]
+"""
+import argparse
+import logging
+import os
+import sys
+import time
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from inelsmqtt import InelsMqtt  # noqa: E402
+from inelsmqtt.const import MQTT_HOST, MQTT_PORT  # noqa: E402
+
+
+def main() -> None:
+    """Print per-message routing cost and the share of the rate budget it uses."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rate", type=int, default=5000)
+    parser.add_argument("--devices", type=int, default=1000)
+    parser.add_argument("--seconds", type=int, default=5)
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    mqtt = InelsMqtt({MQTT_HOST: "localhost", MQTT_PORT: 1883})
+    on_message = mqtt._InelsMqtt__on_message  # pylint: disable=protected-access
+
+    topics = [f"inels/status/{i // 10:08X}/100/{i:06X}" for i in range(args.devices)]
+    for topic in topics:
+        mqtt.subscribe_listener(topic, "bench", lambda is_connected: None)
+
+    # alternate payloads so that no message is an unchanged republish
+    payloads = (b"00\n00\n0A\nC4\n00\n", b"01\n00\n0A\nC4\n00\n")
+    count = args.rate * args.seconds
+    messages = [
+        SimpleNamespace(topic=topics[i % len(topics)], payload=payloads[(i // len(topics)) % 2])
+        for i in range(count)
+    ]
+
+    start = time.process_time()
+    for msg in messages:
+        on_message(None, None, msg)
+    elapsed = time.process_time() - start
+
+    per_message = elapsed / count * 1e6
+    print(f"messages          {count}")
+    print(f"routing cost      {per_message:8.2f} us/message")
+    print(f"cpu at {args.rate} msg/s {per_message * args.rate / 1e4:8.2f} %")
+
+
+if __name__ == "__main__":
+    main()
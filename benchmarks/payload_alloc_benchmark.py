@@ -0,0 +1,79 @@
+"""Benchmark of memory allocated per status message, from routing to decoded value.
+
+Run from the repository root:
+
+    python benchmarks/payload_alloc_benchmark.py [--messages 2000]
+"""
+import argparse
+import logging
+import os
+import sys
+import time
+import tracemalloc
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from inelsmqtt import InelsMqtt  # noqa: E402
+from inelsmqtt.const import MQTT_HOST, MQTT_PORT  # noqa: E402
+from inelsmqtt.devices import Device  # noqa: E402
+
+# device type code -> payload length in bytes
+DEVICES = {
+    "02": 3,  # Switching unit
+    "108": 16,  # SA3-012M
+    "112": 24,  # IOU3-108M
+    "151": 8,  # DA3-66M
+    "163": 20,  # JA3-018M
+}
+
+
+def main() -> None:
+    """Print allocated bytes and time per message for every device type."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--messages", type=int, default=2000)
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    mqtt = InelsMqtt({MQTT_HOST: "localhost", MQTT_PORT: 1883})
+    on_message = mqtt._InelsMqtt__on_message  # pylint: disable=protected-access
+
+    print(f"{'type':>6} {'bytes/message':>14} {'us/message':>11}")
+    for code, length in DEVICES.items():
+        topic = f"inels/status/0000AAAA/{code}/00000001"
+        device = Device(mqtt, topic, subscribe=False)
+        payloads = [
+            "".join(f"{(i + k) % 256:02X}\n" for k in range(length)).encode()
+            for i in range(args.messages)
+        ]
+        messages = [SimpleNamespace(topic=topic, payload=p) for p in payloads]
+
+        def handle(msg: SimpleNamespace) -> None:
+            on_message(None, None, msg)
+            device.update_value(msg.payload)
+
+        handle(messages[0])
+
+        tracemalloc.start()
+        allocated = 0
+        for msg in messages[1:]:
+            tracemalloc.reset_peak()
+            before, _ = tracemalloc.get_traced_memory()
+            handle(msg)
+            _, peak = tracemalloc.get_traced_memory()
+            allocated += peak - before
+        tracemalloc.stop()
+
+        start = time.process_time()
+        for msg in messages:
+            handle(msg)
+        elapsed = time.process_time() - start
+
+        count = len(messages) - 1
+        print(
+            f"{code:>6} {allocated / count:14.0f} {elapsed / len(messages) * 1e6:11.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
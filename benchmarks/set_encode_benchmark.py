@@ -0,0 +1,76 @@
+"""Benchmark of encoding set commands of the types with padded set payloads.
+
+Run from the repository root:
+
+    python benchmarks/set_encode_benchmark.py [--commands 20000]
+"""
+import argparse
+import logging
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from inelsmqtt.const import (  # noqa: E402
+    DA3_22M,
+    DA3_66M,
+    DAC3_04M,
+    RC3_610DALI,
+    LIGHT,
+    SWITCH,
+)
+from inelsmqtt.util import DeviceValue  # noqa: E402
+
+# device type, inels type, status payload length in bytes
+TYPES = [
+    (SWITCH, RC3_610DALI, 48),
+    (LIGHT, DA3_66M, 22),
+    (LIGHT, DA3_22M, 8),
+    (LIGHT, DAC3_04M, 8),
+]
+
+
+def best_of(repeat: int, fnc) -> float:
+    """Best process time of several runs in seconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.process_time()
+        fnc()
+        best = min(best, time.process_time() - start)
+    return best
+
+
+def main() -> None:
+    """Print time of encoding one set command of every type."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--commands", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    rnd = random.Random(0)
+    print(f"{'type':>12} {'us/command':>11}")
+    for device_type, inels_type, length in TYPES:
+        values = [
+            DeviceValue(
+                device_type,
+                inels_type,
+                inels_value="".join(
+                    f"{rnd.randint(0, 100):02X}\n" for _ in range(length)
+                ),
+            ).ha_value
+            for _ in range(args.commands)
+        ]
+
+        def encode() -> None:
+            for value in values:
+                DeviceValue(device_type, inels_type, ha_value=value)
+
+        seconds = best_of(args.repeat, encode)
+        print(f"{inels_type:>12} {seconds / args.commands * 1e6:11.2f}")
+
+
+if __name__ == "__main__":
+    main()
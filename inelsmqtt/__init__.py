@@ -1,34 +1,55 @@
 """Library specified for inels-mqtt."""
-from collections import defaultdict
+from collections import OrderedDict, defaultdict
 import logging
+import threading
 import time
 import uuid
-import copy
 
 from datetime import datetime
-from typing import Any, Callable, Optional
+from typing import Any, Callable, Iterable, Optional
 
 import paho.mqtt.client as mqtt
 
+from .cache import DecodeCache, DecodeCacheStats
+from .dispatcher import DispatchStats, ListenerDispatcher
+from .mqtt_client import OfflineQueueStats, ParsedTopic, SendMessage
+from .store import StoreStats, TopicStore
+
 from .const import (
     MQTT_CLIENT_ID,
+    MQTT_DECODE_CACHE_SIZE,
+    MQTT_DISCOVERY_IDLE,
+    MQTT_DISPATCH_QUEUE_SIZE,
+    MQTT_DISPATCH_WORKERS,
     MQTT_HOST,
+    MQTT_OFFLINE_QUEUE_SIZE,
     MQTT_PASSWORD,
     MQTT_PORT,
     MQTT_STATUS_TOPIC_PREFIX,
+    MQTT_STORE_CAPACITY,
+    MQTT_STORE_TTL,
     MQTT_TIMEOUT,
     MQTT_TOTAL_CONNECTED_TOPIC,
     MQTT_TOTAL_STATUS_TOPIC,
     MQTT_TRANSPORT,
     MQTT_USERNAME,
     MQTT_PROTOCOL,
+    MQTT_SET_INTERVAL,
+    MQTT_SET_TOPIC_PREFIX,
     MQTT_TRANSPORTS,
     VERSION,
     DEVICE_TYPE_DICT,
-    FRAGMENT_DEVICE_TYPE,
-    FRAGMENT_STATE,
-    TOPIC_FRAGMENTS,
+    DECODE_CACHE_SIZE,
     DISCOVERY_TIMEOUT_IN_SEC,
+    DISCOVERY_IDLE_IN_SEC,
+    DISPATCH_QUEUE_SIZE,
+    OFFLINE_QUEUE_SIZE,
+    SET_INTERVAL_IN_SEC,
+    STORE_CAPACITY,
+    STORE_TTL_IN_SEC,
+    RECONNECT_MAX_DELAY_IN_SEC,
+    RECONNECT_MIN_DELAY_IN_SEC,
+    Connection_state,
 )
 
 __version__ = VERSION
@@ -55,6 +76,18 @@ class InelsMqtt:
             protocol (int): mqtt version of protocol whitch will be used
             transport (str): transportation protocol. Can be used tcp or websockets, defaltut tcp
             debug (bool): flag for debuging mqtt comunication. Default False
+            dispatch_workers (int): run listener callbacks on this many worker
+            threads instead of the network thread. Default 0, run inline
+            dispatch_queue_size (int): capacity of each worker queue
+            offline_queue_size (int): set commands kept while reconnecting,
+            the oldest device is dropped when full. Default 100, 0 disables
+            set_interval (float): minimal seconds between two commands to
+            one set topic, newer commands replace the waiting one and the
+            last is sent when the interval ends. Default 0, send everything
+            store_capacity (int): received topics kept in memory, the least
+            recently seen is forgotten first. Default 0, unlimited
+            store_ttl (float): forget topics quiet for this many seconds.
+            Default 0, keep forever
         """
         proto = (
             config.get(MQTT_PROTOCOL) if config.get(MQTT_PROTOCOL) else mqtt.MQTTv311
@@ -78,6 +111,10 @@ class InelsMqtt:
         self.client.on_disconnect = self.__on_disconnect
         self.__connection_error: Optional[int] = None
         self.__client.enable_logger()
+        # loop thread reconnects on its own after an unexpected disconnect
+        self.__client.reconnect_delay_set(
+            RECONNECT_MIN_DELAY_IN_SEC, RECONNECT_MAX_DELAY_IN_SEC
+        )
 
         u_name = config.get(MQTT_USERNAME)
         u_pwd = config.get(MQTT_PASSWORD)
@@ -91,16 +128,61 @@ class InelsMqtt:
         _t = config.get(MQTT_TIMEOUT)
         self.__timeout = _t if _t is not None else __DISCOVERY_TIMEOUT__
 
+        _t = config.get(MQTT_DISCOVERY_IDLE)
+        self.__discovery_idle = _t if _t is not None else DISCOVERY_IDLE_IN_SEC
+
+        self.__dispatcher: Optional[ListenerDispatcher] = None
+        if workers := config.get(MQTT_DISPATCH_WORKERS):
+            _t = config.get(MQTT_DISPATCH_QUEUE_SIZE)
+            self.__dispatcher = ListenerDispatcher(
+                workers, _t if _t is not None else DISPATCH_QUEUE_SIZE
+            )
+
+        _t = config.get(MQTT_OFFLINE_QUEUE_SIZE)
+        self.__offline_queue_size = _t if _t is not None else OFFLINE_QUEUE_SIZE
+        # set topic -> latest command, guarded by the state condition
+        self.__offline_queue: OrderedDict[str, tuple[SendMessage, Any]] = OrderedDict()
+        self.__offline_coalesced = 0
+        self.__offline_dropped = 0
+        self.__offline_replayed = 0
+
+        _t = config.get(MQTT_SET_INTERVAL)
+        self.__set_interval = _t if _t is not None else SET_INTERVAL_IN_SEC
+        self.__set_lock = threading.Lock()
+        self.__set_last_sent = dict[str, float]()
+        self.__set_pending = dict[str, tuple[SendMessage, Any]]()
+        self.__set_timers = dict[str, threading.Timer]()
+        self.__coalesced_commands = 0
+
         self.__listeners : dict[str, dict[str, Callable[[Any], Any]]] = defaultdict(lambda: dict())
+        self.__gateway_listeners: dict[str, set[str]] = defaultdict(set)
         self.__is_subscribed_list = dict[str, bool]()
         self.__last_values = dict[str, str]()
-        self.__try_connect = False
+        self.__state = Connection_state.Disconnected
+        self.__state_changed = threading.Condition()
+        self.__connected = threading.Event()
+        self.__connack_count = 0
         self.__message_readed = False
         self.__messages = dict[str, str]()
+        self.__topics = dict[str, ParsedTopic]()
+        _t = config.get(MQTT_STORE_CAPACITY)
+        _c = _t if _t is not None else STORE_CAPACITY
+        _t = config.get(MQTT_STORE_TTL)
+        self.__store = TopicStore(_c, _t if _t is not None else STORE_TTL_IN_SEC)
+        _t = config.get(MQTT_DECODE_CACHE_SIZE)
+        self.__decode_cache = DecodeCache(_t if _t is not None else DECODE_CACHE_SIZE)
+        self.__duplicate_messages = 0
+        # status topics of devices commanded since their last status
+        self.__commanded = set[str]()
         self.__discovered = dict[str, str]()
         self.__is_available = False
         self.__discover_start_time = None
-        self.__published = False
+        self.__discover_new_topic = threading.Event()
+        # topics of known devices received by the running discovery
+        self.__discover_seen = set[str]()
+        self.__discover_awaited = set[str]()
+        self.__discovery_duration: Optional[float] = None
+        self.__pending_publishes: dict[int, threading.Event] = {}
 
     @property
     def client(self) -> mqtt.Client:
@@ -116,11 +198,121 @@ class InelsMqtt:
         """
         return self.__is_available
 
+    @property
+    def connection_state(self) -> Connection_state:
+        """State of the connection to the broker
+
+        Returns:
+            Connection_state: Disconnected, Connecting (also while paho
+            reconnects) or Connected
+        """
+        return self.__state
+
+    def wait_connected(self, timeout: Optional[float] = None) -> bool:
+        """Block until the broker accepted the connection
+
+        Args:
+            timeout (Optional[float]): seconds to wait, None waits forever
+
+        Returns:
+            bool: True when connected
+        """
+        return self.__connected.wait(timeout)
+
     @property
     def list_of_listeners(self) -> dict[str, dict[str, Callable[[Any], Any]]]:
         """List of listeners."""
         return self.__listeners
 
+    @property
+    def timeout(self) -> float:
+        """Timeout of connecting, publishing and discovery in seconds."""
+        return self.__timeout
+
+    @property
+    def discovery_idle(self) -> float:
+        """Discovery ends after this many seconds without a new topic."""
+        return self.__discovery_idle
+
+    @property
+    def discovery_duration(self) -> Optional[float]:
+        """How long the last discovery took
+
+        Returns:
+            Optional[float]: duration in seconds, None before first discovery
+        """
+        return self.__discovery_duration
+
+    @property
+    def dispatch_stats(self) -> Optional[DispatchStats]:
+        """Metrics of listener dispatch workers
+
+        Returns:
+            Optional[DispatchStats]: queue depth and latency,
+            None when listeners run on the network thread
+        """
+        return self.__dispatcher.stats if self.__dispatcher is not None else None
+
+    @property
+    def offline_stats(self) -> OfflineQueueStats:
+        """Counters of the offline command queue
+
+        Returns:
+            OfflineQueueStats: commands waiting for the reconnect, replaced
+            by a newer command of the same device, dropped on overflow
+            and replayed after reconnects
+        """
+        with self.__state_changed:
+            return OfflineQueueStats(
+                depth=len(self.__offline_queue),
+                coalesced=self.__offline_coalesced,
+                dropped=self.__offline_dropped,
+                replayed=self.__offline_replayed,
+            )
+
+    @property
+    def coalesced_commands(self) -> int:
+        """Number of set commands replaced by a newer one before sending
+
+        Returns:
+            int: count of commands never sent because of set_interval
+        """
+        return self.__coalesced_commands
+
+    @property
+    def store_stats(self) -> StoreStats:
+        """Metrics of the received topics kept in memory
+
+        Returns:
+            StoreStats: topic count, approximate bytes, topics forgotten
+            for capacity and for ttl
+        """
+        return self.__store.stats
+
+    @property
+    def decode_cache(self) -> DecodeCache:
+        """Decoded status values shared by the devices of this broker."""
+        return self.__decode_cache
+
+    @property
+    def decode_cache_stats(self) -> DecodeCacheStats:
+        """Metrics of the decoded status values
+
+        Returns:
+            DecodeCacheStats: cached values, hits, misses and values
+            dropped for capacity
+        """
+        return self.__decode_cache.stats
+
+    @property
+    def duplicate_messages(self) -> int:
+        """Number of status messages dropped as unchanged republishes
+
+        Returns:
+            int: count of messages whose payload equaled the stored one
+        """
+        return self.__duplicate_messages
+
     @property
     def connection_error(self) -> Optional[str]:
         return self.__connection_error
@@ -145,6 +337,18 @@ class InelsMqtt:
         """
         return self.__last_values.get(topic)
 
+    def last_seen(self, topic) -> Optional[float]:
+        """Get time of the last message of the selected topic
+
+        Args:
+            topic (str): topic name
+
+        Returns:
+            Optional[float]: unix timestamp, including unchanged
+            republishes, None if the topic was never received
+        """
+        return self.__store.last_seen(topic)
+
     def messages(self) -> dict[str, str]:
         """List of all messages
 
@@ -178,31 +382,43 @@ class InelsMqtt:
         #if topic not in self.__listeners:
         #    self.__listeners[topic] = dict[str, Callable[[Any], Any]]()
 
-        stripped_topic = "/".join(topic.split("/")[2:])
-        self.__listeners[stripped_topic][unique_id] = fnc
+        parsed = self.__parse_topic(topic)
+        self.__listeners[parsed.stripped][unique_id] = fnc
+        # watched status is kept however long the device is quiet
+        self.__store.pin(MQTT_STATUS_TOPIC_PREFIX + parsed.stripped)
+        # gateway serial -> stripped topics behind it, for gw connected fan-out
+        self.__gateway_listeners[parsed.serial].add(parsed.stripped)
 
     def unsubscribe_listeners(self) -> bool:
         """Unsubscribe listeners."""
         self.__listeners.clear()
+        self.__gateway_listeners.clear()
 
     def __connect(self) -> None:
         """Create connection and register callback function to neccessary
         purposes.
         """
-        if self.__client.is_connected() is False:
-            self.__client.connect(self.__host, self.__port)
-            self.__client.loop_start()
-
-        start_time = datetime.now()
-
-        while self.__try_connect is False:
-            # there should be timeout to discover all topics
-            time_delta = datetime.now() - start_time
-            if time_delta.total_seconds() > self.__timeout:
-                self.__try_connect = self.__is_available = False
-                break
+        if self.__connected.is_set():
+            return
 
-            time.sleep(0.1)
+        with self.__state_changed:
+            if self.__state is Connection_state.Disconnected:
+                self.__state = Connection_state.Connecting
+                try:
+                    self.__client.connect(self.__host, self.__port)
+                except Exception:
+                    self.__state = Connection_state.Disconnected
+                    raise
+                self.__client.loop_start()
+
+            # wake on the next broker answer, accepted or refused
+            answered = self.__connack_count
+            if not self.__state_changed.wait_for(
+                lambda: self.__connack_count != answered
+                or self.__state is not Connection_state.Connecting,
+                self.__timeout,
+            ):
+                self.__is_available = False
 
     def __on_disconnect(
         self,
@@ -219,6 +435,16 @@ class InelsMqtt:
         """
         _LOGGER.info("%s - disconnecting reason [%s]", self.__host, reason_code)
 
+        with self.__state_changed:
+            self.__connected.clear()
+            # anything else than a requested disconnect is retried by paho
+            self.__state = (
+                Connection_state.Disconnected
+                if reason_code == mqtt.MQTT_ERR_SUCCESS
+                else Connection_state.Connecting
+            )
+            self.__state_changed.notify_all()
+
         for item in self.__is_subscribed_list.keys():
             self.__is_subscribed_list[item] = False
             _LOGGER.info("Disconnected %s", item)
@@ -237,13 +463,23 @@ class InelsMqtt:
             client (MqttClient): instance of mqtt client
             properties (_type_, optional): Props from mqtt sets. Defaults None
         """
-        self.__try_connect = True
-        if reason_code == mqtt.CONNACK_ACCEPTED:
-            self.__is_available = True
-            self.__connection_error = None
-        else:
-            self.__is_available = False
-            self.__connection_error = reason_code
+        with self.__state_changed:
+            self.__connack_count += 1
+            if reason_code == mqtt.CONNACK_ACCEPTED:
+                self.__is_available = True
+                self.__connection_error = None
+                self.__state = Connection_state.Connected
+                self.__connected.set()
+                # still under the condition, so no newer command overtakes
+                self.__replay_offline_queue()
+            else:
+                # paho keeps retrying with backoff
+                self.__is_available = False
+                self.__connection_error = reason_code
+            self.__state_changed.notify_all()
+
+        if self.__is_available:
+            self.__resubscribe()
 
         _LOGGER.info(
             "Mqtt broker %s:%s %s",
@@ -252,6 +488,134 @@ class InelsMqtt:
             "is connected" if self.__is_available else "is not connected",
         )
 
+    def __defer_set_command(self, topic, payload, qos, retain, properties) -> bool:
+        """Hold set command, when the previous one to the same topic was
+        sent less than set_interval ago. Only the latest held command
+        is sent, when the interval ends.
+
+        Returns:
+            bool: True when held, False when it can be sent right now
+        """
+        with self.__set_lock:
+            now = time.monotonic()
+            last_sent = self.__set_last_sent.get(topic)
+            wait = 0.0 if last_sent is None else last_sent + self.__set_interval - now
+            if wait <= 0 and topic not in self.__set_timers:
+                self.__set_last_sent[topic] = now
+                return False
+
+            if topic in self.__set_pending:
+                self.__coalesced_commands += 1
+            self.__set_pending[topic] = (
+                SendMessage(payload, topic, retain, qos),
+                properties,
+            )
+
+            if topic not in self.__set_timers:
+                timer = threading.Timer(
+                    max(wait, 0), self.__send_deferred, args=(topic,)
+                )
+                timer.daemon = True
+                self.__set_timers[topic] = timer
+                timer.start()
+
+        return True
+
+    def __supersede_set_command(self, topic: str) -> None:
+        """Drop the held command of the topic, a newer one is being sent
+        right now, and start a new interval.
+
+        Args:
+            topic (str): set topic
+        """
+        with self.__set_lock:
+            timer = self.__set_timers.pop(topic, None)
+            if timer is not None:
+                timer.cancel()
+            if self.__set_pending.pop(topic, None) is not None:
+                self.__coalesced_commands += 1
+            self.__set_last_sent[topic] = time.monotonic()
+
+    def __send_deferred(self, topic: str) -> None:
+        """Timer callback, send the latest held command of the topic."""
+        with self.__set_lock:
+            # superseded while the timer was firing
+            if self.__set_timers.get(topic) is not threading.current_thread():
+                return
+            del self.__set_timers[topic]
+            msg, properties = self.__set_pending.pop(topic)
+            self.__set_last_sent[topic] = time.monotonic()
+
+        if not self.__send(topic, msg.payload, msg.qos, msg.retain, properties):
+            _LOGGER.warning("Deferred command to %s was not acknowledged", topic)
+
+    def __queue_offline(self, topic, payload, qos, retain, properties) -> bool:
+        """Keep set command until the broker is back. Only the latest
+        command of every set topic is kept.
+
+        Args:
+            topic (str): topic string where to publish
+            payload (str): data content
+            qos (int): quality of service
+            retain (bool): Broke will keep message after sending it
+            properties (_type_): Props from mqtt sets
+
+        Returns:
+            bool: True when queued, False when it should be published now
+        """
+        if self.__offline_queue_size <= 0 or not topic.startswith(
+            MQTT_SET_TOPIC_PREFIX
+        ):
+            return False
+
+        with self.__state_changed:
+            # paho is reconnecting, publishing would only wait for timeout
+            if self.__state is not Connection_state.Connecting:
+                return False
+
+            if self.__offline_queue.pop(topic, None) is not None:
+                self.__offline_coalesced += 1
+            elif len(self.__offline_queue) >= self.__offline_queue_size:
+                dropped, _ = self.__offline_queue.popitem(last=False)
+                self.__offline_dropped += 1
+                _LOGGER.warning("Offline queue full, dropping command for %s", dropped)
+
+            self.__offline_queue[topic] = (
+                SendMessage(payload, topic, retain, qos),
+                properties,
+            )
+
+        return True
+
+    def __replay_offline_queue(self) -> None:
+        """Send all queued commands back to back, acks are not awaited.
+        Must be called with the state condition held.
+        """
+        if len(self.__offline_queue) == 0:
+            return
+
+        _LOGGER.info("Replaying %s offline commands", len(self.__offline_queue))
+        for msg, properties in self.__offline_queue.values():
+            self.client.publish(
+                msg.topic, msg.payload, msg.qos, msg.retain, properties
+            )
+        self.__offline_replayed += len(self.__offline_queue)
+        self.__offline_queue.clear()
+
+    def __resubscribe(self) -> None:
+        """Subscribe again to the topics lost by a reconnect."""
+        topics = [
+            topic
+            for topic, is_subscribed in self.__is_subscribed_list.items()
+            if not is_subscribed
+        ]
+        if len(topics) == 0:
+            return
+
+        self.client.subscribe([(topic, 0) for topic in topics])
+        for topic in topics:
+            self.__is_subscribed_list[topic] = True
+
     def publish(self, topic, payload, qos=0, retain=True, properties=None) -> bool:
         """Publish to mqtt broker. Will automatically connect
         establish all neccessary callback functions. Made
@@ -266,29 +630,142 @@ class InelsMqtt:
               to all subscribers. Defaults to True.
             properties (_type_, optional): Props from mqtt sets.
               Defaults to None.
+
+        Returns:
+            bool: True when the broker acknowledged the message, or when
+            it is a set command queued while the client reconnects or
+            waiting for the end of set_interval
+        """
+        self.__expect_status(topic)
+        if self.__set_interval > 0 and topic.startswith(MQTT_SET_TOPIC_PREFIX):
+            if self.__defer_set_command(topic, payload, qos, retain, properties):
+                return True
+
+        return self.__send(topic, payload, qos, retain, properties)
+
+    def __expect_status(self, topic: str) -> None:
+        """Let the next status of a commanded device through, even when
+        it equals the stored one. The device may have taken the command
+        as a new state, which only the status corrects.
+
+        Args:
+            topic (str): topic of the published message
         """
-        self.__published = False
+        if topic.startswith(MQTT_SET_TOPIC_PREFIX):
+            self.__commanded.add(
+                topic.replace(MQTT_SET_TOPIC_PREFIX, MQTT_STATUS_TOPIC_PREFIX, 1)
+            )
+
+    def __send(self, topic, payload, qos, retain, properties) -> bool:
+        """Publish message and wait for the acknowledgement
+
+        Returns:
+            bool: True when acknowledged or queued for reconnect
+        """
+        if self.__queue_offline(topic, payload, qos, retain, properties):
+            return True
+
         self.__connect()
-        self.client.publish(topic, payload, qos, retain, properties)
 
-        start_time = datetime.now()
+        # no lock around paho, its network thread holds its own lock
+        # while calling on_publish
+        info = self.client.publish(topic, payload, qos, retain, properties)
+        published = self.__track_publish(info)
 
-        while self.__published is False:
-            # there should be timeout to discover all topics
-            time_delta = datetime.now() - start_time
-            if time_delta.total_seconds() > self.__timeout:
-                self.__published = False
-                break
+        if published is None:
+            return False
 
-            time.sleep(0.1)
+        try:
+            return published.wait(self.__timeout) or info.is_published()
+        finally:
+            self.__pending_publishes.pop(info.mid, None)
+
+    def publish_many(
+        self,
+        messages: Iterable[tuple[str, Any, int, bool]],
+        timeout: Optional[float] = None,
+    ) -> dict[str, bool]:
+        """Publish several messages back to back and wait for all
+        their acknowledgements together. Total time is one broker
+        round trip instead of one per message.
+
+        Args:
+            messages (Iterable[tuple[str, Any, int, bool]]): topic, payload,
+              qos and retain of every message
+            timeout (float, optional): limit for the whole bulk in seconds.
+              Defaults to the client timeout.
+
+        Returns:
+            dict[str, bool]: topic with the information whether the broker
+              acknowledged it. A topic published more times is True only
+              when all of its messages were acknowledged. Set commands
+              queued while the client reconnects are True.
+        """
+        results: dict[str, bool] = {}
+        to_send: list[tuple[str, Any, int, bool]] = []
+        for topic, payload, qos, retain in messages:
+            self.__expect_status(topic)
+            if self.__set_interval > 0 and topic.startswith(MQTT_SET_TOPIC_PREFIX):
+                self.__supersede_set_command(topic)
+            if self.__queue_offline(topic, payload, qos, retain, None):
+                results[topic] = True
+            else:
+                to_send.append((topic, payload, qos, retain))
+
+        if len(to_send) == 0:
+            return results
+
+        self.__connect()
+
+        sent: list[tuple[str, mqtt.MQTTMessageInfo, threading.Event]] = []
+        for topic, payload, qos, retain in to_send:
+            info = self.client.publish(topic, payload, qos, retain)
+            sent.append((topic, info, self.__track_publish(info)))
+
+        deadline = time.monotonic() + (self.__timeout if timeout is None else timeout)
+        try:
+            for topic, info, published in sent:
+                if published is None:
+                    results[topic] = False
+                    continue
+                remaining = max(deadline - time.monotonic(), 0)
+                results[topic] = (
+                    published.wait(remaining) or info.is_published()
+                ) and results.get(topic, True)
+        finally:
+            for _, info, _ in sent:
+                self.__pending_publishes.pop(info.mid, None)
+
+        return results
+
+    def __track_publish(self, info: mqtt.MQTTMessageInfo) -> Optional[threading.Event]:
+        """Register an acknowledgement event for the published message.
+        An ack handled before the event is registered is seen by
+        is_published, which paho sets right after on_publish.
 
-        return self.__published
+        Args:
+            info (mqtt.MQTTMessageInfo): info returned by paho publish
+
+        Returns:
+            Optional[threading.Event]: event set when the broker acks
+            the message, None when paho refused to send it
+        """
+        if info.rc != mqtt.MQTT_ERR_SUCCESS:
+            _LOGGER.warning("Publishing failed with code %s", info.rc)
+            return None
+
+        published = threading.Event()
+        self.__pending_publishes[info.mid] = published
+        if info.is_published():
+            published.set()
+
+        return published
 
     def __on_publish(
         self,
         client: mqtt.Client,  # pylint: disable=unused-argument
         userdata,  # pylint: disable=unused-argument
-        mid,  # pylint: disable=unused-argument
+        mid,
     ) -> None:
         """Callback function called after publish
           has been created. Will log it.
@@ -298,7 +775,9 @@ class InelsMqtt:
             userdata (object): Published data
             mid (_type_): MID
         """
-        self.__published = True
+        published = self.__pending_publishes.get(mid)
+        if published is not None:
+            published.set()
 
     def subscribe(self, topic, qos=0, options=None, properties=None) -> Any:
         """Subscribe to selected topic. Will connect, set all
@@ -334,7 +813,44 @@ class InelsMqtt:
 
         return self.__messages.get(topic)
 
-    def discovery_all(self) -> "dict[str, str]":
+    def subscribe_many(self, topics: Iterable[str], qos=0) -> None:
+        """Subscribe to all topics with a single SUBSCRIBE packet.
+        Does not wait for any message, payloads already collected by
+        discovery stay available in messages.
+
+        Args:
+            topics (Iterable[str]): Topics string representation
+            qos (int, optional): Quality of service. Defaults to 0.
+        """
+        topics = list(dict.fromkeys(topics))
+        if len(topics) == 0:
+            return
+
+        self.client.on_message = self.__on_message
+
+        self.__connect()
+        self._subscribe_topics(topics, qos)
+
+    def _subscribe_topics(self, topics: "list[str]", qos: int) -> Optional[int]:
+        """Send one SUBSCRIBE packet for the topics, without connecting.
+        Topics which could not be sent are subscribed on reconnect.
+
+        Args:
+            topics (list[str]): distinct topics
+            qos (int): Quality of service
+
+        Returns:
+            Optional[int]: message id of the packet, None when not sent
+        """
+        self.client.on_message = self.__on_message
+        rc, mid = self.client.subscribe([(topic, qos) for topic in topics])
+
+        for topic in topics:
+            self.__is_subscribed_list[topic] = rc == mqtt.MQTT_ERR_SUCCESS
+
+        return mid if rc == mqtt.MQTT_ERR_SUCCESS else None
+
+    def discovery_all(self, awaited: Iterable[str] = ()) -> "dict[str, str]":
         """Subscribe to selected topic. This method is primary used for
         subscribing with wild-card (#,+).
         When wild-card is used, then all topic matching this will
@@ -352,10 +868,45 @@ class InelsMqtt:
                     prefix/status/groundfloor/livingroom/temp - yes
                     prefix/status/groundfloor/kitchen/fridge/temp - no
 
+        Discovery ends when no new topic arrived for the discovery idle
+        time, or at the latest after the timeout. The idle time counts
+        only once the first message arrived and every awaited device
+        sent its status.
+
+        Args:
+            awaited (Iterable[str]): topics, as in the result, of devices
+              asked for their status by comm test
+
         Returns:
             dict[str, str]: Dictionary of all topics with their payloads
         """
+        deadline = self._begin_discovery(awaited)
+
+        # retained messages come in one burst, so stop when it goes quiet
+        # and keep the timeout only as a hard cap
+        while (remaining := deadline - time.monotonic()) > 0:
+            settled = self._discovery_settled()
+            window = min(self.__discovery_idle, remaining) if settled else remaining
+            if not self.__discover_new_topic.wait(window) and settled:
+                break
+            self.__discover_new_topic.clear()
+
+        return self._end_discovery()
+
+    def _begin_discovery(self, awaited: Iterable[str] = ()) -> float:
+        """Subscribe the discovery wild-cards, first half of discovery_all
+
+        Args:
+            awaited (Iterable[str]): topics of devices asked for their
+              status by comm test
+
+        Returns:
+            float: time.monotonic() deadline of the discovery
+        """
         self.client.on_message = self.__on_discover
+        self.__discover_new_topic.clear()
+        self.__discover_seen.clear()
+        self.__discover_awaited = set(awaited)
 
         self.__connect()
 
@@ -373,15 +924,36 @@ class InelsMqtt:
             None,
         )
 
-        self.__discover_start_time = datetime.now()
+        self.__discover_start_time = time.monotonic()
+        return self.__discover_start_time + self.__timeout
 
-        while True:
-            # there should be timeout to discover all topics
-            time_delta = datetime.now() - self.__discover_start_time
-            if time_delta.total_seconds() > self.__timeout:
-                break
+    def _discovery_settled(self) -> bool:
+        """Whether the idle time may end the discovery
 
-            time.sleep(0.1)
+        Returns:
+            bool: True when the first message arrived and no device
+            asked by comm test is still to send its status
+        """
+        return bool(self.__discover_seen) and not self.__discover_awaited
+
+    def _new_topic_discovered(self) -> bool:
+        """Whether a new topic arrived since the previous call
+
+        Returns:
+            bool: True when discovery is still receiving new topics
+        """
+        discovered = self.__discover_new_topic.is_set()
+        self.__discover_new_topic.clear()
+        return discovered
+
+    def _end_discovery(self) -> "dict[str, str]":
+        """Collect the discovered topics, second half of discovery_all
+
+        Returns:
+            dict[str, str]: Dictionary of all topics with their payloads
+        """
+        self.__discovery_duration = time.monotonic() - self.__discover_start_time
+        _LOGGER.info("Discovery finished in %.2f s", self.__discovery_duration)
 
         for t in self.__discovered:
             self.__messages[MQTT_STATUS_TOPIC_PREFIX + t] = self.__discovered[t]
@@ -407,15 +979,19 @@ class InelsMqtt:
         _LOGGER.info("Found device from topic %s\n", msg.topic)
 
         # pass only those who belong to known device types
-        fragments = msg.topic.split("/")
-        device_type = fragments[TOPIC_FRAGMENTS[FRAGMENT_DEVICE_TYPE]]
-        action = fragments[TOPIC_FRAGMENTS[FRAGMENT_STATE]]
-
-        topic = msg.topic.split("/")[2:]
-        topic = "/".join(topic)
+        parsed = self.__parse_topic(msg.topic)
+        device_type = parsed.device_type
+        action = parsed.action
+        topic = parsed.stripped
 
         if device_type in DEVICE_TYPE_DICT:
+            self.__discover_topic_seen(msg.topic)
+            # pinned until the next status outside of discovery
+            self.__remember(msg.topic, msg.payload, True)
             if action == "status":
+                if topic in self.__discover_awaited:
+                    self.__discover_awaited.discard(topic)
+                    self.__discover_new_topic.set()
                 self.__discovered[topic] = msg.payload
                 self.__last_values[msg.topic] = msg.payload
                 self.__is_subscribed_list[msg.topic] = True
@@ -428,13 +1004,25 @@ class InelsMqtt:
                 _LOGGER.info("Device of type %s found [connected].\n", device_type)
         else:
             if device_type == "gw" and action == "connected":
+                self.__discover_topic_seen(msg.topic)
                 if msg.topic not in self.__is_subscribed_list:
                     client.subscribe(msg.topic, 0, None, None)
+                    self.__remember(msg.topic, msg.payload, True)
                     self.__messages[msg.topic] = msg.payload
-                    self.__last_values[msg.topic] = copy.copy(msg.topic)
+                    self.__last_values[msg.topic] = msg.topic
                     self.__is_subscribed_list[msg.topic] = True
                     _LOGGER.info("Device of type %s found [gw].\n", device_type)
 
+    def __discover_topic_seen(self, topic: str) -> None:
+        """Restart the idle window of discovery when the topic is new to it
+
+        Args:
+            topic (str): full topic of a known device
+        """
+        if topic not in self.__discover_seen:
+            self.__discover_seen.add(topic)
+            self.__discover_new_topic.set()
+
     def __on_message(
         self,
         client: mqtt.Client,  # pylint: disable=unused-argument
@@ -449,28 +1037,32 @@ class InelsMqtt:
             msg (object): Topic with payload from broker
         """
         self.__message_readed = True
-        message_parts = msg.topic.split("/")
-        device_type = message_parts[TOPIC_FRAGMENTS[FRAGMENT_DEVICE_TYPE]]
-
-        message_type = message_parts[TOPIC_FRAGMENTS[FRAGMENT_STATE]]
+        parsed = self.__parse_topic(msg.topic)
+        device_type = parsed.device_type
+        message_type = parsed.action
 
         if device_type in DEVICE_TYPE_DICT or device_type == "gw":
-            # keep last value
-            self.__last_values[msg.topic] = (
-                copy.copy(self.__messages[msg.topic])
-                if msg.topic in self.__messages
-                else msg.payload
-            )
+            self.__remember(msg.topic, msg.payload)
+
+            if msg.topic in self.__commanded:
+                self.__commanded.discard(msg.topic)
+            elif self.__messages.get(msg.topic) == msg.payload:
+                # modules republish unchanged status on a timer, neither
+                # state nor availability changed, so nothing to notify
+                self.__last_values[msg.topic] = msg.payload
+                self.__duplicate_messages += 1
+                return
+
+            # keep last value, payloads are immutable bytes so no copy
+            self.__last_values[msg.topic] = self.__messages.get(msg.topic, msg.payload)
             self.__messages[msg.topic] = msg.payload
 
         if  device_type == "gw" and message_type == "connected":
-            mac = message_parts[2]
-            for stripped_topic in self.__listeners:
-                if stripped_topic.startswith(mac):
-                    self.__notify_listeners(stripped_topic, True)
+            for stripped_topic in list(self.__gateway_listeners.get(parsed.serial, ())):
+                self.__notify_listeners(stripped_topic, True)
             return
 
-        stripped_topic = "/".join(message_parts[2:])
+        stripped_topic = parsed.stripped
 
         is_connected_message = message_type == "connected"
 
@@ -478,11 +1070,49 @@ class InelsMqtt:
             # This pass data change directely into the device.
             self.__notify_listeners(stripped_topic, is_connected_message)
 
+    def __remember(self, topic: str, payload: Any, pinned: bool = False) -> None:
+        """Mark the topic as seen and forget what the store dropped.
+        Availability topics, status of devices with listeners and
+        topics found by discovery (pinned) are never dropped.
+        """
+        parsed = self.__parse_topic(topic)
+        pinned = (
+            pinned or parsed.action != "status" or parsed.stripped in self.__listeners
+        )
+        for dropped in self.__store.touch(topic, payload, pinned):
+            self.__forget(dropped)
+
+    def __forget(self, topic: str) -> None:
+        """Drop the values kept for the topic, subscription and the
+        result of discovery stay as they are.
+        """
+        self.__messages.pop(topic, None)
+        self.__last_values.pop(topic, None)
+        self.__topics.pop(topic, None)
+
+    def __parse_topic(self, topic: str) -> ParsedTopic:
+        """Get fragments of the topic, splitting it only the first time
+
+        Args:
+            topic (str): full topic of the message
+
+        Returns:
+            ParsedTopic: cached fragments of the topic
+        """
+        parsed = self.__topics.get(topic)
+        if parsed is None:
+            parsed = self.__topics[topic] = ParsedTopic.parse(topic)
+        return parsed
+
     def __notify_listeners(self, stripped_topic: str, is_connected_message: bool) -> None:
         """Notify listeners for a specific topic."""
         if len(self.__listeners[stripped_topic]) > 0:
             for unique_id in list(self.__listeners[stripped_topic]): #prevents the dictionary increased in size during iteration exception
-                self.__listeners[stripped_topic][unique_id](is_connected_message)
+                fnc = self.__listeners[stripped_topic][unique_id]
+                if self.__dispatcher is not None:
+                    self.__dispatcher.dispatch(stripped_topic, fnc, is_connected_message)
+                else:
+                    fnc(is_connected_message)
 
     def __on_subscribe(
         self,
@@ -510,9 +1140,16 @@ class InelsMqtt:
         self.close()
         self.client.disconnect()
 
+        with self.__state_changed:
+            self.__connected.clear()
+            self.__state = Connection_state.Disconnected
+            self.__state_changed.notify_all()
+
     def close(self) -> None:
-        """Close loop."""
+        """Close loop and stop the dispatch workers."""
         self.client.loop_stop()
+        if self.__dispatcher is not None:
+            self.__dispatcher.stop()
 
     def disconnect(self) -> None:
         """Disconnect mqtt client."""
@@ -0,0 +1,416 @@
+"""Asyncio transport for inels-mqtt."""
+from __future__ import annotations
+
+import asyncio
+import logging
+import socket
+import time
+from typing import Any, Callable, Iterable, Optional
+
+import paho.mqtt.client as mqtt
+
+from . import InelsMqtt
+from .const import (
+    MQTT_HOST,
+    MQTT_PORT,
+    RECONNECT_MAX_DELAY_IN_SEC,
+    RECONNECT_MIN_DELAY_IN_SEC,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+# how often paho handles keepalive and retries when driven by the loop
+MISC_INTERVAL_IN_SEC = 1
+
+
+class AsyncInelsMqtt(InelsMqtt):
+    """InelsMqtt driven by the asyncio event loop.
+
+    The paho client runs through its socket hooks: the loop watches the
+    socket with add_reader/add_writer, so no network thread is started and
+    every callback, listeners included, runs on the event loop. Only the
+    blocking name lookup and connect run in the default executor. Use the
+    async_* methods, publish and subscribe never wait here because the
+    acknowledgement could only arrive once they return to the loop, and
+    the methods which can only wait raise RuntimeError. A connection
+    dropped by the broker is reopened from the loop with the same
+    backoff as paho uses in InelsMqtt.
+    """
+
+    def __init__(self, config: dict[str, Any]) -> None:
+        """AsyncInelsMqtt instance initialization.
+
+        Args:
+            config dict[str, Any]: config for mqtt connection, see InelsMqtt
+        """
+        super().__init__(config)
+
+        self.__host = config[MQTT_HOST]
+        self.__port = config[MQTT_PORT]
+        self.__loop: Optional[asyncio.AbstractEventLoop] = None
+        self.__misc: Optional[asyncio.TimerHandle] = None
+        self.__connected: Optional[asyncio.Future] = None
+        self.__publishes: dict[int, asyncio.Future] = {}
+        self.__subscribes: dict[int, asyncio.Future] = {}
+        self.__reconnect: Optional[asyncio.TimerHandle] = None
+        self.__reconnect_attempts = 0
+
+        self.__sync_on_connect = self.client.on_connect
+        self.__sync_on_publish = self.client.on_publish
+        self.__sync_on_subscribe = self.client.on_subscribe
+        self.__sync_on_disconnect = self.client.on_disconnect
+        self.client.on_connect = self.__on_connect
+        self.client.on_publish = self.__on_publish
+        self.client.on_subscribe = self.__on_subscribe
+        self.client.on_disconnect = self.__on_disconnect
+        self.client.on_socket_open = self.__on_socket_open
+        self.client.on_socket_close = self.__on_socket_close
+        self.client.on_socket_register_write = self.__on_socket_register_write
+        self.client.on_socket_unregister_write = self.__on_socket_unregister_write
+
+    async def async_connect(self) -> bool:
+        """Connect to the broker, if not connected yet
+
+        Returns:
+            bool: True when the broker accepted the connection
+            within the timeout
+        """
+        self.__loop = asyncio.get_running_loop()
+        if self.client.is_connected():
+            return self.is_available
+
+        if self.__connected is None or self.__connected.done():
+            self.__connected = self.__loop.create_future()
+            try:
+                await self.__loop.run_in_executor(
+                    None, self.client.connect, self.__host, self.__port
+                )
+            except Exception as err:
+                # waiters of the pending connect fail the same way
+                self.__connected.set_exception(err)
+                self.__connected.exception()
+                raise
+
+        try:
+            await asyncio.wait_for(asyncio.shield(self.__connected), self.timeout)
+        except asyncio.TimeoutError:
+            _LOGGER.warning("Mqtt broker %s:%s did not answer", self.__host, self.__port)
+            return False
+
+        return self.is_available
+
+    async def async_test_connection(self) -> Optional[int]:
+        """Test connection, like test_connection without blocking
+
+        Returns:
+            Optional[int]: None when connected, otherwise error code
+        """
+        try:
+            await self.async_connect()
+            self.disconnect()
+        except Exception as e:  # pylint: disable=broad-except
+            return 3 if isinstance(e, ConnectionRefusedError) else 6
+
+        return self.connection_error
+
+    def test_connection(self) -> Optional[int]:
+        """Not available, the connection is only answered while the loop runs."""
+        raise RuntimeError("Use async_test_connection with AsyncInelsMqtt")
+
+    async def async_publish(
+        self, topic, payload, qos=0, retain=True, properties=None
+    ) -> bool:
+        """Publish to mqtt broker and wait for the acknowledgement
+
+        Args:
+            topic (str): topic string where to publish
+            payload (str): data content
+            qos (int, optional): quality of service. Defaults to 0.
+            retain (bool, optional): Broke will keep message after sending it
+              to all subscribers. Defaults to True.
+            properties (_type_, optional): Props from mqtt sets.
+              Defaults to None.
+
+        Returns:
+            bool: True when the broker acknowledged the message in time
+        """
+        await self.async_connect()
+
+        info = self.client.publish(topic, payload, qos, retain, properties)
+        if info.rc != mqtt.MQTT_ERR_SUCCESS:
+            _LOGGER.warning("Publishing failed with code %s", info.rc)
+            return False
+        if info.is_published():
+            return True
+
+        # acks are handled on this loop, so none can be missed before this
+        published = self.__loop.create_future()
+        self.__publishes[info.mid] = published
+        try:
+            return await asyncio.wait_for(published, self.timeout)
+        except asyncio.TimeoutError:
+            return False
+        finally:
+            self.__publishes.pop(info.mid, None)
+
+    def publish(self, topic, payload, qos=0, retain=True, properties=None) -> bool:
+        """Queue message to the broker without waiting for the ack
+
+        Returns:
+            bool: True when the message was queued
+        """
+        info = self.client.publish(topic, payload, qos, retain, properties)
+        return info.rc == mqtt.MQTT_ERR_SUCCESS
+
+    async def async_publish_many(
+        self, messages: Iterable[tuple[str, Any, int, bool]]
+    ) -> dict[str, bool]:
+        """Publish several messages back to back and wait for all
+        their acknowledgements together
+
+        Args:
+            messages (Iterable[tuple[str, Any, int, bool]]): topic, payload,
+              qos and retain of every message
+
+        Returns:
+            dict[str, bool]: topic with the information whether the broker
+              acknowledged it, True only when all its messages were
+        """
+        messages = list(messages)
+        # every publish is sent before its task first waits on the loop
+        acked = await asyncio.gather(
+            *(self.async_publish(topic, payload, qos, retain)
+              for topic, payload, qos, retain in messages)
+        )
+
+        results: dict[str, bool] = {}
+        for (topic, *_), ok in zip(messages, acked):
+            results[topic] = ok and results.get(topic, True)
+        return results
+
+    def publish_many(
+        self,
+        messages: Iterable[tuple[str, Any, int, bool]],
+        timeout: Optional[float] = None,
+    ) -> dict[str, bool]:
+        """Queue several messages without waiting for the acks
+
+        Returns:
+            dict[str, bool]: topic with the information whether all its
+              messages were queued
+        """
+        results: dict[str, bool] = {}
+        for topic, payload, qos, retain in messages:
+            results[topic] = self.publish(topic, payload, qos, retain) and results.get(topic, True)
+        return results
+
+    async def async_subscribe(self, topic, qos=0) -> Any:
+        """Subscribe to the topic and wait for the acknowledgement
+
+        Args:
+            topic (str): Topic string representation
+            qos (int, optional): Quality of service. Defaults to 0.
+
+        Returns:
+            Any: payload of the topic if already received, a retained
+            payload sent after the acknowledgement reaches messages and
+            listeners as usual
+        """
+        await self.async_subscribe_many([topic], qos)
+        return self.messages().get(topic)
+
+    def subscribe(self, topic, qos=0, options=None, properties=None) -> Any:
+        """Subscribe to the topic without waiting for its payload
+
+        Returns:
+            Any: payload of the topic if already received
+        """
+        self.subscribe_many([topic], qos)
+        return self.messages().get(topic)
+
+    def subscribe_many(self, topics: Iterable[str], qos=0) -> None:
+        """Send one SUBSCRIBE packet for the topics without waiting.
+        Connect with async_connect first, topics not sent while the
+        broker is away are subscribed on reconnect.
+
+        Args:
+            topics (Iterable[str]): Topics string representation
+            qos (int, optional): Quality of service. Defaults to 0.
+        """
+        if self.__loop is None:
+            raise RuntimeError("Connect AsyncInelsMqtt with async_connect first")
+
+        topics = list(dict.fromkeys(topics))
+        if len(topics) > 0:
+            self._subscribe_topics(topics, qos)
+
+    async def async_subscribe_many(self, topics: Iterable[str], qos=0) -> None:
+        """Subscribe to all topics with a single SUBSCRIBE packet and
+        wait for the acknowledgement
+
+        Args:
+            topics (Iterable[str]): Topics string representation
+            qos (int, optional): Quality of service. Defaults to 0.
+        """
+        await self.async_connect()
+
+        topics = list(dict.fromkeys(topics))
+        if len(topics) == 0:
+            return
+
+        mid = self._subscribe_topics(topics, qos)
+        if mid is None:
+            return
+
+        # acks are handled on this loop, so none can be missed before this
+        subscribed = self.__loop.create_future()
+        self.__subscribes[mid] = subscribed
+        try:
+            await asyncio.wait_for(subscribed, self.timeout)
+        except asyncio.TimeoutError:
+            _LOGGER.warning("Subscription of %s topics was not acknowledged", len(topics))
+        finally:
+            self.__subscribes.pop(mid, None)
+
+    async def async_discovery_all(self, awaited: Iterable[str] = ()) -> "dict[str, str]":
+        """Discover all topics, like discovery_all without blocking
+
+        Args:
+            awaited (Iterable[str]): topics, as in the result, of devices
+              asked for their status by comm test
+
+        Returns:
+            dict[str, str]: Dictionary of all topics with their payloads
+        """
+        await self.async_connect()
+        deadline = self._begin_discovery(awaited)
+
+        while (remaining := deadline - time.monotonic()) > 0:
+            await asyncio.sleep(min(self.discovery_idle, remaining))
+            if not self._new_topic_discovered() and self._discovery_settled():
+                break
+
+        return self._end_discovery()
+
+    def discovery_all(self) -> "dict[str, str]":
+        """Not available, messages are only received while the loop runs."""
+        raise RuntimeError("Use async_discovery_all with AsyncInelsMqtt")
+
+    def close(self) -> None:
+        """Stop reconnecting and close loop."""
+        if self.__reconnect is not None:
+            self.__reconnect.cancel()
+            self.__reconnect = None
+        super().close()
+
+    def __on_connect(self, client: mqtt.Client, *args: Any) -> None:
+        """Resolve the pending connect after InelsMqtt handled it."""
+        self.__sync_on_connect(client, *args)
+        if self.is_available:
+            self.__reconnect_attempts = 0
+        if self.__connected is not None and not self.__connected.done():
+            self.__connected.set_result(None)
+
+    def __on_disconnect(self, client: mqtt.Client, userdata, reason_code, *args: Any) -> None:
+        """Reconnect when the connection was not closed on request."""
+        self.__sync_on_disconnect(client, userdata, reason_code, *args)
+        if (
+            reason_code != mqtt.MQTT_ERR_SUCCESS
+            and self.__loop is not None
+            and self.__reconnect is None
+        ):
+            self.__schedule_reconnect()
+
+    def __schedule_reconnect(self) -> None:
+        """Reconnect later, doubling the delay after every failed attempt."""
+        delay = min(
+            RECONNECT_MIN_DELAY_IN_SEC * 2 ** self.__reconnect_attempts,
+            RECONNECT_MAX_DELAY_IN_SEC,
+        )
+        self.__reconnect_attempts += 1
+        self.__reconnect = self.__loop.call_later(delay, self.__try_reconnect)
+
+    def __try_reconnect(self) -> None:
+        """Open the connection again in the executor, a refused connect
+        lands in __on_disconnect.
+        """
+        self.__reconnect = None
+        reconnected = self.__loop.run_in_executor(None, self.client.reconnect)
+        reconnected.add_done_callback(self.__on_reconnected)
+
+    def __on_reconnected(self, reconnected: asyncio.Future) -> None:
+        """Try again later when the connection could not be opened."""
+        err = reconnected.exception()
+        if err is None:
+            return
+        if not isinstance(err, OSError):
+            raise err
+        _LOGGER.info("Reconnecting to %s:%s failed: %s", self.__host, self.__port, err)
+        if self.__reconnect is None:
+            self.__schedule_reconnect()
+
+    def __on_subscribe(self, client: mqtt.Client, userdata, mid, *args: Any) -> None:
+        """Resolve the pending subscribe of the mid."""
+        self.__sync_on_subscribe(client, userdata, mid, *args)
+        subscribed = self.__subscribes.get(mid)
+        if subscribed is not None and not subscribed.done():
+            subscribed.set_result(None)
+
+    def __on_publish(self, client: mqtt.Client, userdata, mid) -> None:
+        """Resolve the pending publish of the mid."""
+        self.__sync_on_publish(client, userdata, mid)
+        published = self.__publishes.get(mid)
+        if published is not None and not published.done():
+            published.set_result(True)
+
+    def __on_loop(self, fnc: Callable[..., Any], *args: Any) -> None:
+        """Run fnc on the loop, socket hooks of a connect come from the executor."""
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+
+        if running is self.__loop:
+            fnc(*args)
+        else:
+            self.__loop.call_soon_threadsafe(fnc, *args)
+
+    def __on_socket_open(self, client: mqtt.Client, userdata, sock: socket.socket) -> None:
+        """Start watching the new socket."""
+        self.__on_loop(self.__watch_socket, client, sock)
+
+    def __watch_socket(self, client: mqtt.Client, sock: socket.socket) -> None:
+        """Read when the socket has data and handle keepalive."""
+        self.__loop.add_reader(sock, client.loop_read)
+        self.__misc = self.__loop.call_later(MISC_INTERVAL_IN_SEC, self.__loop_misc)
+
+    def __on_socket_close(self, client: mqtt.Client, userdata, sock: socket.socket) -> None:
+        """Stop watching the closed socket."""
+        self.__on_loop(self.__unwatch_socket, sock)
+
+    def __unwatch_socket(self, sock: socket.socket) -> None:
+        """Forget the socket and stop keepalive."""
+        self.__loop.remove_reader(sock)
+        self.__loop.remove_writer(sock)
+        if self.__misc is not None:
+            self.__misc.cancel()
+            self.__misc = None
+
+    def __on_socket_register_write(
+        self, client: mqtt.Client, userdata, sock: socket.socket
+    ) -> None:
+        """Write when the socket is writable and paho has data."""
+        self.__on_loop(self.__loop.add_writer, sock, client.loop_write)
+
+    def __on_socket_unregister_write(
+        self, client: mqtt.Client, userdata, sock: socket.socket
+    ) -> None:
+        """Everything written, stop watching for writability."""
+        self.__on_loop(self.__loop.remove_writer, sock)
+
+    def __loop_misc(self) -> None:
+        """Let paho send keepalive pings, repeats while connected."""
+        if self.client.loop_misc() == mqtt.MQTT_ERR_SUCCESS:
+            self.__misc = self.__loop.call_later(MISC_INTERVAL_IN_SEC, self.__loop_misc)
+        else:
+            self.__misc = None
@@ -0,0 +1,85 @@
+"""Bulk decoding of status payloads of many devices."""
+from __future__ import annotations
+
+import binascii
+import re
+from typing import Optional, Sequence, Union
+
+try:
+    import numpy as np
+except ImportError:  # optional, payloads are then parsed one by one
+    np = None
+
+from .util import DeviceValue
+
+Payload = Union[str, bytes, None]
+
+_PLAIN_STATUS = re.compile(b"(?:[0-9A-F]{2}\n)+")
+
+if np is not None:
+    # ascii code -> value of the hex digit, 255 for anything else
+    _NIBBLES = np.full(256, 255, dtype=np.uint8)
+    _NIBBLES[np.frombuffer(b"0123456789ABCDEF", dtype=np.uint8)] = np.arange(
+        16, dtype=np.uint8
+    )
+
+
+def parse_status_batch(payloads: Sequence[Payload]) -> "list[Optional[bytes]]":
+    """Parse status payloads into the values of their bytes
+
+    With numpy installed, payloads of the same length are parsed
+    together as one uint8 matrix, every field is then a column.
+
+    Args:
+        payloads (Sequence[Payload]): raw status payloads
+
+    Returns:
+        list[Optional[bytes]]: values of the status bytes of every
+        payload, None for payloads not made of uppercase "XX\\n" bytes
+    """
+    raws = [p.encode() if isinstance(p, str) else p for p in payloads]
+    parsed: list[Optional[bytes]] = [None] * len(raws)
+
+    if np is None:
+        for i, raw in enumerate(raws):
+            if raw and _PLAIN_STATUS.fullmatch(raw):
+                parsed[i] = binascii.unhexlify(raw.replace(b"\n", b""))
+        return parsed
+
+    by_length: dict[int, list[int]] = {}
+    for i, raw in enumerate(raws):
+        if raw and len(raw) % 3 == 0:
+            by_length.setdefault(len(raw), []).append(i)
+
+    for length, rows in by_length.items():
+        chars = np.frombuffer(b"".join(raws[i] for i in rows), dtype=np.uint8)
+        chars = chars.reshape(len(rows), length)
+        high = _NIBBLES[chars[:, 0::3]]
+        low = _NIBBLES[chars[:, 1::3]]
+        valid = ((high | low) < 16).all(axis=1) & (chars[:, 2::3] == 0x0A).all(axis=1)
+
+        width = length // 3
+        values = ((high << 4) | low).tobytes()
+        for row in np.flatnonzero(valid).tolist():
+            parsed[rows[row]] = values[row * width:(row + 1) * width]
+
+    return parsed
+
+
+def decode_batch(
+    device_type: str, inels_type: str, payloads: Sequence[Payload]
+) -> "list[DeviceValue]":
+    """Decode status payloads of many devices of the same type
+
+    Args:
+        device_type (str): device type, e.g. switch
+        inels_type (str): inels type, e.g. SA3-04M
+        payloads (Sequence[Payload]): raw status payloads
+
+    Returns:
+        list[DeviceValue]: values in the order of the payloads
+    """
+    return [
+        DeviceValue(device_type, inels_type, inels_value=payload, status_ints=ints)
+        for payload, ints in zip(payloads, parse_status_batch(payloads))
+    ]
@@ -0,0 +1,127 @@
+"""Bounded cache of decoded status payloads."""
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from typing import Any, Union
+
+import attr
+
+from .util import DeviceValue, HaValue
+
+Payload = Union[str, bytes]
+
+
+@attr.s(slots=True, frozen=True)
+class DecodeCacheStats:
+    """Class with snapshot of decode cache metrics."""
+
+    entries: int = attr.ib()
+    hits: int = attr.ib()
+    misses: int = attr.ib()
+    evictions: int = attr.ib()
+
+
+class DecodeCache:
+    """Share decoded values between devices with the same payload.
+
+    Many devices of one type usually report the very same payload, e.g.
+    every switched off relay. The payload is decoded once and the value
+    is handed to all of them, so its ha value is frozen first; changing
+    it raises and callers work on a deepcopy instead. Decoders which
+    read the last value of the device are never cached.
+    """
+
+    def __init__(self, capacity: int) -> None:
+        """Create cache
+
+        Args:
+            capacity (int): maximal number of decoded values, 0 disables
+            the cache
+        """
+        self.__capacity = capacity
+        # (device type, inels type, payload) -> value, least recently used first
+        self.__entries: OrderedDict[tuple[str, str, Payload], DeviceValue] = OrderedDict()
+        self.__lock = threading.Lock()
+        self.__hits = 0
+        self.__misses = 0
+        self.__evictions = 0
+
+    @property
+    def capacity(self) -> int:
+        """Maximal number of decoded values, 0 when disabled."""
+        return self.__capacity
+
+    @property
+    def stats(self) -> DecodeCacheStats:
+        """Current metrics of the cache
+
+        Returns:
+            DecodeCacheStats: cached values, lookups answered from the
+            cache and decoded anew, values dropped for capacity
+        """
+        with self.__lock:
+            return DecodeCacheStats(
+                entries=len(self.__entries),
+                hits=self.__hits,
+                misses=self.__misses,
+                evictions=self.__evictions,
+            )
+
+    def clear(self) -> None:
+        """Drop every cached value, metrics are kept."""
+        with self.__lock:
+            self.__entries.clear()
+
+    def decode(
+        self,
+        device_type: str,
+        inels_type: str,
+        payload: Any,
+        last_value: Any = None,
+    ) -> DeviceValue:
+        """Decode status payload, reusing value of an earlier equal payload
+
+        Args:
+            device_type (str): device type, e.g. switch
+            inels_type (str): inels type, e.g. SA3-04M
+            payload (Any): raw status payload
+            last_value (Any): last value of the device, passed on to
+            decoders which depend on it
+
+        Returns:
+            DeviceValue: decoded value, shared with other devices unless
+            the cache is disabled or the decoder depends on the last value
+        """
+        if (
+            self.__capacity <= 0
+            or not isinstance(payload, (str, bytes))
+            or DeviceValue.depends_on_last_value(device_type, inels_type)
+        ):
+            return DeviceValue(
+                device_type, inels_type, inels_value=payload, last_value=last_value
+            )
+
+        key = (device_type, inels_type, payload)
+        with self.__lock:
+            value = self.__entries.get(key)
+            if value is not None:
+                self.__entries.move_to_end(key)
+                self.__hits += 1
+                return value
+            self.__misses += 1
+
+        # decoded outside of the lock, two threads may both decode
+        # a new payload and the later one wins
+        value = DeviceValue(device_type, inels_type, inels_value=payload)
+        if isinstance(value.ha_value, HaValue):
+            value.ha_value.freeze()
+
+        with self.__lock:
+            self.__entries[key] = value
+            self.__entries.move_to_end(key)
+            while len(self.__entries) > self.__capacity:
+                self.__entries.popitem(last=False)
+                self.__evictions += 1
+
+        return value
@@ -4,6 +4,23 @@ from typing import Final
 from enum import IntEnum
 
 DISCOVERY_TIMEOUT_IN_SEC = 5
+# discovery stops when no new topic arrived for this time
+DISCOVERY_IDLE_IN_SEC = 0.5
+# capacity of each listener dispatch worker queue
+DISPATCH_QUEUE_SIZE = 1000
+# paho doubles the delay after every failed reconnect up to the max
+RECONNECT_MIN_DELAY_IN_SEC = 1
+RECONNECT_MAX_DELAY_IN_SEC = 120
+# set commands kept while the broker connection is down
+OFFLINE_QUEUE_SIZE = 100
+# minimal time between two commands to one set topic, 0 sends every command
+SET_INTERVAL_IN_SEC = 0
+# received topics kept in memory, 0 is unlimited
+STORE_CAPACITY = 0
+# topics quiet for longer are forgotten, 0 keeps them forever
+STORE_TTL_IN_SEC = 0
+# decoded values shared by devices with the same payload, 0 disables the cache
+DECODE_CACHE_SIZE = 0
 
 NAME = "inels-mqtt"
 
@@ -783,6 +800,17 @@ DEVICE_TYPE_166_DATA = {
     VIRT_CONTR: [30],
 }
 
+# set payload, temperatures are little endian
+DEVICE_TYPE_166_SET_DATA = {
+    CURRENT_TEMP: [0, 1, 2, 3],
+    CRITICAL_MAX_TEMP: [4, 5, 6, 7],
+    REQUIRED_HEAT_TEMP: [8, 9, 10, 11],
+    REQUIRED_COOL_TEMP: [12, 13, 14, 15],
+    PUBLIC_HOLIDAY: [16],
+    CONTROL_MODE: [17],
+    VIRT_CONTR: [18],
+}
+
 VIRT_REG_DATA = {
     STATE: [0],
     VIRT_HEAT_REG: [1],
@@ -1051,6 +1079,11 @@ BUS_SENSOR_ERRORS = {
 
 # MQTT/INELS CONSTANTS
 
+class Connection_state(IntEnum):
+    Disconnected = 0
+    Connecting = 1
+    Connected = 2
+
 MQTT_TRANSPORTS = {"tcp", "websockets"}
 
 MQTT_TIMEOUT: Final = "timeout"
@@ -1061,6 +1094,14 @@ MQTT_PORT: Final = "port"
 MQTT_CLIENT_ID: Final = "client_id"
 MQTT_PROTOCOL: Final = "protocol"
 MQTT_TRANSPORT: Final = "transport"
+MQTT_DISCOVERY_IDLE: Final = "discovery_idle"
+MQTT_DISPATCH_WORKERS: Final = "dispatch_workers"
+MQTT_DISPATCH_QUEUE_SIZE: Final = "dispatch_queue_size"
+MQTT_OFFLINE_QUEUE_SIZE: Final = "offline_queue_size"
+MQTT_SET_INTERVAL: Final = "set_interval"
+MQTT_STORE_CAPACITY: Final = "store_capacity"
+MQTT_STORE_TTL: Final = "store_ttl"
+MQTT_DECODE_CACHE_SIZE: Final = "decode_cache_size"
 PROTO_31 = "3.1"
 PROTO_311 = "3.1.1"
 PROTO_5 = 5
@@ -3,9 +3,9 @@ from collections import defaultdict
 import logging
 import json
 
-from typing import Any, Callable
+from typing import Any, Callable, Optional
 
-from inelsmqtt.util import DeviceValue
+from inelsmqtt.util import DeviceValue, HaValue
 from inelsmqtt import InelsMqtt
 from inelsmqtt.const import (
     DEVICE_TYPE_DICT,
@@ -38,6 +38,7 @@ class Device(object):
         mqtt: InelsMqtt,
         state_topic: str,
         title: str = None,
+        subscribe: bool = True,
     ) -> None:
         """Initialize instance of device
 
@@ -47,6 +48,9 @@ class Device(object):
             set_topic (str): Sring format of set topic
             title (str, optional): Formal name of the device. When None
             then will be same as unique_id. Defaults to None.
+            subscribe (bool, optional): Subscribe state and connected topic
+            right away. When False the caller subscribes them, e.g. for a
+            whole batch of devices at once. Defaults to True.
         """
         fragments = state_topic.split("/")
 
@@ -73,11 +77,17 @@ class Device(object):
         self.__domain = fragments[TOPIC_FRAGMENTS[FRAGMENT_DOMAIN]]
         self.__state: Any = None
         self.__values: DeviceValue = None
+        self.__values_payload: Any = None
+        self.__last_values: DeviceValue = None
+        self.__last_values_payload: Any = None
+        # payload and value the entity callbacks were last run for
+        self.__notified: Optional[tuple[Any, DeviceValue]] = None
     
         self.__entity_callbacks: dict[tuple[str, int], Callable[[Any], Any]] = None
         # subscribe availability
-        self.__mqtt.subscribe(self.__state_topic)
-        self.__mqtt.subscribe(self.__connected_topic, 0, None, None)
+        if subscribe:
+            self.__mqtt.subscribe(self.__state_topic)
+            self.__mqtt.subscribe(self.__connected_topic, 0, None, None)
 
     @property
     def unique_id(self) -> str:
@@ -173,6 +183,15 @@ class Device(object):
         """
         return self.__state_topic
 
+    @property
+    def connected_topic(self) -> str:
+        """Connected topic
+
+        Returns:
+            str: string of the availability topic
+        """
+        return self.__connected_topic
+
     @property
     def domain(self) -> str:
         """Domain name of the topic
@@ -200,38 +219,63 @@ class Device(object):
     def last_values(self) -> DeviceValue:
         """Get last value of the device
 
+        The previous payload is decoded at most once, usually not at all
+        as the current value is rotated into the last one on update.
+
         Returns:
             DeviceValue: latest values in many formats
         """
         val = self.__mqtt.last_value(self.__state_topic)
-        
-        dev_value = DeviceValue(
-            self.__device_type,
-            self.__inels_type,
-            inels_value=(val.decode() if val is not None else None),
-        )
-        return dev_value
+
+        if self.__last_values is None or val != self.__last_values_payload:
+            if val is not None and val == self.__values_payload:
+                self.__last_values = self.__values
+            else:
+                self.__last_values = self.__mqtt.decode_cache.decode(
+                    self.__device_type,
+                    self.__inels_type,
+                    val,
+                )
+            self.__last_values_payload = val
+
+        return self.__last_values
 
     @property
     def mqtt(self) -> InelsMqtt:
         """Instnace of broker."""
         return self.__mqtt
 
+    def preload_value(self, val: Any, dev_value: DeviceValue) -> None:
+        """Use value decoded together with other devices for the payload
+
+        Args:
+            val (Any): raw status payload
+            dev_value (DeviceValue): value decoded from the payload
+        """
+        self.__state = dev_value.ha_value
+        self.__values = dev_value
+        self.__values_payload = val
+
     def update_value(self, new_value: Any) -> DeviceValue:
         """Update value after broker change it."""
         return self.__get_value(new_value)
 
     def __get_value(self, val: Any) -> DeviceValue:
         """Get value and transform into the DeviceValue."""
+        last_values = self.last_values
+
+        if val is not None and val == self.__values_payload:
+            return self.__values
 
-        dev_value = DeviceValue(
+        dev_value = self.__mqtt.decode_cache.decode(
             self.__device_type,
             self.__inels_type,
-            inels_value=(val.decode() if val is not None else None),
-            last_value=self.last_values
+            val,
+            last_value=last_values,
         )
         self.__state = dev_value.ha_value
         self.__values = dev_value
+        self.__values_payload = val
 
         return dev_value
 
@@ -263,6 +307,7 @@ class Device(object):
 
         self.__state = dev.ha_value
         self.__values = dev
+        self.__values_payload = None
 
         ret = False
         if self.__set_topic is not None:
@@ -299,33 +344,41 @@ class Device(object):
         self.__entity_callbacks[t] = fnc
 
     def ha_diff(self, last_val, curr_val):
-        for k in (key for key in dir(curr_val) if not key.startswith('_')):
-            if type(curr_val.__dict__[k]) is list:
-                for i in range(len(curr_val.__dict__[k])):
-                    if curr_val.__dict__[k][i] != last_val.__dict__[k][i]:
-                        t: tuple[str, int] = (k, i)
-                        if t in self.__entity_callbacks:
-                            self.__entity_callbacks[t]()
-            else:
-                if curr_val.__dict__[k] != last_val.__dict__[k]:
-                    t: tuple[str, int] = (k, -1)
-                    if t in self.__entity_callbacks:
-                        self.__entity_callbacks[t]()
+        if not isinstance(curr_val, HaValue) or not self.__entity_callbacks:
+            return
+
+        for t in curr_val.diff(last_val):
+            fnc = self.__entity_callbacks.get(t)
+            if fnc is not None:
+                fnc()
 
     def complete_callback(self) -> None:
         for v in self.__entity_callbacks.values():
             v()
 
     def callback(self, availability_update: bool) -> None:
-        """Update value in device and call the callbacks of the respective entities."""
-        self.get_value()
+        """Update value in device and call the callbacks of the respective entities.
+
+        The change is found against the value of the previous callback,
+        not the last value of the client, so a callback which runs late
+        on a dispatch worker neither misses nor repeats a change.
+        """
+        val = self.__mqtt.messages().get(self.__state_topic)
+        if self.__notified is None:
+            last_payload = self.__mqtt.last_value(self.__state_topic)
+            last_values = self.last_values
+        else:
+            last_payload, last_values = self.__notified
+
+        values = self.__get_value(val)
+        self.__notified = (val, values)
 
         if availability_update: #recalculate state for all the entities as they became unavailable/available
             self.complete_callback()
-        else:
+        elif last_payload != val:
             self.ha_diff( #differential availability 
-                last_val=self.last_values.ha_value,
-                curr_val=self.__values.ha_value,
+                last_val=last_values.ha_value,
+                curr_val=values.ha_value,
             )   
 
 
@@ -3,6 +3,7 @@ import logging
 from inelsmqtt.const import INELS_ASSUMED_STATE_DEVICES, INELS_COMM_TEST_DICT, INELS_DEVICE_TYPE_DICT
 
 from inelsmqtt import InelsMqtt
+from inelsmqtt.batch import decode_batch
 from inelsmqtt.devices import Device
 
 
@@ -45,7 +46,39 @@ class InelsDiscovery(object):
         """
         devs = self.__mqtt.discovery_all()
 
-        retry = False
+        tested = self.__send_comm_tests(devs)
+        if tested:
+            _LOGGER.info("Retrying discovery...")
+            devs = self.__mqtt.discovery_all(tested)
+
+        return self.__create_devices(devs)
+
+    async def async_discovery(self) -> list[Device]:
+        """Discover and create device list with AsyncInelsMqtt
+
+        Returns:
+            list[Device]: List of Device object
+        """
+        devs = await self.__mqtt.async_discovery_all()
+
+        tested = self.__send_comm_tests(devs)
+        if tested:
+            _LOGGER.info("Retrying discovery...")
+            devs = await self.__mqtt.async_discovery_all(tested)
+
+        return self.__create_devices(devs)
+
+    def __send_comm_tests(self, devs: dict[str, str]) -> list[str]:
+        """Ask devices known only from 'connected' for their status
+
+        Args:
+            devs (dict[str, str]): discovered topics with their payloads
+
+        Returns:
+            list[str]: topics of the devices asked, discovery should
+            retry and wait for them when not empty
+        """
+        tested: list[str] = []
         for d in devs:
             if devs[d] is None: #if comes from 'connected'
                 d_frags = d.split("/")
@@ -56,12 +89,19 @@ class InelsDiscovery(object):
                 if dev_type in INELS_COMM_TEST_DICT:
                     self.__mqtt.publish("inels/set/" + d, INELS_COMM_TEST_DICT[dev_type])
                     _LOGGER.info("Sending comm test to device of type %s, unique_id %s", dev_type, unique_id)
-                    retry = True
+                    tested.append(d)
 
-        if retry:
-            _LOGGER.info("Retrying discovery...")
-            devs = self.__mqtt.discovery_all()
+        return tested
+
+    def __create_devices(self, devs: dict[str, str]) -> list[Device]:
+        """Create devices from discovered topics and subscribe them
 
+        Args:
+            devs (dict[str, str]): discovered topics with their payloads
+
+        Returns:
+            list[Device]: List of Device object
+        """
         #disregard any devices that don't respond
         sanitized_devs = []
         for k, v in devs.items():
@@ -71,7 +111,17 @@ class InelsDiscovery(object):
                 sanitized_devs.append(k)
         devs = sanitized_devs
 
-        self.__devices = [Device(self.__mqtt, "inels/status/" + item) for item in devs]
+        # payloads are already collected by discovery, so build devices
+        # without waiting and subscribe the whole batch at once
+        self.__devices = [
+            Device(self.__mqtt, "inels/status/" + item, subscribe=False) for item in devs
+        ]
+        self.__mqtt.subscribe_many(
+            topic
+            for device in self.__devices
+            for topic in (device.state_topic, device.connected_topic)
+        )
+        self.__decode_devices()
         # for item in self.__devices:
         #     if item.parent_id not in self.__coordinators:
         #         self.__coordinators.append(item.parent_id)
@@ -82,3 +132,17 @@ class InelsDiscovery(object):
         _LOGGER.info("Discovered %s devices", len(self.__devices))
 
         return self.__devices
+
+    def __decode_devices(self) -> None:
+        """Decode retained payloads of all devices, type by type."""
+        groups: dict[tuple[str, str], list[Device]] = {}
+        for device in self.__devices:
+            groups.setdefault((device.device_type, device.inels_type), []).append(device)
+
+        messages = self.__mqtt.messages()
+        for (device_type, inels_type), devices in groups.items():
+            payloads = [messages.get(device.state_topic) for device in devices]
+            values = decode_batch(device_type, inels_type, payloads)
+            for device, payload, value in zip(devices, payloads, values):
+                if payload is not None:
+                    device.preload_value(payload, value)
@@ -0,0 +1,146 @@
+"""Listener dispatch off the mqtt network thread."""
+from __future__ import annotations
+
+import logging
+import queue
+import threading
+import time
+from typing import Any, Callable
+
+import attr
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@attr.s(slots=True, frozen=True)
+class DispatchStats:
+    """Class with snapshot of dispatcher metrics."""
+
+    queue_depth: int = attr.ib()
+    max_queue_depth: int = attr.ib()
+    dispatched: int = attr.ib()
+    completed: int = attr.ib()
+    mean_latency: float = attr.ib()
+    max_latency: float = attr.ib()
+
+
+class ListenerDispatcher:
+    """Run listener callbacks on worker threads.
+
+    Every key (stripped topic) is always handled by the same worker, so
+    callbacks of one device run in the order their messages arrived.
+    Queues are bounded, a full queue blocks the producer.
+    """
+
+    def __init__(self, workers: int, queue_size: int) -> None:
+        """Create dispatcher, workers are started on the first dispatch
+
+        Args:
+            workers (int): number of worker threads
+            queue_size (int): capacity of the queue of each worker
+        """
+        self.__queues: list[queue.Queue] = [
+            queue.Queue(maxsize=queue_size) for _ in range(workers)
+        ]
+        self.__threads: list[threading.Thread] = []
+        self.__lock = threading.Lock()
+        self.__dispatched = 0
+        self.__completed = 0
+        self.__max_queue_depth = 0
+        self.__latency_total = 0.0
+        self.__max_latency = 0.0
+
+    @property
+    def stats(self) -> DispatchStats:
+        """Current metrics of the dispatcher
+
+        Returns:
+            DispatchStats: queue depths, counters and latencies in seconds
+            between queuing a callback and starting it
+        """
+        with self.__lock:
+            return DispatchStats(
+                queue_depth=sum(q.qsize() for q in self.__queues),
+                max_queue_depth=self.__max_queue_depth,
+                dispatched=self.__dispatched,
+                completed=self.__completed,
+                mean_latency=(
+                    self.__latency_total / self.__completed if self.__completed else 0.0
+                ),
+                max_latency=self.__max_latency,
+            )
+
+    def dispatch(self, key: str, fnc: Callable[..., Any], *args: Any) -> None:
+        """Queue callback on the worker owning the key
+
+        Args:
+            key (str): ordering key, usually stripped topic of the device
+            fnc (Callable[..., Any]): listener callback
+            args (Any): arguments of the callback
+        """
+        if not self.__threads:
+            self.__start()
+
+        worker_queue = self.__queues[hash(key) % len(self.__queues)]
+        worker_queue.put((time.monotonic(), fnc, args))
+
+        depth = worker_queue.qsize()
+        with self.__lock:
+            self.__dispatched += 1
+            if depth > self.__max_queue_depth:
+                self.__max_queue_depth = depth
+
+    def join(self) -> None:
+        """Wait until every queued callback has been run."""
+        for worker_queue in self.__queues:
+            worker_queue.join()
+
+    def stop(self) -> None:
+        """Run the queued callbacks and stop the workers. The next
+        dispatch starts them again.
+        """
+        with self.__lock:
+            threads, self.__threads = self.__threads, []
+        if not threads:
+            return
+
+        for worker_queue in self.__queues:
+            worker_queue.put(None)
+        # a listener may disconnect the client from its own worker
+        current = threading.current_thread()
+        for thread in threads:
+            if thread is not current:
+                thread.join()
+
+    def __start(self) -> None:
+        """Start one worker thread per queue."""
+        with self.__lock:
+            if self.__threads:
+                return
+            for i, worker_queue in enumerate(self.__queues):
+                thread = threading.Thread(
+                    target=self.__run,
+                    args=(worker_queue,),
+                    name=f"inels-dispatch-{i}",
+                    daemon=True,
+                )
+                thread.start()
+                self.__threads.append(thread)
+
+    def __run(self, worker_queue: queue.Queue) -> None:
+        """Worker loop, runs callbacks until it gets None."""
+        while (item := worker_queue.get()) is not None:
+            queued_at, fnc, args = item
+            latency = time.monotonic() - queued_at
+            try:
+                fnc(*args)
+            except Exception:  # pylint: disable=broad-except
+                _LOGGER.exception("Listener callback failed")
+            finally:
+                with self.__lock:
+                    self.__completed += 1
+                    self.__latency_total += latency
+                    if latency > self.__max_latency:
+                        self.__max_latency = latency
+                worker_queue.task_done()
+        worker_queue.task_done()
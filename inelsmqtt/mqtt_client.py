@@ -1,13 +1,30 @@
 """Inels MQTT client."""
 from __future__ import annotations
 
+import heapq
+import itertools
 import logging
+import sys
 from typing import Union, Callable, Awaitable
 import asyncio
 import attr
 
+from .const import (
+    FRAGMENT_DEVICE_TYPE,
+    FRAGMENT_DOMAIN,
+    FRAGMENT_SERIAL_NUMBER,
+    FRAGMENT_STATE,
+    FRAGMENT_UNIQUE_ID,
+    TOPIC_FRAGMENTS,
+)
+
 _LOGGER = logging.getLogger(__name__)
 
+# delay of publish_with_delay, repeating the message restarts it
+PUBLISH_DELAY_IN_SEC = 1
+# messages due this close to each other are published together
+FLUSH_WINDOW_IN_SEC = 0.05
+
 SendMessageType = Union[str, bytes, int, float, None]
 GetMessageType = Union[str, bytes]
 
@@ -32,23 +49,132 @@ class GetMessage:
     qos: int | None = attr.ib()
 
 
-class InelsTimer:
-    """Timing messages."""
+@attr.s(slots=True, frozen=True)
+class OfflineQueueStats:
+    """Class with snapshot of offline queue counters."""
 
-    def __init__(self, tout: float, callback: Callable[[], None]) -> None:
-        """Initializing timer."""
-        self._tout = tout
-        self._callback = callback
-        self._t = asyncio.ensure_future(self._task())
+    depth: int = attr.ib()
+    coalesced: int = attr.ib()
+    dropped: int = attr.ib()
+    replayed: int = attr.ib()
 
-    async def _task(self) -> None:
-        """Call callback fnc as a task."""
-        await asyncio.sleep(self._tout)
-        await self._callback()
 
-    def stop(self) -> None:
-        """Stop the timer."""
-        self._t.cancel()
+@attr.s(slots=True, frozen=True)
+class ParsedTopic:
+    """Class with fragments of a topic, parsed once per topic."""
+
+    topic: str = attr.ib()
+    domain: str = attr.ib()
+    action: str | None = attr.ib()
+    serial: str | None = attr.ib()
+    device_type: str | None = attr.ib()
+    unique_id: str | None = attr.ib()
+    stripped: str = attr.ib()
+
+    @classmethod
+    def parse(cls, topic: str) -> ParsedTopic:
+        """Split topic into its fragments
+
+        Args:
+            topic (str): full topic, e.g. inels/status/<serial>/<type>/<id>
+
+        Returns:
+            ParsedTopic: interned fragments, None for the missing ones
+        """
+        parts = [sys.intern(part) for part in topic.split("/")]
+
+        def fragment(name: str) -> str | None:
+            index = TOPIC_FRAGMENTS[name]
+            return parts[index] if index < len(parts) else None
+
+        return cls(
+            topic=sys.intern(topic),
+            domain=fragment(FRAGMENT_DOMAIN),
+            action=fragment(FRAGMENT_STATE),
+            serial=fragment(FRAGMENT_SERIAL_NUMBER),
+            device_type=fragment(FRAGMENT_DEVICE_TYPE),
+            unique_id=fragment(FRAGMENT_UNIQUE_ID),
+            stripped=sys.intern("/".join(parts[2:])),
+        )
+
+
+class PublishScheduler:
+    """Delayed publishes handled by a single task.
+
+    Deadlines live in a heap, rescheduling pushes a new entry and the old
+    one is skipped when it surfaces. The task sleeps until the earliest
+    deadline and publishes everything due within FLUSH_WINDOW_IN_SEC.
+    """
+
+    def __init__(self, publish: Callable[[SendMessage], Awaitable[None]]) -> None:
+        """Initialize scheduler, the task starts with the first message."""
+        self._publish = publish
+        self._heap: list[tuple[float, int, SendMessage]] = []
+        self._pending: dict[SendMessage, tuple[float, int, SendMessage]] = {}
+        self._seq = itertools.count()
+        self._wakeup: asyncio.Event | None = None
+        self._task: asyncio.Task | None = None
+
+    def __len__(self) -> int:
+        """Number of messages waiting."""
+        return len(self._pending)
+
+    def schedule(self, msg: SendMessage, delay: float) -> None:
+        """Publish msg after delay, replaces earlier deadline of msg."""
+        entry = (asyncio.get_running_loop().time() + delay, next(self._seq), msg)
+        self._pending[msg] = entry
+        heapq.heappush(self._heap, entry)
+
+        # stale entries are dropped lazily, rebuild when they dominate
+        if len(self._heap) > 2 * len(self._pending) + 64:
+            self._heap = list(self._pending.values())
+            heapq.heapify(self._heap)
+
+        if self._task is None or self._task.done():
+            # created on the running loop, python 3.9 binds it on creation
+            self._wakeup = asyncio.Event()
+            self._task = asyncio.ensure_future(self._run())
+        elif self._heap[0] is entry:
+            self._wakeup.set()
+
+    def cancel(self) -> None:
+        """Drop all waiting messages and stop the task."""
+        self._pending.clear()
+        self._heap.clear()
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    async def _run(self) -> None:
+        """Publish due messages until nothing is waiting."""
+        loop = asyncio.get_running_loop()
+        while self._pending:
+            while self._pending.get(self._heap[0][2]) is not self._heap[0]:
+                heapq.heappop(self._heap)
+
+            delay = self._heap[0][0] - loop.time()
+            if delay > 0:
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), delay)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            due: list[SendMessage] = []
+            limit = loop.time() + FLUSH_WINDOW_IN_SEC
+            while self._heap and self._heap[0][0] <= limit:
+                entry = heapq.heappop(self._heap)
+                if self._pending.get(entry[2]) is entry:
+                    del self._pending[entry[2]]
+                    due.append(entry[2])
+
+            results = await asyncio.gather(
+                *(self._publish(msg) for msg in due), return_exceptions=True
+            )
+            for msg, result in zip(due, results):
+                if isinstance(result, Exception):
+                    _LOGGER.error("Delayed publish to %s failed: %s", msg.topic, result)
 
 
 class InelsMqttClient:
@@ -64,7 +190,9 @@ class InelsMqttClient:
         self._pub = pub
         self._sub = sub
         self._un_sub = un_sub
-        self._pending_msg: dict[SendMessage, InelsTimer] = {}
+        self._scheduler = PublishScheduler(
+            lambda msg: self.publish(msg.payload, msg.topic, msg.retain, msg.qos)
+        )
         _LOGGER.debug("Initialize MQTT client.")
 
     async def subscribe(self, state: dict | None, topics: dict) -> dict:
@@ -93,16 +221,6 @@ class InelsMqttClient:
         qos: int | None = 0,
     ) -> None:
         """Publish with little delay."""
-        msg = SendMessage(payload, topic, retain, qos)
-
-        async def callback() -> None:
-            """Callback which is calling publish fnc."""
-            self._pending_msg.pop(msg)
-            await self.publish(msg.payload, msg.topic, msg.retain, msg.qos)
-
-        if msg in self._pending_msg:
-            _t = self._pending_msg.pop(msg)
-            _t.stop()
-
-        _t = InelsTimer(1, callback)
-        self._pending_msg[msg] = _t
+        self._scheduler.schedule(
+            SendMessage(payload, topic, retain, qos), PUBLISH_DELAY_IN_SEC
+        )
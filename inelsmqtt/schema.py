@@ -0,0 +1,290 @@
+"""Declarative layouts of status and set payloads."""
+from __future__ import annotations
+
+from enum import IntEnum
+from typing import Any, Callable, Optional, Sequence
+
+import attr
+
+
+class Field_kind(IntEnum):
+    """How the bytes of a field are read."""
+
+    Uint = 0  # unsigned integer of all the bytes
+    Flags = 1  # list of bools, one per byte, whether byte & mask is set
+    Bits = 2  # list of bools, bit 0 to 7 of every byte
+    Hex = 3  # the bytes joined as hex string
+
+
+_HEX_BYTES = tuple(f"{i:02X}" for i in range(256))
+
+# value of a byte -> its bits, bit 0 first
+BYTE_BITS = tuple(tuple(i >> bit & 1 == 1 for bit in range(8)) for i in range(256))
+
+
+def unpack_bits(*masks: int) -> "tuple[bool, ...]":
+    """Unpack byte masks into bools
+
+    Args:
+        masks (int): values of bytes, 0 to 255
+
+    Returns:
+        tuple[bool, ...]: bit 0 to 7 of every mask in turn
+    """
+    if len(masks) == 1:
+        return BYTE_BITS[masks[0]]
+    return sum((BYTE_BITS[m] for m in masks), ())
+
+
+@attr.s(slots=True, frozen=True)
+class Field:
+    """Class with description of one payload field.
+
+    The bytes of the field are taken from the data dict of the device,
+    e.g. SA3_022M_DATA, most significant first as they are listed there.
+    """
+
+    kind: Field_kind = attr.ib(default=Field_kind.Uint)
+    little_endian: bool = attr.ib(default=False)
+    scale: Optional[int] = attr.ib(default=None)
+    mask: Optional[int] = attr.ib(default=None)
+    # raw value -> decoded value, applied before scale
+    sentinels: "dict[int, Any]" = attr.ib(factory=dict, hash=False)
+
+
+class Layout:
+    """Payload layout compiled into decode and encode functions.
+
+    Every function is generated once from the fields, so reading a
+    field is plain indexing into the status without any per field
+    lookups or string formatting.
+    """
+
+    def __init__(
+        self, data: "dict[str, Sequence[int]]", fields: "dict[str, Field]"
+    ) -> None:
+        """Compile layout
+
+        Args:
+            data (dict[str, Sequence[int]]): field -> payload byte indices
+            fields (dict[str, Field]): field -> how to read it
+        """
+        self.__fields = {
+            name: (
+                tuple(reversed(data[name])) if field.little_endian else tuple(data[name]),
+                field,
+            )
+            for name, field in fields.items()
+        }
+        self.__size = 1 + max(max(cols) for cols, _ in self.__fields.values())
+        self.__consts: "dict[str, Any]" = {"_HEX": _HEX_BYTES, "_BITS": BYTE_BITS}
+
+        self.__decode = self.__compile("decode", "b", self.__decode_source(False))
+        self.__decode_tokens = self.__compile(
+            "decode_tokens", "t", self.__decode_source(True)
+        )
+        self.__encode = self.__compile("encode", "v", self.__encode_source())
+
+    @property
+    def size(self) -> int:
+        """Number of payload bytes covered by the layout."""
+        return self.__size
+
+    def decode(self, ints: bytes) -> "dict[str, Any]":
+        """Read fields from values of the status bytes
+
+        Args:
+            ints (bytes): value of every status byte
+
+        Returns:
+            dict[str, Any]: field -> decoded value
+        """
+        return self.__decode(ints)
+
+    def decode_tokens(self, tokens: "Sequence[str]") -> "dict[str, Any]":
+        """Read fields from hex strings of the status bytes
+
+        Used for payloads which are not made of plain uppercase
+        "XX\\n" bytes, the fields are read exactly as the strings say.
+
+        Args:
+            tokens (Sequence[str]): hex string of every status byte
+
+        Returns:
+            dict[str, Any]: field -> decoded value
+        """
+        return self.__decode_tokens(tokens)
+
+    def encode(self, values: "dict[str, Any]") -> str:
+        """Write fields into payload
+
+        Bytes not covered by any field are 00, integers are written in
+        two's complement of the width of the field.
+
+        Args:
+            values (dict[str, Any]): field -> value, as returned by decode
+
+        Returns:
+            str: payload of "XX\\n" bytes
+        """
+        return self.__encode(values)
+
+    def __const(self, value: Any) -> str:
+        """Name under which the value is visible to generated code."""
+        name = f"_c{len(self.__consts)}"
+        self.__consts[name] = value
+        return name
+
+    def __compile(self, name: str, arg: str, body: "list[str]") -> Callable:
+        """Build function from generated statements."""
+        source = f"def {name}({arg}):\n" + "".join(f"    {line}\n" for line in body)
+        namespace = dict(self.__consts)
+        exec(compile(source, f"<layout {name}>", "exec"), namespace)  # pylint: disable=exec-used
+        return namespace[name]
+
+    def __decode_source(self, tokens: bool) -> "list[str]":
+        """Statements of decode, from ints or from hex tokens."""
+        body = []
+        result = []
+        for i, (name, (cols, field)) in enumerate(self.__fields.items()):
+            if field.kind == Field_kind.Hex:
+                if tokens:
+                    value = " + ".join(f"t[{c}]" for c in cols)
+                else:
+                    value = " + ".join(f"_HEX[b[{c}]]" for c in cols)
+            elif field.kind == Field_kind.Flags:
+                mask = field.mask if field.mask is not None else 0xFF
+                byte = "int(t[{}], 16)" if tokens else "b[{}]"
+                value = "[" + ", ".join(
+                    f"({byte.format(c)} & {mask}) != 0" for c in cols
+                ) + "]"
+            elif field.kind == Field_kind.Bits:
+                width = 8 * len(cols)
+                if tokens:
+                    joined = " + ".join(f"t[{c}]" for c in cols)
+                    body.append(f's{i} = f"{{int({joined}, 16):0>{width}b}}"')
+                    value = "[" + ", ".join(
+                        f's{i}[{8 * k + 7 - bit}] == "1"'
+                        for k in range(len(cols)) for bit in range(8)
+                    ) + "]"
+                else:
+                    value = "[" + ", ".join(f"*_BITS[b[{c}]]" for c in cols) + "]"
+            elif field.kind == Field_kind.Uint:
+                if tokens:
+                    value = "int(" + " + ".join(f"t[{c}]" for c in cols) + ", 16)"
+                else:
+                    last = len(cols) - 1
+                    value = " | ".join(
+                        f"b[{c}] << {8 * (last - k)}" if k < last else f"b[{c}]"
+                        for k, c in enumerate(cols)
+                    )
+                if field.mask is not None:
+                    value = f"({value}) & {field.mask}"
+                if field.sentinels or field.scale is not None:
+                    body.append(f"f{i} = {value}")
+                    value = f"f{i}"
+                    if field.scale is not None:
+                        value = f"f{i} / {field.scale}"
+                    for raw, decoded in field.sentinels.items():
+                        value = f"{self.__const(decoded)} if f{i} == {raw} else {value}"
+            else:
+                raise ValueError(f"Unknown field kind {field.kind}")
+            result.append(f"{name!r}: {value},")
+
+        return body + ["return {"] + [f"    {r}" for r in result] + ["}"]
+
+    def __encode_source(self) -> "list[str]":
+        """Statements of encode."""
+        body = []
+        payload = ['"00"'] * self.__size
+        for i, (name, (cols, field)) in enumerate(self.__fields.items()):
+            body.append(f"e{i} = v[{name!r}]")
+            last = len(cols) - 1
+            if field.kind == Field_kind.Hex:
+                for k, c in enumerate(cols):
+                    payload[c] = f"e{i}[{2 * k}:{2 * k + 2}]"
+            elif field.kind == Field_kind.Flags:
+                mask = field.mask if field.mask is not None else 0xFF
+                for k, c in enumerate(cols):
+                    payload[c] = f'("{mask:02X}" if e{i}[{k}] else "00")'
+            elif field.kind == Field_kind.Bits:
+                for k, c in enumerate(cols):
+                    bits = " | ".join(
+                        f"(e{i}[{8 * k + bit}] and {1 << bit})" for bit in range(8)
+                    )
+                    payload[c] = f"_HEX[{bits}]"
+            else:
+                value = f"e{i}" if field.scale is None else f"int(e{i} * {field.scale})"
+                for raw, decoded in field.sentinels.items():
+                    value = f"{raw} if e{i} == {self.__const(decoded)} else {value}"
+                body.append(f"e{i} = ({value}) & {(1 << 8 * len(cols)) - 1}")
+                for k, c in enumerate(cols):
+                    payload[c] = f"_HEX[e{i} >> {8 * (last - k)} & 255]"
+
+        return body + ['return "\\n".join((' + ", ".join(payload) + ',)) + "\\n"']
+
+
+def compile_layout(
+    data: "dict[str, Sequence[int]]", fields: "dict[str, Field]"
+) -> Layout:
+    """Compile declarative payload layout
+
+    Args:
+        data (dict[str, Sequence[int]]): field -> payload byte indices,
+        e.g. SA3_022M_DATA
+        fields (dict[str, Field]): field -> how to read it
+
+    Returns:
+        Layout: layout with generated decode and encode
+    """
+    return Layout(data, fields)
+
+
+class SetTemplate:
+    """Set payload of fixed length with the static bytes prebuilt.
+
+    Only the variable bytes are patched into a copy of the template,
+    the whole payload is then written out as hex in one go.
+    """
+
+    def __init__(self, size: int, slots: "Sequence[int]") -> None:
+        """Create template
+
+        Args:
+            size (int): number of payload bytes, all 00 until patched
+            slots (Sequence[int]): indices of the variable bytes
+        """
+        self.__template = bytearray(size)
+        self.__slots = tuple(slots)
+
+    @property
+    def slots(self) -> "tuple[int, ...]":
+        """Indices of the variable bytes."""
+        return self.__slots
+
+    def render(self, values: "Sequence[int]") -> str:
+        """Fill template with values
+
+        Args:
+            values (Sequence[int]): value of every slot, in order
+
+        Returns:
+            str: payload of "XX\\n" bytes
+        """
+        if len(values) != len(self.__slots):
+            raise ValueError(
+                f"Expected {len(self.__slots)} set values, got {len(values)}"
+            )
+
+        payload = self.__template.copy()
+        try:
+            for slot, value in zip(self.__slots, values):
+                payload[slot] = value
+        except (TypeError, ValueError):
+            # not a byte, written as it is formatted
+            tokens = [f"{b:02X}" for b in self.__template]
+            for slot, value in zip(self.__slots, values):
+                tokens[slot] = f"{value:02X}"
+            return "\n".join(tokens) + "\n"
+
+        return payload.hex("\n").upper() + "\n"
@@ -0,0 +1,131 @@
+"""Bounded bookkeeping of received topics."""
+from __future__ import annotations
+
+import sys
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Optional
+
+import attr
+
+
+@attr.s(slots=True, frozen=True)
+class StoreStats:
+    """Class with snapshot of topic store metrics."""
+
+    entries: int = attr.ib()
+    bytes: int = attr.ib()
+    evictions: int = attr.ib()
+    expirations: int = attr.ib()
+
+
+class TopicStore:
+    """Track when every topic was last seen and what it holds.
+
+    Topics are kept in the order they were last seen, so the least
+    recently seen is always first. touch returns topics which fell out,
+    either because capacity was exceeded or they were quiet longer than
+    ttl; the owner drops their values. Pinned topics are tracked the
+    same way but never fall out and do not count to the capacity.
+    The store is touched from the network thread and pinned from the
+    caller of subscribe_listener, so it is guarded by a lock.
+    """
+
+    def __init__(self, capacity: int, ttl: float) -> None:
+        """Create store
+
+        Args:
+            capacity (int): maximal number of topics, 0 is unlimited
+            ttl (float): seconds after which a quiet topic is dropped,
+            0 keeps topics forever
+        """
+        self.__capacity = capacity
+        self.__ttl = ttl
+        # topic -> (last seen, bytes), least recently seen first
+        self.__entries: OrderedDict[str, tuple[float, int]] = OrderedDict()
+        # topic -> (last seen, bytes) of topics never dropped
+        self.__pinned: dict[str, tuple[float, int]] = {}
+        self.__bytes = 0
+        self.__evictions = 0
+        self.__expirations = 0
+        self.__lock = threading.Lock()
+
+    @property
+    def stats(self) -> StoreStats:
+        """Current metrics of the store
+
+        Returns:
+            StoreStats: topic count, approximate bytes of topics and
+            payloads, topics dropped for capacity and for ttl
+        """
+        with self.__lock:
+            return StoreStats(
+                entries=len(self.__entries) + len(self.__pinned),
+                bytes=self.__bytes,
+                evictions=self.__evictions,
+                expirations=self.__expirations,
+            )
+
+    def __contains__(self, topic: str) -> bool:
+        """Whether the topic is tracked."""
+        with self.__lock:
+            return topic in self.__entries or topic in self.__pinned
+
+    def last_seen(self, topic: str) -> Optional[float]:
+        """Unix time of the last touch of the topic, None if not tracked."""
+        with self.__lock:
+            entry = self.__entries.get(topic) or self.__pinned.get(topic)
+        return None if entry is None else entry[0]
+
+    def pin(self, topic: str) -> None:
+        """Never drop the topic, until it is touched without pinned."""
+        with self.__lock:
+            entry = self.__entries.pop(topic, None)
+            if entry is not None:
+                self.__pinned[topic] = entry
+
+    def touch(self, topic: str, payload: Any, pinned: bool = False) -> list[str]:
+        """Record message of the topic
+
+        Args:
+            topic (str): full topic
+            payload (Any): payload held for the topic
+            pinned (bool, optional): the topic must never be dropped.
+              Defaults to False.
+
+        Returns:
+            list[str]: topics to forget, never the touched one
+        """
+        now = time.time()
+        size = sys.getsizeof(topic) + sys.getsizeof(payload)
+
+        dropped: list[str] = []
+        with self.__lock:
+            entry = self.__entries.pop(topic, None)
+            if entry is None:
+                entry = self.__pinned.pop(topic, None)
+            if entry is not None:
+                self.__bytes -= entry[1]
+            (self.__pinned if pinned else self.__entries)[topic] = (now, size)
+            self.__bytes += size
+
+            if self.__ttl > 0:
+                while self.__entries and (oldest := next(iter(self.__entries))) != topic and (
+                    self.__entries[oldest][0] < now - self.__ttl
+                ):
+                    self.__expirations += 1
+                    dropped.append(self.__pop(oldest))
+
+            if self.__capacity > 0:
+                while len(self.__entries) > self.__capacity:
+                    self.__evictions += 1
+                    dropped.append(self.__pop(next(iter(self.__entries))))
+
+        return dropped
+
+    def __pop(self, topic: str) -> str:
+        """Stop tracking the dropped topic."""
+        _, size = self.__entries.pop(topic)
+        self.__bytes -= size
+        return topic
@@ -1,14 +1,18 @@
 """Utility classes."""
-from dataclasses import dataclass
+from dataclasses import FrozenInstanceError, dataclass, is_dataclass
+import binascii
 import logging
 import json
 import re
 
+from copy import deepcopy
 from operator import itemgetter
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Union
 
 from inelsmqtt.mqtt_client import GetMessageType
 
+from .schema import Field, Field_kind, Layout, SetTemplate, compile_layout, unpack_bits
+
 from .const import (
     ADC3_60M_DATA,
     ANALOG_REGULATOR_SET_BYTES,
@@ -157,6 +161,7 @@ from .const import (
     DEVICE_TYPE_124_DATA,
     IDRT3_1_DATA,
     DEVICE_TYPE_166_DATA,
+    DEVICE_TYPE_166_SET_DATA,
     VIRT_REG_DATA,
     DA3_66M_DATA,
     SA3_02B_DATA,
@@ -289,6 +294,357 @@ class DALILight(SimpleLight):
     alert_dali_communication: bool
     alert_dali_power: bool
 
+class FrozenList(list):
+    """List inside a frozen ha value, it cannot be changed."""
+    __slots__ = ()
+
+    def __readonly(self, *args: Any, **kwargs: Any) -> None:
+        raise TypeError(f"{type(self).__name__} cannot be changed, copy it first")
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = __readonly
+    append = extend = insert = pop = remove = clear = sort = reverse = __readonly
+
+    def __deepcopy__(self, memo: dict) -> list:
+        return [deepcopy(item, memo) for item in self]
+
+# dataclass -> its read only subclass, and back
+_FROZEN_TWINS: "dict[type, type]" = {}
+_FROZEN_BASES: "dict[type, type]" = {}
+
+def _frozen_setattr(self, name: str, value: Any) -> None:
+    raise FrozenInstanceError(f"cannot assign to field '{name}'")
+
+def _frozen_delattr(self, name: str) -> None:
+    raise FrozenInstanceError(f"cannot delete field '{name}'")
+
+def _frozen_deepcopy(self, memo: dict) -> Any:
+    """Deep copy of frozen item is the mutable dataclass again."""
+    item = object.__new__(_FROZEN_BASES[type(self)])
+    item.__dict__.update(deepcopy(vars(self), memo))
+    return item
+
+def _frozen_eq(self, other: object) -> Any:
+    """Frozen and mutable items of the same dataclass are equal by fields."""
+    base = _FROZEN_BASES[type(self)]
+    if _FROZEN_BASES.get(type(other), type(other)) is not base:
+        return NotImplemented
+    return vars(self) == vars(other)
+
+def _freeze(value: Any) -> Any:
+    """Read only form of a field of ha value, made in place where possible."""
+    if isinstance(value, HaValue):
+        return value.freeze()
+    if type(value) is list:
+        return FrozenList([_freeze(item) for item in value])
+    if is_dataclass(value) and not isinstance(value, type):
+        cls = type(value)
+        if cls not in _FROZEN_BASES:
+            twin = _FROZEN_TWINS.get(cls)
+            if twin is None:
+                twin = type(cls.__name__, (cls,), {
+                    "__qualname__": cls.__qualname__,
+                    "__setattr__": _frozen_setattr,
+                    "__delattr__": _frozen_delattr,
+                    "__eq__": _frozen_eq,
+                    "__deepcopy__": _frozen_deepcopy,
+                    "__hash__": None,
+                })
+                _FROZEN_TWINS[cls] = twin
+                _FROZEN_BASES[twin] = cls
+            object.__setattr__(value, "__class__", twin)
+    return value
+
+#ha values
+class HaValue():
+    """Decoded state of a device, as observed by home assistant.
+
+    Each device family declares its fields in __slots__ once, so decoding
+    a message only creates an instance instead of a new class.
+    """
+    __slots__ = ("__frozen",)
+
+    def __init__(self, **kwargs: Any) -> None:
+        """Set every declared field from the keyword arguments."""
+        if kwargs.keys() != set(self.__slots__):
+            raise TypeError(
+                f"{type(self).__name__} expects fields {self.__slots__}, got {tuple(kwargs)}"
+            )
+        for field, value in kwargs.items():
+            object.__setattr__(self, field, value)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if self.frozen:
+            raise FrozenInstanceError(f"cannot assign to field '{name}'")
+        object.__setattr__(self, name, value)
+
+    @property
+    def frozen(self) -> bool:
+        """Whether the value is shared and cannot be changed."""
+        return getattr(self, "_HaValue__frozen", False)
+
+    def __deepcopy__(self, memo: dict) -> "HaValue":
+        """Deep copy is never frozen, so callers can change it."""
+        value = object.__new__(type(self))
+        for field in self.__slots__:
+            object.__setattr__(value, field, deepcopy(getattr(self, field), memo))
+        return value
+
+    def freeze(self) -> "HaValue":
+        """Make the value and every list and item in it read only
+
+        Returns:
+            HaValue: the value itself
+        """
+        if not self.frozen:
+            for field in self.__slots__:
+                object.__setattr__(self, field, _freeze(getattr(self, field)))
+            object.__setattr__(self, "_HaValue__frozen", True)
+        return self
+
+    def __eq__(self, other: object) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return all(
+            getattr(self, field) == getattr(other, field) for field in self.__slots__
+        )
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{field}={getattr(self, field)!r}" for field in self.__slots__)
+        return f"{type(self).__name__}({fields})"
+
+    def diff(self, other: Any) -> "list[tuple[str, int]]":
+        """Find fields that changed since another value of the same device
+
+        Args:
+            other (Any): previously decoded value
+
+        Returns:
+            list[tuple[str, int]]: (field, index) of each changed list item
+            and (field, -1) of each other changed field
+        """
+        plan = _DIFF_PLANS.get(type(self))
+        if plan is None:
+            plan = tuple(
+                (field, isinstance(getattr(self, field), list)) for field in self.__slots__
+            )
+            _DIFF_PLANS[type(self)] = plan
+
+        if type(other) is not type(self):
+            return [
+                (field, i)
+                for field, is_list in plan
+                for i in (range(len(getattr(self, field))) if is_list else (-1,))
+            ]
+
+        changed = []
+        for field, is_list in plan:
+            curr = getattr(self, field)
+            last = getattr(other, field)
+            if curr == last:
+                continue
+            if is_list and isinstance(curr, list) and isinstance(last, list):
+                for i, item in enumerate(curr):
+                    if i >= len(last) or item != last[i]:
+                        changed.append((field, i))
+            else:
+                changed.append((field, -1))
+        return changed
+
+# ha value type -> ((field, is list), ...), filled on the first diff of each type
+_DIFF_PLANS: "dict[type, tuple[tuple[str, bool], ...]]" = {}
+
+class RelayValue(HaValue):
+    """RF switching units."""
+    __slots__ = ("simple_relay",)
+
+class RelayTempValue(HaValue):
+    """RF switching unit with external temperature sensor."""
+    __slots__ = ("simple_relay", "temp_out")
+
+class RelayTempInValue(HaValue):
+    """SA3-02B relays with internal temperature."""
+    __slots__ = ("simple_relay", "temp_in")
+
+class RelaySwitchValue(HaValue):
+    """SA3-0xM relays with their switch inputs."""
+    __slots__ = ("simple_relay", "sw")
+
+class SA3_01BValue(HaValue):
+    """SA3-01B relay with overflow detection."""
+    __slots__ = ("temp_in", "relay")
+
+class SA3_022MValue(HaValue):
+    """SA3-022M relays, shutter motors and valves."""
+    __slots__ = ("relay", "shutter_motors", "simple_shutters", "valve", "sw")
+
+class IOU3_108MValue(HaValue):
+    """IOU3-108M relays, temperatures and inputs."""
+    __slots__ = ("relay", "temps", "din")
+
+class RC3_610DALIValue(HaValue):
+    """RC3-610DALI relays, outputs and DALI channels."""
+    __slots__ = ("relay", "temps", "din", "aout", "dali")
+
+class FA3_612MValue(HaValue):
+    """FA3-612M fan coil controller."""
+    __slots__ = ("din", "sw", "aout", "valves", "fan_speed", "heating_out", "ains", "last_status_val")
+
+class CardReaderValue(HaValue):
+    """GCR3-11 and GCH3-31 card readers."""
+    __slots__ = ("simple_relay", "interface", "temp_in", "card_present", "card_id")
+
+class BitsValue(HaValue):
+    """Virtual bits."""
+    __slots__ = ("bit",)
+
+class NumberValue(HaValue):
+    """Virtual integers."""
+    __slots__ = ("number",)
+
+class BatteryTempValue(HaValue):
+    """RF temperature input."""
+    __slots__ = ("low_battery", "temp_in", "temp_out")
+
+class BatteryTempInValue(HaValue):
+    """RF thermostat."""
+    __slots__ = ("low_battery", "temp_in")
+
+class FloodDetectorValue(HaValue):
+    """RF flood detector."""
+    __slots__ = ("low_battery", "flooded", "ains")
+
+class DetectorValue(HaValue):
+    """RF detector."""
+    __slots__ = ("low_battery", "detected", "tamper")
+
+class MotionDetectorValue(HaValue):
+    """RF motion detector."""
+    __slots__ = ("low_battery", "motion", "tamper")
+
+class BatteryHumidityValue(HaValue):
+    """RF temperature and humidity sensor."""
+    __slots__ = ("low_battery", "temp_in", "humidity")
+
+class GRT3_50Value(HaValue):
+    """GRT3-50 room thermostat."""
+    __slots__ = ("din", "interface", "temp_in", "light_in", "ain", "humidity", "dewpoint", "backlit")
+
+class WallSwitchValue(HaValue):
+    """WSB3 wall switches."""
+    __slots__ = ("interface", "din", "temp_in", "ain")
+
+class WallSwitchHumidityValue(HaValue):
+    """WSB3 wall switches with humidity sensor."""
+    __slots__ = ("interface", "din", "temp_in", "ain", "humidity", "dewpoint")
+
+class InputTempInValue(HaValue):
+    """IM3-20B and IM3-40B input modules."""
+    __slots__ = ("input", "temp_in")
+
+class InputTempValue(HaValue):
+    """IM3-80B input module."""
+    __slots__ = ("input", "temp")
+
+class InputValue(HaValue):
+    """IM3-140M input module."""
+    __slots__ = ("input",)
+
+class DMD3_1Value(HaValue):
+    """DMD3-1 multisensor."""
+    __slots__ = ("light_in", "temp_in", "humidity", "motion")
+
+class AnalogInputValue(HaValue):
+    """ADC3-60M analog inputs."""
+    __slots__ = ("ains",)
+
+class TempsValue(HaValue):
+    """TI3 temperature inputs."""
+    __slots__ = ("temps",)
+
+class IDRT3_1Value(HaValue):
+    """IDRT3-1 temperature regulator."""
+    __slots__ = ("interface", "din", "temp_in", "temp_out")
+
+class GlassControllerV2Value(HaValue):
+    """GSB3 V2 and MSB3 button arrays."""
+    __slots__ = ("interface", "din", "prox", "temp_in", "light_in", "ain", "humidity", "dewpoint")
+
+class GSB3_90SXValue(HaValue):
+    """GSB3-90SX button array."""
+    __slots__ = ("interface", "din", "prox", "temp_in", "light_in", "ain", "humidity", "dewpoint", "disabled", "backlit")
+
+class GlassControllerValue(HaValue):
+    """GSB3, GBP3, GSP3 and GDB3 glass controllers."""
+    __slots__ = ("interface", "din", "temp_in", "light_in", "ain")
+
+class SimpleLightValue(HaValue):
+    """Dimmers."""
+    __slots__ = ("simple_light",)
+
+class RGBLightValue(HaValue):
+    """RGB dimmer."""
+    __slots__ = ("rgb",)
+
+class WarmLightValue(HaValue):
+    """Light bulbs with color temperature."""
+    __slots__ = ("warm_light",)
+
+class DA3_22MValue(HaValue):
+    """DA3-22M dimmer."""
+    __slots__ = ("sw", "din", "temp_in", "light_coa_toa")
+
+class DAC3_04Value(HaValue):
+    """DAC3-04 analog outputs."""
+    __slots__ = ("temp_out", "aout")
+
+class DCDA_33MValue(HaValue):
+    """DCDA-33M analog outputs."""
+    __slots__ = ("sw", "aout")
+
+class DA3_66MValue(HaValue):
+    """DA3-66M dimmer."""
+    __slots__ = ("sw", "din", "light_coa_toa")
+
+class ShuttersValue(HaValue):
+    """RF shutters."""
+    __slots__ = ("shutters",)
+
+class ShuttersPosValue(HaValue):
+    """RF shutter unit with position."""
+    __slots__ = ("shutters_with_pos",)
+
+class JA3Value(HaValue):
+    """JA3 shutter units."""
+    __slots__ = ("simple_shutters", "interface")
+
+class ThermovalveValue(HaValue):
+    """RF wireless thermovalve."""
+    __slots__ = ("low_battery", "thermovalve")
+
+class ThermovalveStateValue(HaValue):
+    """Thermovalve regulation state."""
+    __slots__ = ("current", "required", "climate_mode", "current_action", "open_in_percentage")
+
+class ClimateControllerValue(HaValue):
+    """Virtual climate controller."""
+    __slots__ = ("climate_controller",)
+
+class ClimateControllerStateValue(HaValue):
+    """Virtual climate controller regulation state."""
+    __slots__ = ("current", "required", "required_cool", "climate_mode", "current_action", "critical_temp", "correction_temp", "public_holiday", "vacation", "control_mode", "current_preset")
+
+class HeatRegulatorValue(HaValue):
+    """Virtual heating regulator."""
+    __slots__ = ("heating_out",)
+
+class CoolRegulatorValue(HaValue):
+    """Virtual cooling regulator."""
+    __slots__ = ("cooling_out",)
+
+class ControllerValue(HaValue):
+    """RF button controllers."""
+    __slots__ = ("low_battery", "btn")
+
 ConfigType = Dict[str, str]
 _LOGGER = logging.getLogger(__name__)
 
@@ -298,6 +654,67 @@ _LOGGER = logging.getLogger(__name__)
 # it is filtered out in set_val
 dummy_val = object()
 
+# tokens of plain uppercase payloads are shared from here, not allocated
+_HEX_BYTES = tuple(f"{i:02X}" for i in range(256))
+_LOWER_HEX = re.compile("[a-f]")
+_LOWER_HEX_BYTES = re.compile(b"[a-f]")
+
+# 0x7FFFFFFB is sent instead of temperatures which are not set
+_NO_TEMP = {0x7FFFFFFB: 0}
+
+SA3_022M_LAYOUT = compile_layout(SA3_022M_DATA, {
+    RELAY: Field(kind=Field_kind.Flags, mask=1),
+    SHUTTER: Field(kind=Field_kind.Flags, mask=1),
+    VALVE: Field(kind=Field_kind.Flags, mask=1),
+    SW: Field(kind=Field_kind.Bits),
+    RELAY_OVERFLOW: Field(kind=Field_kind.Bits),
+})
+
+GSB3_V2_LAYOUT = compile_layout(GSB3_V2_DATA, {
+    SW: Field(kind=Field_kind.Bits),
+    DIN: Field(kind=Field_kind.Bits),
+    TEMP_IN: Field(kind=Field_kind.Hex),
+    LIGHT_IN: Field(kind=Field_kind.Hex),
+    AIN: Field(kind=Field_kind.Hex),
+    HUMIDITY: Field(kind=Field_kind.Hex),
+    DEW_POINT: Field(kind=Field_kind.Hex),
+})
+
+VIRT_CONTR_LAYOUT = compile_layout(DEVICE_TYPE_166_DATA, {
+    CURRENT_TEMP: Field(scale=100, sentinels=_NO_TEMP),
+    CRITICAL_MAX_TEMP: Field(scale=100),
+    REQUIRED_HEAT_TEMP: Field(scale=100, sentinels=_NO_TEMP),
+    CRITICAL_MIN_TEMP: Field(scale=100),
+    REQUIRED_COOL_TEMP: Field(scale=100, sentinels=_NO_TEMP),
+    TEMP_CORRECTION: Field(scale=100),
+    PUBLIC_HOLIDAY: Field(),
+    CONTROL_MODE: Field(kind=Field_kind.Hex),
+    VIRT_CONTR: Field(kind=Field_kind.Bits),
+})
+
+# set payloads, all bytes but the slots are 00
+RELAY_SET_BYTE = {is_on: int(value, 16) for is_on, value in RELAY_SET.items()}
+
+RC3_610DALI_SET = SetTemplate(48, [
+    4, 5, # aout
+    *range(8, 16), # relays
+    *range(20, 24), *range(28, 32), *range(36, 40), *range(44, 48), # dali
+])
+DA3_22M_SET = SetTemplate(6, [4, 5])
+DA3_66M_SET = SetTemplate(26, [4, 5, 6, 7, 12, 13])
+AOUT_4_SET = SetTemplate(8, [4, 5, 6, 7]) # DAC3-04, DCDA-33M, DALI-DMX-Unit(-2)
+CARD_READER_SET = SetTemplate(10, [0])
+
+VIRT_CONTR_SET_LAYOUT = compile_layout(DEVICE_TYPE_166_SET_DATA, {
+    CURRENT_TEMP: Field(scale=100, little_endian=True),
+    CRITICAL_MAX_TEMP: Field(scale=100, little_endian=True),
+    REQUIRED_HEAT_TEMP: Field(scale=100, little_endian=True),
+    REQUIRED_COOL_TEMP: Field(scale=100, little_endian=True),
+    PUBLIC_HOLIDAY: Field(),
+    CONTROL_MODE: Field(),
+    VIRT_CONTR: Field(),
+})
+
 def new_object(**kwargs):
     """Create new anonymous object."""
     return type("Object", (), kwargs)
@@ -337,12 +754,25 @@ class DeviceValue(object):
         self,
         device_type: str,
         inels_type: str,
-        inels_value: str = None,
+        inels_value: Union[str, bytes] = None,
         ha_value: Any = None,
         last_value: Any = None,
+        status_ints: Optional[bytes] = None,
     ) -> None:
-        """initializing device info."""
+        """initializing device info.
+
+        status_ints are the values of the status bytes when the caller
+        already parsed a plain uppercase payload, see batch.
+        """
+        # raw payload as received, decoded to str only when asked for
         self.__inels_status_value = inels_value
+        self.__inels_status_str: Optional[str] = (
+            inels_value if isinstance(inels_value, str) else None
+        )
+        self.__status_bytes: Optional[tuple] = None
+        self.__status_ints: Optional[bytes] = status_ints
+        self.__status_ints_parsed = status_ints is not None
+        self.__status_upper = status_ints is not None
         self.__inels_set_value: Any = None
         self.__ha_value = ha_value
         self.__device_type = device_type
@@ -360,2128 +790,2121 @@ class DeviceValue(object):
         # ha values are for home assistant to observe the state
         # inels set values are for enforcing commands
         # inels status values are what comes from the broker
-        try:            
-            if self.__device_type is SWITCH:  # outlet switch
-                if self.__inels_type is RF_SINGLE_SWITCH:
-                    if self.inels_status_value is None:
-                        _LOGGER.info("inels_status_value was 'None' for %s", RF_SWITCHING_UNIT)
-                        self.__inels_set_value = DEVICE_TYPE_07_COMM_TEST
-                        self.__ha_value = None
-                    else:
-                        simple_relay: list[SimpleRelay] = []
-                        simple_relay.append(
-                            SimpleRelay(
-                                is_on=int(self.__trim_inels_status_values(DEVICE_TYPE_02_DATA, RELAY, ""), 16) != 0
-                            )
-                        )
+        decoder = self.__HA_DECODERS.get((self.__device_type, self.__inels_type)) \
+            or self.__HA_DECODERS.get((self.__device_type, None))
+        if decoder is None:
+            return
 
-                        self.__ha_value = new_object(
-                            simple_relay=simple_relay,
-                        )
+        try:
+            decoder(self)
+        except Exception as err:
+            _LOGGER.error("Error making HA value for device of type '%s', status value was '%s'", self.__inels_type, None if not self.inels_status_value else self.inels_status_value.replace("\n", " "))
+            self.__ha_value = dummy_val
+            #raise
 
-                        self.__inels_set_value = f"{(2 - (self.__ha_value.simple_relay[0].is_on)):02X}\n00\n"
-                elif self.__inels_type is RF_SWITCHING_UNIT:
-                    if self.inels_status_value is None:
-                        _LOGGER.info("inels_status_value was 'None' for %s", RF_SWITCHING_UNIT)
-                        self.__inels_set_value = DEVICE_TYPE_02_COMM_TEST
-                        self.__ha_value = None
-                    else:
-                        simple_relay: list[SimpleRelay] = []
-                        simple_relay.append(
-                            SimpleRelay(
-                                is_on=int(self.__trim_inels_status_values(DEVICE_TYPE_02_DATA, RELAY, ""), 16) != 0
-                            )
-                        )
+    def __decode_rf_single_switch(self) -> None:
+        """Decode status of Single switching unit."""
+        if self.__inels_status_value is None:
+            _LOGGER.info("inels_status_value was 'None' for %s", RF_SWITCHING_UNIT)
+            self.__inels_set_value = DEVICE_TYPE_07_COMM_TEST
+            self.__ha_value = None
+        else:
+            simple_relay: list[SimpleRelay] = []
+            simple_relay.append(
+                SimpleRelay(
+                    is_on=self.__trim_inels_status_int(DEVICE_TYPE_02_DATA, RELAY) != 0
+                )
+            )
 
-                        self.__ha_value = new_object(
-                            simple_relay=simple_relay,
-                        )
+            self.__ha_value = RelayValue(
+                simple_relay=simple_relay,
+            )
 
-                        self.__inels_set_value = f"{(2 - (self.__ha_value.simple_relay[0].is_on * 1)):02X}\n00\n00\n"
-                elif self.__inels_type is RF_SWITCHING_UNIT_WITH_EXTERNAL_TEMPERATURE_SENSOR:
-                    if self.inels_status_value is None:
-                        _LOGGER.info("inels_status_value was 'None' for %s", RF_SWITCHING_UNIT_WITH_EXTERNAL_TEMPERATURE_SENSOR)
-                        self.__inels_set_value = DEVICE_TYPE_07_COMM_TEST
-                        self.__ha_value = None
-                    else:
-                        simple_relay: list[SimpleRelay] = []
-                        simple_relay.append(
-                            SimpleRelay(
-                                is_on=int(self.__trim_inels_status_values(DEVICE_TYPE_07_DATA, RELAY, ""), 16) != 0
-                            )
-                        )
-                        temp = self.__trim_inels_status_values(DEVICE_TYPE_07_DATA, TEMP_OUT, "")
+            self.__inels_set_value = f"{(2 - (self.__ha_value.simple_relay[0].is_on)):02X}\n00\n"
 
-                        self.__ha_value = new_object(
-                            simple_relay=simple_relay,
-                            temp_out=temp,
-                        )
+    def __decode_rf_switching_unit(self) -> None:
+        """Decode status of Switching unit."""
+        if self.__inels_status_value is None:
+            _LOGGER.info("inels_status_value was 'None' for %s", RF_SWITCHING_UNIT)
+            self.__inels_set_value = DEVICE_TYPE_02_COMM_TEST
+            self.__ha_value = None
+        else:
+            simple_relay: list[SimpleRelay] = []
+            simple_relay.append(
+                SimpleRelay(
+                    is_on=self.__trim_inels_status_int(DEVICE_TYPE_02_DATA, RELAY) != 0
+                )
+            )
 
-                        self.__inels_set_value = SWITCH_WITH_TEMP_SET[self.__ha_value.simple_relay[0].is_on]            
-                elif self.__inels_type is SA3_01B:
-                    re = []
-                    re.append(int(self.__trim_inels_status_values(SA3_01B_DATA, RELAY, ""), 16) & 1 != 0) 
-                    
-                    temp = self.__trim_inels_status_values(SA3_01B_DATA, TEMP_IN, "")
-                    
-                    relay_overflow = []
-                    relay_overflow.append(int(self.__trim_inels_status_values(SA3_01B_DATA, RELAY_OVERFLOW, ""),16) == 1)
-                    
-                    relay: list[Relay] = []
-                    for i in range(len(re)):
-                        relay.append(
-                            Relay(
-                                is_on=re[i],
-                                overflow=relay_overflow[i],
-                            )
-                        )
+            self.__ha_value = RelayValue(
+                simple_relay=simple_relay,
+            )
 
-                    self.__ha_value = new_object(
-                        #re=re,
-                        temp_in=temp,
-                        #relay_overflow=relay_overflow
-
-                        relay=relay
-                    )
-                    self.__inels_set_value = RELAY_SET[self.__ha_value.relay[0].is_on]
-                elif self.__inels_type is SA3_02B:
-                    simple_relay: list[SimpleRelay] = []
-                    for relay in self.__trim_inels_status_bytes(SA3_02B_DATA, RELAY):
-                        simple_relay.append(SimpleRelay(is_on=((int(relay, 16) & 1) != 0)))
-                    
-                    temp_in = self.__trim_inels_status_values(SA3_02B_DATA, TEMP_IN, "")
-                    self.__ha_value = new_object(
-                        simple_relay=simple_relay,
-                        temp_in=temp_in,
-                    )
-                    
-                    set_val = ""
-                    for r in simple_relay:
-                        set_val += "07\n" if r.is_on else "06\n"
-                    self.__inels_set_value=set_val
-                elif self.__inels_type is SA3_02M: #TODO: generalize SA3_02M/04M/06M
-                    simple_relay: list[SimpleRelay] = []
-                    for relay in self.__trim_inels_status_bytes(SA3_02M_DATA, RELAY):
-                        simple_relay.append(SimpleRelay(is_on=((int(relay, 16) & 1) != 0)))
-                    
-                    digital_inputs = self.__trim_inels_status_values(
-                        SA3_02M_DATA, SW, "")
-                    digital_inputs = f"0x{digital_inputs}"
-                    digital_inputs = f"{int(digital_inputs, 16):0>8b}"
-                    sw = []
-                    for i in range(2):
-                        sw.append(digital_inputs[7 - i] == "1")
-                        
-                    self.__ha_value = new_object(
-                        simple_relay=simple_relay,
-                        sw=sw,
-                    )
-                    
-                    set_val = ""
-                    for r in simple_relay:
-                        set_val += "07\n" if r else "06\n"
-                    self.__inels_set_value=set_val
-                elif self.__inels_type is SA3_04M:
-                    simple_relay: list[SimpleRelay] = []
-                    for relay in self.__trim_inels_status_bytes(SA3_04M_DATA, RELAY):
-                        simple_relay.append(SimpleRelay(is_on=((int(relay, 16) & 1) != 0)))
-                    
-                    digital_inputs = self.__trim_inels_status_values(
-                        SA3_04M_DATA, SW, "")
-                    digital_inputs = f"0x{digital_inputs}"
-                    digital_inputs = f"{int(digital_inputs, 16):0>8b}"
-                    sw = []
-                    for i in range(4):
-                        sw.append(digital_inputs[7 - i] == "1")
-                        
-                    self.__ha_value = new_object(
-                        simple_relay=simple_relay,
-                        sw=sw,
-                    )
-                    
-                    set_val = ""
-                    for r in simple_relay:
-                        set_val += "07\n" if r.is_on else "06\n"
-                    self.__inels_set_value=set_val
-                elif self.__inels_type is SA3_06M:
-                    simple_relay: list[SimpleRelay] = []
-                    for relay in self.__trim_inels_status_bytes(SA3_06M_DATA, RELAY):
-                        simple_relay.append(SimpleRelay(is_on=((int(relay, 16) & 1) != 0)))
-
-                    digital_inputs = self.__trim_inels_status_values(
-                        SA3_06M_DATA, SW, "")
-                    digital_inputs = f"0x{digital_inputs}"
-                    digital_inputs = f"{int(digital_inputs, 16):0>8b}"
-                    sw = []
-                    for i in range(6):
-                        sw.append(digital_inputs[7 - i] == "1")
-                        
-                    self.__ha_value = new_object(
-                        simple_relay=simple_relay,
-                        sw=sw,
-                    )
-                    
-                    set_val = ""
-                    for r in simple_relay:
-                        set_val += "07\n" if r.is_on else "06\n"
-                    self.__inels_set_value=set_val
-                elif self.__inels_type is SA3_012M:
-                    simple_relay: list[SimpleRelay] = []
-                    for relay in self.__trim_inels_status_bytes(SA3_012M_DATA, RELAY):
-                        simple_relay.append(SimpleRelay(is_on=((int(relay, 16) & 1) != 0)))
-
-                    digital_inputs = self.__trim_inels_status_values(
-                        SA3_012M_DATA, SA3_012M, "")
-                    digital_inputs = f"0x{digital_inputs}"
-                    digital_inputs = f"{int(digital_inputs, 16):0>16b}"
-                    
-                    sw=[]
-                    for i in range(8):
-                        sw.append(digital_inputs[7 - i] == "1")
-                    for i in range(4):
-                        sw.append(digital_inputs[15 - i] == "1")
-                    
-                    self.__ha_value = new_object(
-                        simple_relay=simple_relay,
-                        sw=sw,
-                    )
-                    set_val = ""
-                    for r in simple_relay:
-                        set_val += "07\n" if r.is_on else "06\n"
-                    self.__inels_set_value=set_val
-                elif self.__inels_type is SA3_014M:
-                    simple_relay: list[SimpleRelay] = []
-                    for relay in self.__trim_inels_status_bytes(SA3_014M_DATA, RELAY):
-                        simple_relay.append(SimpleRelay(is_on=((int(relay, 16) & 1) != 0)))
-
-                    digital_inputs = self.__trim_inels_status_values(
-                        SA3_014M_DATA, SA3_014M, "")
-                    digital_inputs = f"0x{digital_inputs}"
-                    digital_inputs = f"{int(digital_inputs, 16):0>16b}"
-
-                    sw = []
-                    for i in range(8):
-                        sw.append(digital_inputs[7 - i] == "1")
-                    for i in range(6):
-                        sw.append(digital_inputs[13 - i] == "1")
-
-                    self.__ha_value = new_object(
-                        simple_relay=simple_relay,
-                        sw=sw,
-                    )
-                    set_val = ""
-                    for r in simple_relay:
-                        set_val += "07\n" if r.is_on else "06\n"
-                    self.__inels_set_value = set_val
-                elif self.__inels_type is SA3_022M:
-                    re=[]
-                    for relay in self.__trim_inels_status_bytes(SA3_022M_DATA, RELAY):
-                        re.append((int(relay, 16) & 1) != 0)
-                    
-                    overflows=[]
-                    alerts = self.__trim_inels_status_values(
-                        SA3_022M_DATA, RELAY_OVERFLOW, ""
-                    )
-                    alerts = f"0x{alerts}"
-                    alerts = f"{int(alerts, 16):0>16b}"
-                    for i in range(8): #0-7
-                        overflows.append(alerts[7-i] == "1")
-                    for i in range(8): #8-15
-                        overflows.append(alerts[15-i] == "1")
-                    
-                    digital_inputs = self.__trim_inels_status_values(
-                        SA3_022M_DATA, SW, "")
-                    digital_inputs = f"0x{digital_inputs}"
-                    digital_inputs = f"{int(digital_inputs, 16):0>16b}"
-                    
-                    sw=[]
-                    for i in range(8):
-                        sw.append(digital_inputs[7 - i] == "1")
-                    for i in range(8):
-                        sw.append(digital_inputs[15 - i] == "1")
-
-                    relay: list[Relay] = []
-                    for i in range(len(re)):
-                        relay.append(
-                            Relay(
-                                is_on=re[i],
-                                overflow=overflows[i]
-                            )
-                        )
+            self.__inels_set_value = f"{(2 - (self.__ha_value.simple_relay[0].is_on * 1)):02X}\n00\n00\n"
 
-                    shutter=[]
-                    for s in self.__trim_inels_status_bytes(SA3_022M_DATA, SHUTTER):
-                        shutter.append((int(s, 16) & 1) != 0)
-                    
-                    simple_shutters = []
-                    shutters = list(zip(shutter[::2], shutter[1::2]))
-                    for s in shutters:
-                        if s[0]:
-                            state = Shutter_state.Open
-                        elif s[1]:
-                            state = Shutter_state.Closed
-                        else:
-                            state = Shutter_state.Stop_down
-                        simple_shutters.append(
-                            Shutter(
-                                state=state,
-                                is_closed=None
-                            )
-                        )
+    def __decode_rf_switching_unit_with_temp(self) -> None:
+        """Decode status of Switching unit with external temperature sensor."""
+        if self.__inels_status_value is None:
+            _LOGGER.info("inels_status_value was 'None' for %s", RF_SWITCHING_UNIT_WITH_EXTERNAL_TEMPERATURE_SENSOR)
+            self.__inels_set_value = DEVICE_TYPE_07_COMM_TEST
+            self.__ha_value = None
+        else:
+            simple_relay: list[SimpleRelay] = []
+            simple_relay.append(
+                SimpleRelay(
+                    is_on=self.__trim_inels_status_int(DEVICE_TYPE_07_DATA, RELAY) != 0
+                )
+            )
+            temp = self.__trim_inels_status_values(DEVICE_TYPE_07_DATA, TEMP_OUT, "")
 
-                    valve=[]
-                    for v in self.__trim_inels_status_bytes(SA3_022M_DATA, VALVE):
-                        valve.append((int(v, 16) & 1) != 0)
-
-                    self.__ha_value = new_object(
-                        relay=relay,
-                        shutter_motors=shutter,
-                        simple_shutters=simple_shutters,
-                        valve=valve,
-                        sw=sw,
-                    )
-
-                    set_val = ""
-                    for r in self.ha_value.relay:
-                        set_val += RELAY_SET[r.is_on]
-                    # for s in self.ha_value.shutter_motors:
-                    #     set_val += RELAY_SET[s]
-                    for s in self.__ha_value.simple_shutters:
-                        set_val += SIMPLE_SHUTTER_STATE_SET[s.state]
-                    for v in self.ha_value.valve:
-                        set_val += RELAY_SET[v]
-
-                    self.__inels_set_value = set_val
-                elif self.__inels_type is IOU3_108M:
-                    re=[]
-                    for relay in self.__trim_inels_status_bytes(IOU3_108M_DATA, RELAY):
-                        re.append((int(relay, 16) & 1) != 0)
-                    
-                    temps = self.__trim_inels_status_values(IOU3_108M_DATA, TEMP_IN, "")
-                    temps = [temps[0:4], temps[4:8]]
-                    
-                    digital_inputs = self.__trim_inels_status_values(
-                        IOU3_108M_DATA, DIN, "")
-                    digital_inputs = f"0x{digital_inputs}"
-                    digital_inputs = f"{int(digital_inputs, 16):0>8b}"
-
-                    din = []
-                    for i in range(8):
-                        din.append(digital_inputs[7-i] == '1')
-
-                    digital_inputs = self.__trim_inels_status_values(
-                        IOU3_108M_DATA, RELAY_OVERFLOW, "")
-                    digital_inputs = f"0x{digital_inputs}"
-                    digital_inputs = f"{int(digital_inputs, 16):0>8b}"
-
-                    relay_overflow = []
-                    for i in range(8):
-                        relay_overflow.append(digital_inputs[7-1] == '1')
-
-                    relay: list[Relay] = []
-                    for i in range(8):
-                        relay.append(
-                            Relay(
-                                is_on=re[i],
-                                overflow=relay_overflow[i],
-                            )
-                        )
+            self.__ha_value = RelayTempValue(
+                simple_relay=simple_relay,
+                temp_out=temp,
+            )
 
-                    self.__ha_value = new_object(
-                        relay=relay,
-                        #re=re,
-                        temps=temps,
-                        din=din,
-                        #relay_overflow=relay_overflow,
-                    )
-                elif self.__inels_type is RC3_610DALI: 
-                    #aout
-                    aout_brightness=[]
-                    for a in self.__trim_inels_status_bytes(RC3_610DALI_DATA, AOUT):
-                        aout_brightness.append(int(a, 16))
-
-                    #relays
-                    re=[]
-                    for relay in self.__trim_inels_status_bytes(RC3_610DALI_DATA, RELAY):
-                        re.append((int(relay, 16) & 1) != 0)
-                    
-                    #temperatures
-                    temps = []
-                    temp_bytes = self.__trim_inels_status_bytes(
-                        RC3_610DALI_DATA,
-                        TEMP_IN,
-                    )
-                    for i in range(int(len(temp_bytes)/2)):
-                        temps.append(temp_bytes[2*i] + temp_bytes[2*i+1])
-                    
-                    #digital inputs
-                    din=[]
-                    digital_inputs = self.__trim_inels_status_values(
-                        RC3_610DALI_DATA, DIN, "")
-                    digital_inputs = f"0x{digital_inputs}"
-                    digital_inputs = f"{int(digital_inputs, 16):0>8b}"
-                    
-                    for i in range(6):
-                        din.append(digital_inputs[7-i] == "1")
-                    
-                    relay_overflow=[]
-                    overflows = self.__trim_inels_status_values(
-                        RC3_610DALI_DATA, RELAY_OVERFLOW, "")
-                    overflows = f"0x{overflows}"
-                    overflows = f"{int(overflows, 16):0>8b}"
-                    for i in range(len(re)):
-                        relay_overflow.append(overflows[7-i] == "1")
-                    
-                    relay: list[Relay] = []
-                    for i in range(len(re)):
-                        relay.append(
-                            Relay(
-                                is_on=re[i],
-                                overflow=relay_overflow[i],
-                            )
-                        )
+            self.__inels_set_value = SWITCH_WITH_TEMP_SET[self.__ha_value.simple_relay[0].is_on]            
 
-                    sync_error = []
-                    aout_coa = []
-                    alerts = self.__trim_inels_status_values(
-                        RC3_610DALI_DATA, ALERT, "")
-                    alerts = f"0x{alerts}"
-                    alerts = f"{int(alerts, 16):0>8b}"
-                    
-                    for i in range(4):
-                        sync_error.append(alerts[7-i] == "1")
-                    for i in range(4, 6):
-                        aout_coa.append(alerts[7-i] == "1")
-
-                    
-                    aout=[]
-                    for i in range(2):
-                        aout.append(
-                            AOUTLight(
-                                brightness=aout_brightness[i],
-                                aout_coa=aout_coa[i]
-                            )
-                        )
+    def __decode_sa3_01b(self) -> None:
+        """Decode status of SA3-01B."""
+        re = []
+        re.append(self.__trim_inels_status_int(SA3_01B_DATA, RELAY) & 1 != 0) 
 
-                    alert_dali_power = alerts[1] == "1"
-                    alert_dali_communication = alerts[0] == "1"
-                    
-                    dali_raw = self.__trim_inels_status_bytes(
-                        RC3_610DALI_DATA, DALI)
-                    dali = []
-                    for d in dali_raw:
-                        dali.append(
-                            DALILight(
-                                brightness=int(d, 16),
-                                alert_dali_communication=alert_dali_communication,
-                                alert_dali_power=alert_dali_power,
-                            )
-                        )
-                    
-                    self.__ha_value = new_object(
-                        relay=relay,
-                        temps=temps,
-                        din=din,
-                        aout=aout,
-                        dali=dali,
-                    )
-                elif self.__inels_type is FA3_612M:
-                    inputs = self.__trim_inels_status_values(FA3_612M_DATA, FA3_612M, "")
-                    inputs = f"0x{inputs}"
-                    inputs = f"{int(inputs, 16):0>24b}"
-
-                    din = []
-                    for i in range(3):
-                        din.append(inputs[7-i] == "1")
-
-                    aout_coa = []
-                    for i in range(4, 8):
-                        aout_coa.append(inputs[7 - i] == "1")
-
-                    sw = []
-                    for i in range(8):
-                        sw.append(inputs[15-i] == "1")
-
-                    roa = []
-                    for i in range(3):
-                        roa.append(inputs[23 - i] == "1")
-
-                    sw.append(inputs[23 - 3] == "1")
-                    
-                    overflows = self.__trim_inels_status_values(FA3_612M_DATA, RELAY_OVERFLOW, "")
-                    overflows = f"0x{overflows}"
-                    overflows = f"{int(overflows, 16):0>8b}"
-                    
-                    #relay_overflow = []
-                    #for i in range(8):
-                    #    relay_overflow.append(overflows[7-i] == "1")
-                    
-                    i=0
-                    aout=[]
-                    for a in self.__trim_inels_status_bytes(FA3_612M_DATA, AOUT):
-                        aout.append(
-                            AOUTLight(
-                                brightness=int(a, 16),
-                                aout_coa=aout_coa[i],
-                            )
-                        )
-                        i = i + 1
-                    
-                    re=[]
-                    for relay in self.__trim_inels_status_bytes(FA3_612M_DATA, RELAY):
-                        re.append((int(relay, 16) & 1) != 0)
-                    
-                    valves = [[re[0], re[1]], [re[2], re[3]]]
-                    fan_speed = 0
-                    if re[6]: #speed 3
-                        fan_speed = 3
-                    elif re[5]: #speed 2
-                        fan_speed = 2
-                    elif re[4]: #speed 1
-                        fan_speed = 1
-                    
-                    heating_out = re[7]
-                    
-                    ains=[]
-                    ain_bytes = self.__trim_inels_status_bytes(
-                        FA3_612M_DATA,
-                        AIN,
-                    )
-                    for i in range(int(len(ain_bytes)/4)):
-                        ains.append(ain_bytes[4*i] + ain_bytes[4*i+1] + ain_bytes[4*i+2] + ain_bytes[4*i+3])
-
-                    last_status_val=self.__inels_status_value
-
-                    self.__ha_value = new_object(
-                        din=din,
-                        sw=sw,
-                        aout=aout,
-                        valves=valves,
-                        fan_speed=fan_speed,
-                        heating_out=heating_out,
-                        ains=ains,
-                        last_status_val=last_status_val,
-                    )
-                elif self.__inels_type in [GCR3_11, GCH3_31]:
-                    state = self.__trim_inels_status_values(CARD_DATA, STATE, "")
-                    state = f"0x{state}"
-                    state = f"{int(state, 16):0>16b}"
-
-                    simple_relay: list[SimpleRelay] = []
-                    simple_relay.append(SimpleRelay(is_on=state[5] == "1"))
-                    
-                    card_present = (state[4] == "1")
-
-                    card_id = self.__trim_inels_status_values(CARD_DATA, CARD_ID, "")
-                    card_id_int = int(card_id, 16)
-                    #if card removed before 
-                    if card_id_int == 0 and self.__last_value is not None:
-                        card_id = self.__last_value.card_id
-
-                    interface = [
-                        state[0] == "1",
-                        state[12] == "1",
-                        state[10] == "1"
-                    ]
-
-                    light_in = self.__trim_inels_status_values(CARD_DATA, LIGHT_IN, "")
-
-                    temp_in = self.__trim_inels_status_values(CARD_DATA, TEMP_IN, "")
-                    self.__ha_value = new_object(
-                        simple_relay=simple_relay,
-                        interface=interface,
-                        temp_in=temp_in,
-                        card_present=card_present,
-                        card_id=card_id,
-                    )
-                elif self.__inels_type is BITS:
-                    bit: list[Bit] = []
-                    for addr, val in parse_formated_json(self.__inels_status_value):
-                        bit.append(
-                            Bit(
-                                is_on=val, addr=addr
-                            )
-                        )
+        temp = self.__trim_inels_status_values(SA3_01B_DATA, TEMP_IN, "")
 
-                    self.__ha_value = new_object(
-                        bit=bit,
-                    )
-
-                    set_val = {}
-                    for bit in self.ha_value.bit:
-                        set_val[bit.addr] = bit.is_on
-
-                    self.__inels_set_value = json.dumps({"cmd": set_val})
-            elif self.__device_type is NUMBER:
-                number: list[Number] = []
-                for addr, val in parse_formated_json(self.__inels_status_value):
-                    number.append(
-                        Number(
-                            value=val, addr=addr
-                        )
-                    )
+        relay_overflow = []
+        relay_overflow.append(self.__trim_inels_status_int(SA3_01B_DATA, RELAY_OVERFLOW) == 1)
 
-                self.__ha_value = new_object(
-                    number=number,
+        relay: list[Relay] = []
+        for i in range(len(re)):
+            relay.append(
+                Relay(
+                    is_on=re[i],
+                    overflow=relay_overflow[i],
                 )
+            )
 
-                set_val = {}
-                for number in self.ha_value.number:
-                    set_val[number.addr] = number.value
-
-                self.__inels_set_value = json.dumps({"cmd": set_val})
-            elif self.__device_type is SENSOR:  # temperature sensor
-                if self.__inels_type is RF_TEMPERATURE_INPUT:
-                    battery = int(self.__trim_inels_status_values(DEVICE_TYPE_10_DATA, BATTERY, ""), 16)
-                    temp_in = self.__trim_inels_status_values(DEVICE_TYPE_10_DATA, TEMP_IN, "")
-                    temp_out = self.__trim_inels_status_values(DEVICE_TYPE_10_DATA, TEMP_OUT, "")
-
-                    self.__ha_value = new_object(
-                        low_battery=(battery!=0),
-                        temp_in=temp_in,
-                        temp_out=temp_out,
-                    )
-                elif self.__inels_type is RF_THERMOSTAT:
-                    temp_in = int(self.__trim_inels_status_values(DEVICE_TYPE_12_DATA, TEMP_IN, ""), 16) * 0.5
-                    battery = int(self.__trim_inels_status_values(DEVICE_TYPE_12_DATA, BATTERY, ""), 16)
-                    # has 2 values, 0x80 and 0x81 on which 0x81 means low battery
-
-                    self.__ha_value = new_object(
-                        low_battery=(battery == 0x81),
-                        temp_in=temp_in,
-                    )
-                elif self.__inels_type is RF_FLOOD_DETECTOR:
-                    state = self.__trim_inels_status_values(DEVICE_TYPE_15_DATA, STATE, "")
-                    state = f"0x{state}"
-                    state = f"{int(state, 16):0>8b}"
-
-                    ain = int(self.__trim_inels_status_values(DEVICE_TYPE_15_DATA, AIN, ""), 16) /100
-
-                    low_battery=state[7] == "1"
-                    flooded=state[0] == "1"
-                    ains=[]
-                    ains.append(ain)
-                    self.__ha_value = new_object(
-                        low_battery=low_battery,
-                        flooded=flooded,
-                        ains=ains,
-                    )
-                elif self.__inels_type is RF_DETECTOR:
-                    state = self.__trim_inels_status_values(
-                        DEVICE_TYPE_16_DATA, STATE, "")
-                    state = f"0x{state}"
-                    state = f"{int(state, 16):0>8b}"
-
-                    
-                    low_battery=state[4] == "1"
-                    detected=state[3] == "1"
-                    tamper=state[1]=="1"
-
-                    self.__ha_value = new_object(
-                        low_battery=low_battery,
-                        detected=detected,
-                        tamper=tamper,
-                    )
-                elif self.__inels_type is RF_MOTION_DETECTOR:
-                    state = self.__trim_inels_status_values(
-                        DEVICE_TYPE_16_DATA, STATE, "")
-                    state = f"0x{state}"
-                    state = f"{int(state, 16):0>8b}"
-
-                    low_battery=state[4] == "1"
-                    motion=state[3] == "1"
-                    tamper=state[1]=="1"
-
-                    self.__ha_value = new_object(
-                        low_battery=low_battery,
-                        motion=motion,
-                        tamper=tamper,
-                    )
-                elif self.__inels_type is RF_TEMPERATURE_HUMIDITY_SENSOR:
-                    battery = int(self.__trim_inels_status_values(DEVICE_TYPE_29_DATA, BATTERY, ""), 16)
-                    temp_in = self.__trim_inels_status_values(DEVICE_TYPE_29_DATA, TEMP_IN, "")
-                    humidity = int(self.__trim_inels_status_values(DEVICE_TYPE_29_DATA, HUMIDITY, ""), 16)
-
-                    self.__ha_value = new_object(
-                        low_battery=(battery!=0),
-                        temp_in=temp_in,
-                        humidity=humidity,
-                    )
-                elif self.__inels_type is GRT3_50:
-                    digital_inputs = self.__trim_inels_status_values(
-                        GRT3_50_DATA, GRT3_50, "")
-                    digital_inputs_hex_str = f"0x{digital_inputs}"
-                    digital_inputs_bin_str = f"{int(digital_inputs_hex_str, 16):0>8b}"
-                    
-                    plusminus = self.__trim_inels_status_values(
-                        GRT3_50_DATA, PLUS_MINUS_BUTTONS, "")
-                    plusminus = f"0x{plusminus}"
-                    plusminus = f"{int(plusminus, 16):0>8b}"
-                    
-                    temp_in = self.__trim_inels_status_values(GRT3_50_DATA, TEMP_IN, "")
-                        
-                    light_in = self.__trim_inels_status_values(GRT3_50_DATA, LIGHT_IN, "")
-
-                    ain = self.__trim_inels_status_values(GRT3_50_DATA, AIN, "")
-                    
-                    humidity = self.__trim_inels_status_values(GRT3_50_DATA, HUMIDITY, "")
-
-                    dewpoint = self.__trim_inels_status_values(GRT3_50_DATA, DEW_POINT, "")
-
-
-                    self.__ha_value = new_object(
-                        # digital inputs
-                        din=[# 2
-                            digital_inputs_bin_str[7] == "1", #0 -> 7, reverse endianness
-                            digital_inputs_bin_str[6] == "1",
-                        ],
-                        interface=[# 5
-                            digital_inputs_bin_str[5] == "1",
-                            digital_inputs_bin_str[4] == "1",
-                            digital_inputs_bin_str[3] == "1",
-                            digital_inputs_bin_str[2] == "1",
-                            digital_inputs_bin_str[1] == "1", #6
-                            plusminus[7] == "1", # plus
-                            plusminus[6] == "1", # minus
-                        ],
-                        
-                        temp_in=temp_in,
-
-                        light_in=light_in,
-
-                        ain=ain,
-
-                        humidity=humidity,
-
-                        dewpoint=dewpoint,
-
-                        # backlit
-                        backlit=False,
-                    )
-                elif self.__inels_type in [WSB3_20, WSB3_40]:
-                    switches = self.__trim_inels_status_values(
-                        WSB3_240_DATA, SW, "")
-                    switches = f"0x{switches}"
-                    switches = f"{int(switches, 16):0>8b}"
-                    
-                    digital_inputs = self.__trim_inels_status_values(
-                        WSB3_240_DATA, DIN, "")
-                    digital_inputs = f"0x{digital_inputs}"
-                    digital_inputs = f"{int(digital_inputs, 16):0>8b}"
-                    
-                    interface=[] #up/down buttons
-                    for i in range(WSB3_AMOUNTS[self.__inels_type]):
-                        interface.append(switches[7 - i] == "1")
-                    
-                    din=[]
-                    for i in range(2):
-                        din.append(digital_inputs[7 - i] == "1")
-
-                    temp_in=self.__trim_inels_status_values(
-                        WSB3_240_DATA, TEMP_IN, ""
-                    )
-                    ain=self.__trim_inels_status_values(
-                        WSB3_240_DATA, AIN, ""
-                    )
-                    
-                    self.__ha_value = new_object(
-                        interface=interface,
-                        din=din,
-                        temp_in=temp_in,
-                        ain=ain,
-                    )
-                elif self.__inels_type in [WSB3_20H, WSB3_40H]:
-                    switches = self.__trim_inels_status_values(
-                        WSB3_240HUM_DATA, SW, "")
-                    switches = f"0x{switches}"
-                    switches = f"{int(switches, 16):0>8b}"
-                    
-                    
-                    digital_inputs = self.__trim_inels_status_values(
-                        WSB3_240HUM_DATA, DIN, "")
-                    digital_inputs = f"0x{digital_inputs}"
-                    digital_inputs = f"{int(digital_inputs, 16):0>8b}"
-                    interface=[] #up/down buttons
-                    din=[]
-                    for i in range(WSB3_AMOUNTS[self.__inels_type]):
-                        interface.append(switches[7 - i] == "1")
-                    for i in range(2):
-                        din.append(digital_inputs[7 - i] == "1")
-                
-                    temp_in = self.__trim_inels_status_values(WSB3_240HUM_DATA, TEMP_IN, "")
-                        
-                    ain = self.__trim_inels_status_values(WSB3_240HUM_DATA, AIN, "")
-                    
-                    humidity = self.__trim_inels_status_values(WSB3_240HUM_DATA, HUMIDITY, "")
-
-                    dewpoint = self.__trim_inels_status_values(WSB3_240HUM_DATA, DEW_POINT, "")
-
-                    self.__ha_value = new_object(
-                        interface=interface,
-                        din=din,
-                        temp_in=temp_in,
-                        ain=ain,
-                        humidity=humidity,
-                        dewpoint=dewpoint,
-                    )
-                elif self.__inels_type in [IM3_20B, IM3_40B]:
-                    binary_input = []
-                    inputs = self.__trim_inels_status_values(IM3_240B_DATA, IN, "")
-                    inputs = f"0x{inputs}"
-                    inputs = f"{int(inputs, 16):0>8b}"
-                    for i in range(IM3_AMOUNTS[self.__inels_type]):
-                        binary_input.append(int(inputs[7-2*i-1] + inputs[7-2*i], 2))
-                    
-                    temp = self.__trim_inels_status_values(IM3_240B_DATA, TEMP_IN, "")
-                    self.__ha_value = new_object(
-                        input=binary_input,
-                        temp_in=temp,
-                    )
-                elif self.__inels_type is IM3_80B:
-                    binary_input = []
-                    binary_input2 = []
-                    inputs = self.__trim_inels_status_values(IM3_80B_DATA, IN, "")
-                    inputs = f"0x{inputs}"
-                    inputs = f"{int(inputs, 16):0>16b}"
-                    for i in range(4):
-                        binary_input.append(int(inputs[7-2*i-1] + inputs[7-2*i], 2))
-                        binary_input2.append(int(inputs[15-2*i-1] + inputs[15-2*i], 2))
-                    binary_input.extend(binary_input2)
-                    
-                    temp = self.__trim_inels_status_values(IM3_80B_DATA, TEMP_IN, "")
-                    self.__ha_value = new_object(
-                        input=binary_input,
-                        temp=temp,
-                    )
-                elif self.__inels_type is IM3_140M:
-                    binary_input = []
-                    binary_input2 = []
-                    binary_input3 = []
-                    inputs = self.__trim_inels_status_values(IM3_140M_DATA, IN, "")
-                    inputs = f"0x{inputs}"
-                    inputs = f"{int(inputs, 16):0>32b}"
-                    
-                    for i in range(4):
-                        binary_input.append(int(inputs[7-2*i-1] + inputs[7-2*i], 2))
-                        binary_input2.append(int(inputs[15-2*i-1] + inputs[15-2*i], 2))
-                        binary_input3.append(int(inputs[23-2*i-1] + inputs[23-2*i], 2))
-                    binary_input.extend(binary_input2)
-                    binary_input.extend(binary_input3)
-                    
-                    for i in range(2):
-                        binary_input.append(int(inputs[31-2*i-1] + inputs[31-2*i], 2))
-                    
-                    self.__ha_value = new_object(
-                        input=binary_input
-                    )
-                elif self.__inels_type is DMD3_1:
-                    light_in = self.__trim_inels_status_values(DMD3_1_DATA, LIGHT_IN, "")
-                    temp_in = self.__trim_inels_status_values(DMD3_1_DATA, TEMP_IN, "")    
-                    humidity = self.__trim_inels_status_values(DMD3_1_DATA, HUMIDITY, "")
-                    motion = self.__trim_inels_status_values(
-                        DMD3_1_DATA, DMD3_1, "")
-                    motion = f"0x{motion}"
-                    motion = f"{int(motion, 16):0>8b}"
-
-                    motion=motion[7] == "1"
-
-                    self.__ha_value = new_object(
-                        light_in=light_in,
-                        temp_in=temp_in,
-                        humidity=humidity,
-                        motion=motion,
-                    )
-                elif self.__inels_type is ADC3_60M:
-                    ains=[]
-                    ain_bytes = self.__trim_inels_status_bytes(
-                        ADC3_60M_DATA, AIN,
-                    )
-                    for i in range(int(len(ain_bytes)/4)):
-                        ains.append(ain_bytes[4*i] + ain_bytes[4*i+1] + ain_bytes[4*i+2] + ain_bytes[4*i+3])
-
-                    self.__ha_value = new_object(
-                        ains=ains,
-                    )
-                elif self.__inels_type in [TI3_10B, TI3_40B, TI3_60M]:
-                    temps = []
-                    temp_bytes = self.__trim_inels_status_bytes(
-                        INELS_DEVICE_TYPE_DATA_STRUCT_DATA[self.__inels_type],
-                        TEMP_IN,
-                    )
-                    
-                    for i in range(int(len(temp_bytes)/2)):
-                        temps.append(temp_bytes[2*i] + temp_bytes[2*i+1])
-                    
-                    self.__ha_value = new_object(
-                        temps=temps
-                    )
-                elif self.__inels_type in IDRT3_1:
-                    inputs = self.__trim_inels_status_values(IDRT3_1_DATA, SW, "")
-                    inputs = f"0x{inputs}"
-                    inputs = f"{int(inputs, 16):0>8b}"
-                    
-                    interface = []
-                    din = []
-                    for i in range(2):
-                        din.append(inputs[7-i]=="1")
-                        interface.append(inputs[5-i]=="1")
-                    
-                    temp_in = self.__trim_inels_status_values(IDRT3_1_DATA, TEMP_IN, "")
-                    temp_out = self.__trim_inels_status_values(IDRT3_1_DATA, TEMP_OUT, "")
-                    
-                    self.__ha_value = new_object(
-                        interface=interface,
-                        din=din,
-                        temp_in=temp_in,
-                        temp_out=temp_out,
-                    )
-                elif self.__inels_type in [GSB3_40_V2, GSB3_60_V2, GSB3_90_V2, GSB3_40SX_V2, GSB3_60SX_V2, GSB3_90SX_V2, MSB3_40, MSB3_60, MSB3_90]:
-                    switches = self.__trim_inels_status_values(GSB3_V2_DATA, SW, "")
-                    switches = f"0x{switches}"
-                    switches = f"{int(switches, 16):0>8b}"
-
-                    digital_inputs = self.__trim_inels_status_values(GSB3_V2_DATA, DIN, "")
-                    digital_inputs = f"0x{digital_inputs}"
-                    digital_inputs = f"{int(digital_inputs, 16):0>8b}"
-
-                    interface=[]
-
-                    # Determine the number of buttons to process based on INTERFACE_BUTTON_COUNT
-                    gsb3_amount = GSB3_AMOUNTS[self.__inels_type]
-                    num_buttons = gsb3_amount if gsb3_amount < 8 else gsb3_amount - 1
-
-                    # Append states from 'switches' based on the number of buttons
-                    for i in range(num_buttons):
-                        interface.append(switches[7 - i] == "1")
-
-                    # If there are 8 or more buttons, use the last digital input for the button
-                    if gsb3_amount >= 8:
-                        interface.append(digital_inputs[7] == "1")
-
-                    din=[digital_inputs[6] == "1"]
-                    prox=digital_inputs[4] == "1"
-
-                    temp_in = self.__trim_inels_status_values(GSB3_V2_DATA, TEMP_IN, "")
-
-                    light_in = self.__trim_inels_status_values(GSB3_V2_DATA, LIGHT_IN, "")
-
-                    ain = self.__trim_inels_status_values(GSB3_V2_DATA, AIN, "")
-
-                    humidity = self.__trim_inels_status_values(GSB3_V2_DATA, HUMIDITY, "")
-
-                    dewpoint = self.__trim_inels_status_values(GSB3_V2_DATA, DEW_POINT, "")
-
-                    self.__ha_value = new_object(
-                        interface=interface,
-                        din=din,
-                        prox=prox,
-                        temp_in=temp_in,
-                        light_in=light_in,
-                        ain=ain,
-                        humidity=humidity,
-                        dewpoint=dewpoint,
-                    )
-            elif self.__device_type == LIGHT:  # dimmer
-                if self.__inels_type in [RF_SINGLE_DIMMER, RF_DIMMER]:
-                    if self.inels_status_value is None:
-                        _LOGGER.info("inels_status_value was None for RFDAC")
-                        self.__inels_set_value = DEVICE_TYPE_05_COMM_TEST
-                        self.__ha_value = None
-                    else:
-                        brightness = int(self.__trim_inels_status_values(DEVICE_TYPE_05_DATA, RF_DIMMER, ""), 16)
-                        brightness = int((((0xFFFF - brightness) - 10000)/1000)*5)
-                        brightness = round(brightness, -1)
-
-                        simple_light = []
-                        simple_light.append(
-                            SimpleLight(brightness=brightness)
-                        )
-                        self.__ha_value = new_object(simple_light=simple_light)
-                elif self.__inels_type is RF_DIMMER_RGB:
-                    if self.inels_status_value is None:
-                        _LOGGER.info("inels_status_value was None for %s", RF_DIMMER_RGB)
-                        self.__inels_set_value = DEVICE_TYPE_13_COMM_TEST
-                        self.__ha_value = None
-                    else:
-                        red = int(self.__trim_inels_status_values(DEVICE_TYPE_06_DATA, RED, ""), 16)
-                        green = int(self.__trim_inels_status_values(DEVICE_TYPE_06_DATA, GREEN, ""), 16)
-                        blue = int(self.__trim_inels_status_values(DEVICE_TYPE_06_DATA, BLUE, ""), 16)
-                        brightness = int(int(self.__trim_inels_status_values(DEVICE_TYPE_06_DATA, OUT, ""), 16)* 100.0/255.0)
-
-                        rgb=[]
-                        rgb.append(
-                            RGBLight(
-                                r=red,
-                                g=green,
-                                b=blue,
-                                brightness=brightness,
-                            )
-                        )
+        self.__ha_value = SA3_01BValue(
+            #re=re,
+            temp_in=temp,
+            #relay_overflow=relay_overflow
 
-                        self.__ha_value=new_object(
-                            rgb=rgb
-                        )
-                elif self.__inels_type is RF_LIGHT_BULB:
-                    if self.inels_status_value is None:
-                        _LOGGER.info("inels_status_value was None for %s", RF_LIGHT_BULB)
-                        self.__inels_set_value = DEVICE_TYPE_13_COMM_TEST
-                        self.__ha_value = None
-                    else:
-                        warm_light = []
-                        warm_light.append(
-                            WarmLight(
-                                    brightness=round(
-                                        int(self.__trim_inels_status_values(DEVICE_TYPE_13_DATA, OUT, ""), 16) * 100.0/255.0
-                                    ),
-                                    relative_ct=round(
-                                        int(self.__trim_inels_status_values(DEVICE_TYPE_13_DATA, WHITE, ""), 16) * 100.0/255.0
-                                    )
-                                ),
-                            )
-
-                        self.__ha_value=new_object(warm_light=warm_light)
-                elif self.__inels_type is DA3_22M:
-                    temp = self.__trim_inels_status_values(DA3_22M_DATA, TEMP_IN, "")
-
-                    state = self.__trim_inels_status_values(
-                        DA3_22M_DATA, DA3_22M, "")
-                    state_hex_str = f"0x{state}"
-                    state_bin_str = f"{int(state_hex_str, 16):0>8b}"
-
-                    toa=[ # thermal overload alarm
-                        state_bin_str[3] == "1",
-                        state_bin_str[2] == "1",
-                    ]
-                    coa=[ # current overload alrm
-                        state_bin_str[1] == "1", #6
-                        state_bin_str[0] == "1", #7
-                    ]
-
-                    out1 = int(
-                        self.__trim_inels_status_values(
-                            DA3_22M_DATA, DIM_OUT_1, ""
-                        ), 16
-                    )
-
-                    out2 = int(
-                        self.__trim_inels_status_values(
-                            DA3_22M_DATA, DIM_OUT_2, ""
-                        ), 16
-                    )
-                    out1 = out1 if out1 <= 100 else 100
-                    out2 = out2 if out2 <= 100 else 100
-                    out = [out1, out2]
-
-                    light_coa_toa = []
-                    for i in range(2):
-                        light_coa_toa.append(
-                            LightCoaToa(
-                                brightness=out[i],
-                                toa=toa[i],
-                                coa=coa[i],
-                            )
-                        )
+            relay=relay
+        )
+        self.__inels_set_value = RELAY_SET[self.__ha_value.relay[0].is_on]
+
+    def __decode_sa3_02b(self) -> None:
+        """Decode status of SA3-02B."""
+        simple_relay: list[SimpleRelay] = []
+        for relay in self.__trim_inels_status_ints(SA3_02B_DATA, RELAY):
+            simple_relay.append(SimpleRelay(is_on=((relay & 1) != 0)))
+
+        temp_in = self.__trim_inels_status_values(SA3_02B_DATA, TEMP_IN, "")
+        self.__ha_value = RelayTempInValue(
+            simple_relay=simple_relay,
+            temp_in=temp_in,
+        )
 
-                    self.__ha_value = new_object(
-                        #May not be that interesting for HA
-                        sw=[
-                            state_bin_str[7] == "1", #0
-                            state_bin_str[6] == "1", #1
-                        ],
-                        din=[
-                            state_bin_str[5] == "1",
-                            state_bin_str[4] == "1"
-                        ],
-
-                        temp_in=temp,
-                        light_coa_toa=light_coa_toa,
-                    )
-                    
-                    set_val = "00\n00\n00\n00\n"
-                    for i in range(len(self.__ha_value.light_coa_toa)):
-                        set_val +=  f"{self.__ha_value.light_coa_toa[i].brightness:02X}\n"
-                    self.__inels_set_value = set_val
-                elif self.__inels_type is DAC3_04B:
-                    temp_out = self.__trim_inels_status_values(DAC3_04_DATA, TEMP_OUT, "")
-                    
-                    aout_alert = int(self.__trim_inels_status_values(DAC3_04_DATA, ALERT, ""), 16) != 0
-
-                    aout_str = self.__trim_inels_status_bytes(DAC3_04_DATA, OUT)
-                    aout = []
-                    for d in aout_str:
-                        d = int(d, 16)
-                        d = d if d <= 100 else 100
-                        aout.append(
-                            AOUTLight(
-                                brightness=d,
-                                aout_coa=aout_alert,
-                            )
-                        )
-                    
-                    self.__ha_value = new_object(
-                        temp_out=temp_out,
-                        aout=aout,
-                    )
-
-                    set_val = "00\n" * 4
-                    for d in aout:
-                        set_val += f"{d.brightness:02X}\n"
-                elif self.__inels_type is DAC3_04M:
-                    temp_out = self.__trim_inels_status_values(DAC3_04_DATA, TEMP_OUT, "")
-
-                    aout_alert = self.__trim_inels_status_values(DAC3_04_DATA, ALERT, "")
-                    aout_alert_bits = f"{int(aout_alert, 16):0>8b}"
-                    aout_coa=[]
-                    for i in range(4):
-                        aout_coa.append(aout_alert_bits[6-i] == "1") #skip first bit
-
-                    aout_str = self.__trim_inels_status_bytes(DAC3_04_DATA, OUT)
-                    aout_val = []
-                    for d in aout_str:
-                        d = int(d, 16)
-                        d = d if d <= 100 else 100
-                        aout_val.append(d)
-
-                    aout=[]
-                    for i in range(4):
-                        aout.append(
-                            AOUTLight(
-                                brightness=aout_val[i],
-                                aout_coa=aout_coa[i],
-                            )
-                        )
-                    
-                    self.__ha_value = new_object(
-                        temp_out=temp_out,
-                        aout=aout,
-                    )
-
-                    set_val = "00\n" * 4
-                    for d in aout:
-                        set_val += f"{d.brightness:02X}\n"
-                elif self.__inels_type in DCDA_33M:
-                    digital_inputs = self.__trim_inels_status_values(DCDA_33M_DATA, ALERT, "")
-                    digital_inputs = f"0x{digital_inputs}"
-                    digital_inputs = f"{int(digital_inputs, 16):0>8b}"
-
-                    sw = []
-                    coa = []
-                    for i in range(3):
-                        sw.append(digital_inputs[7-i] == "1")
-                        coa.append(digital_inputs[4-i] == "1")
-                    
-                    coa.append(False) #only 3 alerts, so I fake the last one
-
-                    aout_val=[]
-                    aouts = self.__trim_inels_status_bytes(DCDA_33M_DATA, OUT)
-                    for i in range(len(aouts)):
-                        brightness = int(aouts[i], 16)
-                        brightness = brightness if brightness < 100 else 100
-                        aout_val.append(brightness)
-
-                    aout=[]
-                    for i in range(4):
-                        aout.append(AOUTLight(
-                                brightness=aout_val[i],
-                                aout_coa=coa[i],
-                            )
-                        )
+        set_val = ""
+        for r in simple_relay:
+            set_val += "07\n" if r.is_on else "06\n"
+        self.__inels_set_value=set_val
+
+    def __decode_sa3_02m(self) -> None:
+        """Decode status of SA3-02M."""
+        #TODO: generalize SA3_02M/04M/06M
+        simple_relay: list[SimpleRelay] = []
+        for relay in self.__trim_inels_status_ints(SA3_02M_DATA, RELAY):
+            simple_relay.append(SimpleRelay(is_on=((relay & 1) != 0)))
+
+        digital_inputs = self.__trim_inels_status_bits(SA3_02M_DATA, SW)
+        sw = []
+        for i in range(2):
+            sw.append(digital_inputs[i])
+
+        self.__ha_value = RelaySwitchValue(
+            simple_relay=simple_relay,
+            sw=sw,
+        )
 
+        set_val = ""
+        for r in simple_relay:
+            set_val += "07\n" if r else "06\n"
+        self.__inels_set_value=set_val
+
+    def __decode_sa3_04m(self) -> None:
+        """Decode status of SA3-04M."""
+        simple_relay: list[SimpleRelay] = []
+        for relay in self.__trim_inels_status_ints(SA3_04M_DATA, RELAY):
+            simple_relay.append(SimpleRelay(is_on=((relay & 1) != 0)))
+
+        digital_inputs = self.__trim_inels_status_bits(SA3_04M_DATA, SW)
+        sw = []
+        for i in range(4):
+            sw.append(digital_inputs[i])
+
+        self.__ha_value = RelaySwitchValue(
+            simple_relay=simple_relay,
+            sw=sw,
+        )
 
-                    self.__ha_value = new_object(
-                        sw=sw,
-                        aout=aout,
-                    )
-
-                    set_val = "00\n"*4
-                    for i in range(4):
-                        aout_val = aout[i].brightness
-                        set_val += f"{aout_val:02X}\n"
-                    self.__inels_set_value = set_val
-                elif self.__inels_type is DA3_66M:
-                    state = self.__trim_inels_status_values(
-                        DA3_66M_DATA, ALERT, ""
-                    )
-                    state = f"0x{state}"
-                    state = f"{int(state, 16):0>16b}"
-                    
-                    toa = []
-                    coa = []
-                    for i in range (4):
-                        toa.append(state[7-2*i]=="1")
-                        coa.append(state [7-2*i-1] == "1")
-                    for i in range(2):
-                        toa.append(state[15-2*i]== "1")
-                        coa.append(state[15-2*i-1] == "1")
-                    
-                    switches = self.__trim_inels_status_values(
-                        DA3_66M_DATA, SW, ""
-                    )
-                    switches = f"0x{switches}"
-                    switches = f"{int(switches, 16):0>8b}"
-                    
-                    digital_inputs = self.__trim_inels_status_values(
-                        DA3_66M_DATA, DIN, ""
-                    )
-                    digital_inputs = f"0x{digital_inputs}"
-                    digital_inputs = f"{int(digital_inputs, 16):0>8b}"
-                    
-                    sw = []
-                    din = []
-                    for i in range(6):
-                        sw.append(switches[7-i] == "1")
-                        din.append(digital_inputs[7-i] == "1")
-
-                    out = []
-                    outs = self.__trim_inels_status_bytes(
-                        DA3_66M_DATA, OUT
-                    )
-                    
-                    for o in outs:
-                        out.append(int(o, 16))
-
-                    light_coa_toa=[]
-                    for i in range(6):
-                        light_coa_toa.append(
-                            LightCoaToa(
-                                brightness=out[i],
-                                toa=toa[i],
-                                coa=coa[i],
-                            )
-                        )
+        set_val = ""
+        for r in simple_relay:
+            set_val += "07\n" if r.is_on else "06\n"
+        self.__inels_set_value=set_val
+
+    def __decode_sa3_06m(self) -> None:
+        """Decode status of SA3-06M."""
+        simple_relay: list[SimpleRelay] = []
+        for relay in self.__trim_inels_status_ints(SA3_06M_DATA, RELAY):
+            simple_relay.append(SimpleRelay(is_on=((relay & 1) != 0)))
+
+        digital_inputs = self.__trim_inels_status_bits(SA3_06M_DATA, SW)
+        sw = []
+        for i in range(6):
+            sw.append(digital_inputs[i])
+
+        self.__ha_value = RelaySwitchValue(
+            simple_relay=simple_relay,
+            sw=sw,
+        )
 
-                    self.__ha_value = new_object(
-                        sw=sw,
-                        din=din,
-                        light_coa_toa=light_coa_toa,
-                    )
-                    
-                    set_val = "00\n"*4
-                    for i in range(4):
-                        set_val += f"{self.__ha_value.light_coa_toa[i].brightness:02X}\n"
-                    set_val += "00\n"*4
-                    for i in range(4, 6):
-                        set_val += f"{self.__ha_value.light_coa_toa[i].brightness:02X}\n"
-                    set_val += "00\n"*12
-                    self.__inels_set_value = set_val
-                elif self.__inels_type is DALI_DMX_UNIT:
-                    outs = self.__trim_inels_status_bytes(DALI_DMX_UNIT_DATA, OUT)
-                    simple_light = []
-                    for o in outs:
-                        o = int(o, 16)
-                        o = o if o < 100 else 100
-                        simple_light.append(
-                            SimpleLight(
-                                brightness=o,
-                            )
-                        )
+        set_val = ""
+        for r in simple_relay:
+            set_val += "07\n" if r.is_on else "06\n"
+        self.__inels_set_value=set_val
 
-                    self.__ha_value = new_object(
-                        simple_light=simple_light,
-                    )
-                elif self.__inels_type is DALI_DMX_UNIT_2:
-                    outs = self.__trim_inels_status_bytes(DALI_DMX_UNIT_DATA, OUT)
-                    warm_light = []
-                    lights = list(zip(outs[::2], outs[1::2]))
-
-                    for l in lights:
-                        b = min(int(l[0], 16), 100)
-                        w = min(int(l[1], 16), 100)
-                        warm_light.append(
-                            WarmLight(
-                                brightness=b,
-                                relative_ct=w,
-                            )
-                        )
-                    
-                    self.__ha_value = new_object(
-                        warm_light=warm_light,
-                    )
-            elif self.__device_type is COVER:  # Shutters
-                if self.__inels_type is RF_SHUTTERS:
-                    if self.inels_status_value is None:
-                        _LOGGER.info("inels_status_value was 'None' for %s", RF_SHUTTERS)
-                        self.__inels_set_value = DEVICE_TYPE_03_COMM_TEST
-                        self.__ha_value = None
-                    else:
-                        # shutters True -> closed, False -> open
-                        shutters = []
-                        shutter_val = int(self.__trim_inels_status_values(DEVICE_TYPE_03_DATA, SHUTTER, ""), 16)
-
-                        # So as to continue driving it down if it aisn't closed
-                        # and continue opening it if it isn't open
-                        if shutter_val not in [Shutter_state.Open, Shutter_state.Closed]: 
-                            shutter_val = self.__last_value.shutters[0].state
-                        shutters.append(
-                            Shutter(
-                                state=shutter_val,
-                                is_closed=(shutter_val is Shutter_state.Closed)
-                            )
-                        )
+    def __decode_sa3_012m(self) -> None:
+        """Decode status of SA3-012M."""
+        simple_relay: list[SimpleRelay] = []
+        for relay in self.__trim_inels_status_ints(SA3_012M_DATA, RELAY):
+            simple_relay.append(SimpleRelay(is_on=((relay & 1) != 0)))
 
-                        self.__ha_value = new_object(
-                            shutters=shutters,
-                        )
+        digital_inputs = self.__trim_inels_status_bits(SA3_012M_DATA, SA3_012M)
 
-                        self.__inels_set_value = f"{RF_SHUTTER_STATE_SET[shutters[0].state]}\n00\n00\n"
-                elif self.__inels_type is RF_SHUTTER_UNIT:
-                    if self.inels_status_value is None:
-                        _LOGGER.info("inels_status_value was 'None' for %s", RF_SHUTTER_UNIT)
-                        self.__inels_set_value = DEVICE_TYPE_03_COMM_TEST
-                        self.__ha_value = None
-                    else:
-                        shutters_with_pos = []
-                        
-                        position = 100 - int(self.__trim_inels_status_values(DEVICE_TYPE_21_DATA, POSITION, ""), 16)
-
-                        shutter_val = int(self.__trim_inels_status_values(DEVICE_TYPE_21_DATA, SHUTTER, ""))
-                        shutter_val = ((shutter_val >> 1) & 1) | (shutter_val & 1) << 1 #swap bit 0 with bit 1
-
-                        if shutter_val == Shutter_state.Closed and position != 0:
-                            shutter_val = Shutter_state.Open
-
-                        if (self.__last_value is not None) and (shutter_val not in [Shutter_state.Open, Shutter_state.Closed]):
-                            shutter_val = self.__last_value.shutters[0].state
-
-
-                        shutters_with_pos.append(
-                            Shutter_pos(
-                                state=shutter_val,
-                                is_closed=shutter_val == Shutter_state.Closed,
-                                position=position,
-                                set_pos=False,
-                            )
-                        )
+        sw=[]
+        for i in range(8):
+            sw.append(digital_inputs[i])
+        for i in range(4):
+            sw.append(digital_inputs[i + 8])
 
-                        self.__ha_value = new_object(
-                            shutters_with_pos=shutters_with_pos,
-                        )
-                        self.__inels_set_value = f"{RF_SHUTTER_STATE_SET[shutters_with_pos[0].state]}\n00\n00\n"
-                elif self.__inels_type is JA3_018M:
-                    shutter_relays=[]
-                    for r in self.__trim_inels_status_bytes(JA3_018M_DATA, SHUTTER):
-                        shutter_relays.append((int(r, 16) & 1) != 0)
-                    
-                    simple_shutters = []
-                    shutters = list(zip(shutter_relays[::2], shutter_relays[1::2]))
-                    for s in shutters:
-                        if s[0]:
-                            state = Shutter_state.Open
-                        elif s[1]:
-                            state = Shutter_state.Closed
-                        else:
-                            state = Shutter_state.Stop_down
-                        simple_shutters.append(
-                            Shutter(
-                                state=state,
-                                is_closed=None
-                            )
-                        )
+        self.__ha_value = RelaySwitchValue(
+            simple_relay=simple_relay,
+            sw=sw,
+        )
+        set_val = ""
+        for r in simple_relay:
+            set_val += "07\n" if r.is_on else "06\n"
+        self.__inels_set_value=set_val
+
+    def __decode_sa3_014m(self) -> None:
+        """Decode status of SA3-014M."""
+        simple_relay: list[SimpleRelay] = []
+        for relay in self.__trim_inels_status_ints(SA3_014M_DATA, RELAY):
+            simple_relay.append(SimpleRelay(is_on=((relay & 1) != 0)))
+
+        digital_inputs = self.__trim_inels_status_bits(SA3_014M_DATA, SA3_014M)
+
+        sw = []
+        for i in range(8):
+            sw.append(digital_inputs[i])
+        for i in range(6):
+            sw.append(digital_inputs[i + 10])
+
+        self.__ha_value = RelaySwitchValue(
+            simple_relay=simple_relay,
+            sw=sw,
+        )
+        set_val = ""
+        for r in simple_relay:
+            set_val += "07\n" if r.is_on else "06\n"
+        self.__inels_set_value = set_val
+
+    def __decode_sa3_022m(self) -> None:
+        """Decode status of SA3-022M."""
+        fields = self.__decode_layout(SA3_022M_LAYOUT)
+        re = fields[RELAY]
+        overflows = fields[RELAY_OVERFLOW]
+        sw = fields[SW]
+
+        relay: list[Relay] = []
+        for i in range(len(re)):
+            relay.append(
+                Relay(
+                    is_on=re[i],
+                    overflow=overflows[i]
+                )
+            )
 
-                    interface=[]
-                    digital_inputs = self.__trim_inels_status_values(
-                        JA3_018M_DATA, SW, "")
-                    digital_inputs = f"0x{digital_inputs}"
-                    digital_inputs = f"{int(digital_inputs, 16):0>16b}"
-
-                    for i in range(8):
-                        interface.append(digital_inputs[7-i] == "1")
-                    for i in range(8):
-                        interface.append(digital_inputs[15-i] == "1")
-                    
-                    alerts = self.__trim_inels_status_values(
-                        JA3_018M_DATA, ALERT, "")
-                    alerts = f"0x{alerts}"
-                    alerts = f"{int(alerts, 16):0>8b}"
-
-                    for i in range(2):
-                        interface.append(alerts[7-i] == "1")
-
-                    alert_power = alerts[4]=="1"
-                    alert_comm = [
-                        alerts[3]=="1",
-                        alerts[2]=="1",
-                        alerts[1]=="1"
-                    ]
-                    
-                    overflows = self.__trim_inels_status_values(
-                        JA3_018M_DATA, RELAY_OVERFLOW, "")
-                    overflows = f"0x{overflows}"
-                    overflows = f"{int(overflows, 16):0>8b}"
-
-                    #TODO add overflows and alerts to the shutters
-                    relay_overflow=[]
-                    for i in range(8):
-                        relay_overflow.append(overflows[7-i] == "1")
-
-                    relay_overflow.append(alerts[0]=="1")
-
-                    #I'll register them as an interface and replace the names to SW 1 up/down, etc...
-
-                    self.__ha_value=new_object(
-                        simple_shutters=simple_shutters,
-                        interface=interface,
-
-                    )
-
-                    self.__inels_set_value = f"{''.join([SIMPLE_SHUTTER_STATE_SET[x.state] for x in simple_shutters])}"
-                elif self.__inels_type is JA3_014M:
-                    shutter_relays = []
-                    for r in self.__trim_inels_status_bytes(JA3_014M_DATA, SHUTTER):
-                        shutter_relays.append((int(r, 16) & 1) != 0)
-
-                    simple_shutters = []
-                    shutters = list(zip(shutter_relays[::2], shutter_relays[1::2]))
-
-                    for s in shutters:
-                        if s[0]:
-                            state = Shutter_state.Open
-                        elif s[1]:
-                            state = Shutter_state.Closed
-                        else:
-                            state = Shutter_state.Stop_down
-                        simple_shutters.append(
-                            Shutter(
-                                state=state,
-                                is_closed=None
-                            )
-                        )
+        shutter = fields[SHUTTER]
+
+        simple_shutters = []
+        shutters = list(zip(shutter[::2], shutter[1::2]))
+        for s in shutters:
+            if s[0]:
+                state = Shutter_state.Open
+            elif s[1]:
+                state = Shutter_state.Closed
+            else:
+                state = Shutter_state.Stop_down
+            simple_shutters.append(
+                Shutter(
+                    state=state,
+                    is_closed=None
+                )
+            )
 
-                    interface = []
-                    digital_inputs = self.__trim_inels_status_values(
-                        JA3_014M_DATA, SW, "")
-                    digital_inputs = f"0x{digital_inputs}"
-                    digital_inputs = f"{int(digital_inputs, 16):0>16b}"
-
-                    for i in range(8):
-                        interface.append(digital_inputs[7 - i] == "1")
-                    for i in range(6):
-                        interface.append(digital_inputs[13 - i] == "1")
-
-                    alerts = self.__trim_inels_status_values(
-                        JA3_014M_DATA, ALERT, "")
-                    alerts = f"0x{alerts}"
-                    alerts = f"{int(alerts, 16):0>8b}"
-
-                    for i in range(7):
-                        interface.append(alerts[6 - i] == "1")
-
-                    # alert_power = alerts[4] == "1"
-                    # alert_comm = [
-                    #     alerts[3] == "1",
-                    #     alerts[2] == "1",
-                    #     alerts[1] == "1"
-                    # ]
-
-                    overflows = self.__trim_inels_status_values(
-                        JA3_014M_DATA, RELAY_OVERFLOW, "")
-                    overflows = f"0x{overflows}"
-                    overflows = f"{int(overflows, 16):0>16b}"
-
-                    # TODO add overflows and alerts to the shutters
-                    relay_overflow = []
-                    for i in range(8):
-                        interface.append(overflows[7 - i] == "1")
-                    for i in range(6):
-                        interface.append(overflows[13 - i] == "1")
-
-                    # relay_overflow.append(alerts[0] == "1")
-
-                    # I'll register them as an interface and replace the names to SW 1 up/down, etc...
-
-                    self.__ha_value = new_object(
-                        simple_shutters=simple_shutters,
-                        interface=interface,
-
-                    )
-
-                    self.__inels_set_value = f"{''.join([SIMPLE_SHUTTER_STATE_SET[x.state] for x in simple_shutters])}"
-            elif self.__device_type is CLIMATE:  # thermovalve
-                if self.__inels_type is RF_WIRELESS_THERMOVALVE:
-                    # fetches all the status values and compacts them into a new object
-                    temp_current_hex = self.__trim_inels_status_values(
-                        DEVICE_TYPE_09_DATA, CURRENT_TEMP, ""
-                    )
-                    temp_current = int(temp_current_hex, 16) * 0.5
-                    temp_required_hex = self.__trim_inels_status_values(
-                        DEVICE_TYPE_09_DATA, REQUIRED_TEMP, ""
-                    )
-                    temp_required = int(temp_required_hex, 16) * 0.5
-                    battery = int(self.__trim_inels_status_values(
-                        DEVICE_TYPE_09_DATA, BATTERY, ""
-                    ), 16)
-                    open_to_hex = self.__trim_inels_status_values(
-                        DEVICE_TYPE_09_DATA, OPEN_IN_PERCENTAGE, ""
-                    )
-                    open_to_percentage = int(open_to_hex, 16) * 0.5
-
-                    climate_mode = Climate_modes.Off
-                    if temp_current < temp_required:
-                        climate_mode = Climate_modes.Heat
-
-                    
-
-                    self.__ha_value = new_object(
-                        low_battery=(battery!=0),
-                        thermovalve=new_object(
-                            current=temp_current,
-                            required=temp_required,
-                            climate_mode=climate_mode,
-                            current_action=current_action,
-                            open_in_percentage=open_to_percentage,
-                        )
-                    )             
-                elif self.__inels_type is VIRT_CONTR:
-                    temp_current = int(self.__trim_inels_status_values(
-                        DEVICE_TYPE_166_DATA, CURRENT_TEMP, ""
-                    ), 16)
-                    if temp_current == 0x7FFFFFFB:
-                        temp_current = 0
-                    else:
-                        temp_current /= 100
-                    temp_critical_max = int(self.__trim_inels_status_values( #check if 0x7F FF FF FB -> make it 50
-                        DEVICE_TYPE_166_DATA, CRITICAL_MAX_TEMP, ""
-                    ), 16) / 100
-                    temp_required_heat = int(self.__trim_inels_status_values(
-                        DEVICE_TYPE_166_DATA, REQUIRED_HEAT_TEMP, ""
-                    ), 16)
-                    if temp_required_heat == 0x7FFFFFFB:
-                        temp_required_heat = 0
-                    else:
-                        temp_required_heat /= 100
-                    temp_critical_min = int(self.__trim_inels_status_values( #check if 0x7F FF FF FB -> make it -50
-                        DEVICE_TYPE_166_DATA, CRITICAL_MIN_TEMP, ""
-                    ), 16) / 100
-                    temp_required_cool = int(self.__trim_inels_status_values(
-                        DEVICE_TYPE_166_DATA, REQUIRED_COOL_TEMP, ""
-                    ), 16)
-                    if temp_required_cool == 0x7FFFFFFB:
-                        temp_required_cool = 0
-                    else:
-                        temp_required_cool /= 100
-                    temp_correction = int(self.__trim_inels_status_values(
-                        DEVICE_TYPE_166_DATA, TEMP_CORRECTION, ""
-                    ), 16) / 100
-                    holiday_mode = int(self.__trim_inels_status_values(
-                        DEVICE_TYPE_166_DATA, PUBLIC_HOLIDAY, ""
-                    ), 16)
-                    control_mode = int(self.__trim_inels_status_values(
-                        DEVICE_TYPE_166_DATA, CONTROL_MODE, ""
-                    ))
-                    #0 -> user control [ONLY IMPLEMENT THIS ONE FOR NOW]
-                    #   Has presets (Schedule, Fav1-4 and manual temp)
-                    #1 -> 2 temp
-                    #2 -> single temp
-                    
-                    binary_vals = self.__trim_inels_status_values(
-                        DEVICE_TYPE_166_DATA, VIRT_CONTR, ""
-                    )
-                    binary_vals = f"0x{binary_vals}"
-                    binary_vals = f"{int(binary_vals, 16):0>8b}"
-                    
-                    controller_on = binary_vals[7] == "1" #if controller is on
-                    schedule_mode = binary_vals[6] == "1" # schedule or a set temperature
-                    heating_enabled = binary_vals[5] == "1" #if heating is connected
-                    cooling_enabled = binary_vals[4] == "1" #if cooling is connected
-                    vacation = binary_vals[3] == "1"
-                    regulator_disabled = binary_vals[2] == "1" #window detection is on (?)
-
-                    climate_mode = Climate_modes.Off 
-                    if controller_on: #TODO review all of this
-                        if control_mode == 0: #user control
-                            if heating_enabled:
-                                climate_mode = Climate_modes.Heat
-                            elif cooling_enabled:
-                                climate_mode = Climate_modes.Cool
-                        else:
-                            climate_mode = Climate_modes.Auto
-
-                    current_action = Climate_action.Off
-                    if controller_on:
-                        current_action = Climate_action.Idle
-                        # user controlled and two temp
-                        if control_mode == 0: # user control
-                            if climate_mode == Climate_modes.Heat and temp_current < temp_required_heat:
-                                current_action = Climate_action.Heating
-                            elif climate_mode == Climate_modes.Cool and temp_current > temp_required_cool:
-                                current_action = Climate_action.Cooling
-                        elif control_mode == 1: # two temp
-                            if temp_current < temp_required_heat:
-                                current_action = Climate_action.Heating
-                            elif temp_current > temp_required_cool:
-                                current_action = Climate_action.Cooling
-                        elif control_mode == 2: # one temp
-                            if temp_current < temp_required_heat:
-                                current_action = Climate_action.Heating
-                            else:
-                                current_action = Climate_action.Cooling
-                        
-                    # 1 -> schedule
-                    # 6 -> manual
-                    preset = 0 if schedule_mode else 5
-
-                    self.__ha_value = new_object(
-                        climate_controller=new_object(
-                            current=temp_current, #current_temperature
-                            
-                            required=temp_required_heat, #target_temperature / target_temperature_high
-                            required_cool=temp_required_cool, #target_temperature_low
-
-                            climate_mode=climate_mode, #hvac_mode: Off/Heat_cool/Heat/Cool
-                            # Off -> controller is turned off
-                            # Heat_cool -> follow temp range
-                            # Heat -> only heating
-                            # Cool -> only cooling
-
-                            current_action=current_action, #hvac_action: Off/Heating/Cooling/Idle 
-                            # Off -> controller is off
-                            # Heating -> heating is on
-                            # Cooling -> cooling is on
-                            # Idle -> temp is in range
-
-                            #non exposed
-                            critical_temp=temp_critical_max,
-                            correction_temp=temp_correction,
-                            public_holiday=holiday_mode,
-
-                            vacation=vacation,
-
-                            control_mode=control_mode,
-                            current_preset=preset,
+        valve = fields[VALVE]
+
+        self.__ha_value = SA3_022MValue(
+            relay=relay,
+            shutter_motors=shutter,
+            simple_shutters=simple_shutters,
+            valve=valve,
+            sw=sw,
+        )
+
+        set_val = ""
+        for r in self.ha_value.relay:
+            set_val += RELAY_SET[r.is_on]
+        # for s in self.ha_value.shutter_motors:
+        #     set_val += RELAY_SET[s]
+        for s in self.__ha_value.simple_shutters:
+            set_val += SIMPLE_SHUTTER_STATE_SET[s.state]
+        for v in self.ha_value.valve:
+            set_val += RELAY_SET[v]
+
+        self.__inels_set_value = set_val
+
+    def __decode_iou3_108m(self) -> None:
+        """Decode status of IOU3-108M."""
+        re=[]
+        for relay in self.__trim_inels_status_ints(IOU3_108M_DATA, RELAY):
+            re.append((relay & 1) != 0)
+
+        temps = self.__trim_inels_status_values(IOU3_108M_DATA, TEMP_IN, "")
+        temps = [temps[0:4], temps[4:8]]
+
+        digital_inputs = self.__trim_inels_status_bits(IOU3_108M_DATA, DIN)
+
+        din = []
+        for i in range(8):
+            din.append(digital_inputs[i])
+
+        digital_inputs = self.__trim_inels_status_bits(IOU3_108M_DATA, RELAY_OVERFLOW)
+
+        relay_overflow = []
+        for i in range(8):
+            relay_overflow.append(digital_inputs[1])
+
+        relay: list[Relay] = []
+        for i in range(8):
+            relay.append(
+                Relay(
+                    is_on=re[i],
+                    overflow=relay_overflow[i],
+                )
+            )
+
+        self.__ha_value = IOU3_108MValue(
+            relay=relay,
+            #re=re,
+            temps=temps,
+            din=din,
+            #relay_overflow=relay_overflow,
+        )
+
+    def __decode_rc3_610dali(self) -> None:
+        """Decode status of RC3-610DALI."""
+        #aout
+        aout_brightness=[]
+        for a in self.__trim_inels_status_ints(RC3_610DALI_DATA, AOUT):
+            aout_brightness.append(a)
+
+        #relays
+        re=[]
+        for relay in self.__trim_inels_status_ints(RC3_610DALI_DATA, RELAY):
+            re.append((relay & 1) != 0)
+
+        #temperatures
+        temps = []
+        temp_bytes = self.__trim_inels_status_bytes(
+            RC3_610DALI_DATA,
+            TEMP_IN,
+        )
+        for i in range(int(len(temp_bytes)/2)):
+            temps.append(temp_bytes[2*i] + temp_bytes[2*i+1])
+
+        #digital inputs
+        din=[]
+        digital_inputs = self.__trim_inels_status_bits(RC3_610DALI_DATA, DIN)
+
+        for i in range(6):
+            din.append(digital_inputs[i])
+
+        relay_overflow=[]
+        overflows = self.__trim_inels_status_bits(RC3_610DALI_DATA, RELAY_OVERFLOW)
+        for i in range(len(re)):
+            relay_overflow.append(overflows[i])
+
+        relay: list[Relay] = []
+        for i in range(len(re)):
+            relay.append(
+                Relay(
+                    is_on=re[i],
+                    overflow=relay_overflow[i],
+                )
+            )
+
+        sync_error = []
+        aout_coa = []
+        alerts = self.__trim_inels_status_bits(RC3_610DALI_DATA, ALERT)
+
+        for i in range(4):
+            sync_error.append(alerts[i])
+        for i in range(4, 6):
+            aout_coa.append(alerts[i])
+
+
+        aout=[]
+        for i in range(2):
+            aout.append(
+                AOUTLight(
+                    brightness=aout_brightness[i],
+                    aout_coa=aout_coa[i]
+                )
+            )
+
+        alert_dali_power = alerts[6]
+        alert_dali_communication = alerts[7]
+
+        dali_raw = self.__trim_inels_status_bytes(
+            RC3_610DALI_DATA, DALI)
+        dali = []
+        for d in dali_raw:
+            dali.append(
+                DALILight(
+                    brightness=int(d, 16),
+                    alert_dali_communication=alert_dali_communication,
+                    alert_dali_power=alert_dali_power,
+                )
+            )
+
+        self.__ha_value = RC3_610DALIValue(
+            relay=relay,
+            temps=temps,
+            din=din,
+            aout=aout,
+            dali=dali,
+        )
+
+    def __decode_fa3_612m(self) -> None:
+        """Decode status of FA3-612M."""
+        inputs = self.__trim_inels_status_bits(FA3_612M_DATA, FA3_612M)
+
+        din = []
+        for i in range(3):
+            din.append(inputs[i])
+
+        aout_coa = []
+        for i in range(4, 8):
+            aout_coa.append(inputs[i])
+
+        sw = []
+        for i in range(8):
+            sw.append(inputs[i + 8])
+
+        roa = []
+        for i in range(3):
+            roa.append(inputs[i + 16])
+
+        sw.append(inputs[19])
+
+        overflows = self.__trim_inels_status_bits(FA3_612M_DATA, RELAY_OVERFLOW)
+
+        #relay_overflow = []
+        #for i in range(8):
+        #    relay_overflow.append(overflows[i])
+
+        i=0
+        aout=[]
+        for a in self.__trim_inels_status_bytes(FA3_612M_DATA, AOUT):
+            aout.append(
+                AOUTLight(
+                    brightness=int(a, 16),
+                    aout_coa=aout_coa[i],
+                )
+            )
+            i = i + 1
+
+        re=[]
+        for relay in self.__trim_inels_status_ints(FA3_612M_DATA, RELAY):
+            re.append((relay & 1) != 0)
+
+        valves = [[re[0], re[1]], [re[2], re[3]]]
+        fan_speed = 0
+        if re[6]: #speed 3
+            fan_speed = 3
+        elif re[5]: #speed 2
+            fan_speed = 2
+        elif re[4]: #speed 1
+            fan_speed = 1
+
+        heating_out = re[7]
+
+        ains=[]
+        ain_bytes = self.__trim_inels_status_bytes(
+            FA3_612M_DATA,
+            AIN,
+        )
+        for i in range(int(len(ain_bytes)/4)):
+            ains.append(ain_bytes[4*i] + ain_bytes[4*i+1] + ain_bytes[4*i+2] + ain_bytes[4*i+3])
+
+        last_status_val=self.inels_status_value
+
+        self.__ha_value = FA3_612MValue(
+            din=din,
+            sw=sw,
+            aout=aout,
+            valves=valves,
+            fan_speed=fan_speed,
+            heating_out=heating_out,
+            ains=ains,
+            last_status_val=last_status_val,
+        )
+
+    def __decode_card_reader(self) -> None:
+        """Decode status of GCR3-11, GCH3-31."""
+        state = self.__trim_inels_status_bits(CARD_DATA, STATE)
+
+        simple_relay: list[SimpleRelay] = []
+        simple_relay.append(SimpleRelay(is_on=state[2]))
+
+        card_present = (state[3])
+
+        card_id = self.__trim_inels_status_values(CARD_DATA, CARD_ID, "")
+        card_id_int = int(card_id, 16)
+        #if card removed before 
+        if card_id_int == 0 and self.__last_value is not None:
+            card_id = self.__last_value.card_id
+
+        interface = [
+            state[7],
+            state[11],
+            state[13]
+        ]
+
+        light_in = self.__trim_inels_status_values(CARD_DATA, LIGHT_IN, "")
+
+        temp_in = self.__trim_inels_status_values(CARD_DATA, TEMP_IN, "")
+        self.__ha_value = CardReaderValue(
+            simple_relay=simple_relay,
+            interface=interface,
+            temp_in=temp_in,
+            card_present=card_present,
+            card_id=card_id,
+        )
+
+    def __decode_bits(self) -> None:
+        """Decode status of BITS."""
+        bit: list[Bit] = []
+        for addr, val in parse_formated_json(self.__inels_status_value):
+            bit.append(
+                Bit(
+                    is_on=val, addr=addr
+                )
+            )
+
+        self.__ha_value = BitsValue(
+            bit=bit,
+        )
+
+        set_val = {}
+        for bit in self.ha_value.bit:
+            set_val[bit.addr] = bit.is_on
+
+        self.__inels_set_value = json.dumps({"cmd": set_val})
+
+    def __decode_number(self) -> None:
+        """Decode status of virtual integers."""
+        number: list[Number] = []
+        for addr, val in parse_formated_json(self.__inels_status_value):
+            number.append(
+                Number(
+                    value=val, addr=addr
+                )
+            )
+
+        self.__ha_value = NumberValue(
+            number=number,
+        )
+
+        set_val = {}
+        for number in self.ha_value.number:
+            set_val[number.addr] = number.value
+
+        self.__inels_set_value = json.dumps({"cmd": set_val})
+
+    def __decode_rf_temperature_input(self) -> None:
+        """Decode status of Temperature input."""
+        battery = self.__trim_inels_status_int(DEVICE_TYPE_10_DATA, BATTERY)
+        temp_in = self.__trim_inels_status_values(DEVICE_TYPE_10_DATA, TEMP_IN, "")
+        temp_out = self.__trim_inels_status_values(DEVICE_TYPE_10_DATA, TEMP_OUT, "")
+
+        self.__ha_value = BatteryTempValue(
+            low_battery=(battery!=0),
+            temp_in=temp_in,
+            temp_out=temp_out,
+        )
+
+    def __decode_rf_thermostat(self) -> None:
+        """Decode status of Thermostat."""
+        temp_in = self.__trim_inels_status_int(DEVICE_TYPE_12_DATA, TEMP_IN) * 0.5
+        battery = self.__trim_inels_status_int(DEVICE_TYPE_12_DATA, BATTERY)
+        # has 2 values, 0x80 and 0x81 on which 0x81 means low battery
+
+        self.__ha_value = BatteryTempInValue(
+            low_battery=(battery == 0x81),
+            temp_in=temp_in,
+        )
+
+    def __decode_rf_flood_detector(self) -> None:
+        """Decode status of Flood detector."""
+        state = self.__trim_inels_status_bits(DEVICE_TYPE_15_DATA, STATE)
+
+        ain = self.__trim_inels_status_int(DEVICE_TYPE_15_DATA, AIN) /100
+
+        low_battery=state[0]
+        flooded=state[7]
+        ains=[]
+        ains.append(ain)
+        self.__ha_value = FloodDetectorValue(
+            low_battery=low_battery,
+            flooded=flooded,
+            ains=ains,
+        )
+
+    def __decode_rf_detector(self) -> None:
+        """Decode status of Detector."""
+        state = self.__trim_inels_status_bits(DEVICE_TYPE_16_DATA, STATE)
+
+
+        low_battery=state[3]
+        detected=state[4]
+        tamper=state[6]
+
+        self.__ha_value = DetectorValue(
+            low_battery=low_battery,
+            detected=detected,
+            tamper=tamper,
+        )
+
+    def __decode_rf_motion_detector(self) -> None:
+        """Decode status of Motion detector."""
+        state = self.__trim_inels_status_bits(DEVICE_TYPE_16_DATA, STATE)
+
+        low_battery=state[3]
+        motion=state[4]
+        tamper=state[6]
+
+        self.__ha_value = MotionDetectorValue(
+            low_battery=low_battery,
+            motion=motion,
+            tamper=tamper,
+        )
+
+    def __decode_rf_temperature_humidity_sensor(self) -> None:
+        """Decode status of Temperature and humidity sensor."""
+        battery = self.__trim_inels_status_int(DEVICE_TYPE_29_DATA, BATTERY)
+        temp_in = self.__trim_inels_status_values(DEVICE_TYPE_29_DATA, TEMP_IN, "")
+        humidity = self.__trim_inels_status_int(DEVICE_TYPE_29_DATA, HUMIDITY)
+
+        self.__ha_value = BatteryHumidityValue(
+            low_battery=(battery!=0),
+            temp_in=temp_in,
+            humidity=humidity,
+        )
+
+    def __decode_grt3_50(self) -> None:
+        """Decode status of GRT3-50."""
+        digital_inputs = self.__trim_inels_status_bits(GRT3_50_DATA, GRT3_50)
+
+        plusminus = self.__trim_inels_status_bits(GRT3_50_DATA, PLUS_MINUS_BUTTONS)
+
+        temp_in = self.__trim_inels_status_values(GRT3_50_DATA, TEMP_IN, "")
+
+        light_in = self.__trim_inels_status_values(GRT3_50_DATA, LIGHT_IN, "")
+
+        ain = self.__trim_inels_status_values(GRT3_50_DATA, AIN, "")
+
+        humidity = self.__trim_inels_status_values(GRT3_50_DATA, HUMIDITY, "")
+
+        dewpoint = self.__trim_inels_status_values(GRT3_50_DATA, DEW_POINT, "")
+
+
+        self.__ha_value = GRT3_50Value(
+            # digital inputs
+            din=[# 2
+                digital_inputs[0], #bit 0
+                digital_inputs[1],
+            ],
+            interface=[# 5
+                digital_inputs[2],
+                digital_inputs[3],
+                digital_inputs[4],
+                digital_inputs[5],
+                digital_inputs[6], #6
+                plusminus[0], # plus
+                plusminus[1], # minus
+            ],
+
+            temp_in=temp_in,
+
+            light_in=light_in,
+
+            ain=ain,
+
+            humidity=humidity,
+
+            dewpoint=dewpoint,
+
+            # backlit
+            backlit=False,
+        )
+
+    def __decode_wsb3(self) -> None:
+        """Decode status of WSB3-20, WSB3-40."""
+        switches = self.__trim_inels_status_bits(WSB3_240_DATA, SW)
+
+        digital_inputs = self.__trim_inels_status_bits(WSB3_240_DATA, DIN)
+
+        interface=[] #up/down buttons
+        for i in range(WSB3_AMOUNTS[self.__inels_type]):
+            interface.append(switches[i])
+
+        din=[]
+        for i in range(2):
+            din.append(digital_inputs[i])
+
+        temp_in=self.__trim_inels_status_values(
+            WSB3_240_DATA, TEMP_IN, ""
+        )
+        ain=self.__trim_inels_status_values(
+            WSB3_240_DATA, AIN, ""
+        )
+
+        self.__ha_value = WallSwitchValue(
+            interface=interface,
+            din=din,
+            temp_in=temp_in,
+            ain=ain,
+        )
+
+    def __decode_wsb3_hum(self) -> None:
+        """Decode status of WSB3-20H, WSB3-40H."""
+        switches = self.__trim_inels_status_bits(WSB3_240HUM_DATA, SW)
+
+
+        digital_inputs = self.__trim_inels_status_bits(WSB3_240HUM_DATA, DIN)
+        interface=[] #up/down buttons
+        din=[]
+        for i in range(WSB3_AMOUNTS[self.__inels_type]):
+            interface.append(switches[i])
+        for i in range(2):
+            din.append(digital_inputs[i])
+
+        temp_in = self.__trim_inels_status_values(WSB3_240HUM_DATA, TEMP_IN, "")
+
+        ain = self.__trim_inels_status_values(WSB3_240HUM_DATA, AIN, "")
+
+        humidity = self.__trim_inels_status_values(WSB3_240HUM_DATA, HUMIDITY, "")
+
+        dewpoint = self.__trim_inels_status_values(WSB3_240HUM_DATA, DEW_POINT, "")
+
+        self.__ha_value = WallSwitchHumidityValue(
+            interface=interface,
+            din=din,
+            temp_in=temp_in,
+            ain=ain,
+            humidity=humidity,
+            dewpoint=dewpoint,
+        )
+
+    def __decode_im3_240b(self) -> None:
+        """Decode status of IM3-20B, IM3-40B."""
+        binary_input = []
+        inputs = self.__trim_inels_status_bits(IM3_240B_DATA, IN)
+        for i in range(IM3_AMOUNTS[self.__inels_type]):
+            binary_input.append(2*inputs[2*i + 1] + inputs[2*i])
+
+        temp = self.__trim_inels_status_values(IM3_240B_DATA, TEMP_IN, "")
+        self.__ha_value = InputTempInValue(
+            input=binary_input,
+            temp_in=temp,
+        )
+
+    def __decode_im3_80b(self) -> None:
+        """Decode status of IM3-80B."""
+        binary_input = []
+        binary_input2 = []
+        inputs = self.__trim_inels_status_bits(IM3_80B_DATA, IN)
+        for i in range(4):
+            binary_input.append(2*inputs[2*i + 1] + inputs[2*i])
+            binary_input2.append(2*inputs[2*i + 9] + inputs[2*i + 8])
+        binary_input.extend(binary_input2)
+
+        temp = self.__trim_inels_status_values(IM3_80B_DATA, TEMP_IN, "")
+        self.__ha_value = InputTempValue(
+            input=binary_input,
+            temp=temp,
+        )
+
+    def __decode_im3_140m(self) -> None:
+        """Decode status of IM3-140M."""
+        binary_input = []
+        binary_input2 = []
+        binary_input3 = []
+        inputs = self.__trim_inels_status_bits(IM3_140M_DATA, IN)
+
+        for i in range(4):
+            binary_input.append(2*inputs[2*i + 1] + inputs[2*i])
+            binary_input2.append(2*inputs[2*i + 9] + inputs[2*i + 8])
+            binary_input3.append(2*inputs[2*i + 17] + inputs[2*i + 16])
+        binary_input.extend(binary_input2)
+        binary_input.extend(binary_input3)
+
+        for i in range(2):
+            binary_input.append(2*inputs[2*i + 25] + inputs[2*i + 24])
+
+        self.__ha_value = InputValue(
+            input=binary_input
+        )
+
+    def __decode_dmd3_1(self) -> None:
+        """Decode status of DMD3-1."""
+        light_in = self.__trim_inels_status_values(DMD3_1_DATA, LIGHT_IN, "")
+        temp_in = self.__trim_inels_status_values(DMD3_1_DATA, TEMP_IN, "")    
+        humidity = self.__trim_inels_status_values(DMD3_1_DATA, HUMIDITY, "")
+        motion = self.__trim_inels_status_bits(DMD3_1_DATA, DMD3_1)
+
+        motion=motion[0]
+
+        self.__ha_value = DMD3_1Value(
+            light_in=light_in,
+            temp_in=temp_in,
+            humidity=humidity,
+            motion=motion,
+        )
+
+    def __decode_adc3_60m(self) -> None:
+        """Decode status of ADC3-60M."""
+        ains=[]
+        ain_bytes = self.__trim_inels_status_bytes(
+            ADC3_60M_DATA, AIN,
+        )
+        for i in range(int(len(ain_bytes)/4)):
+            ains.append(ain_bytes[4*i] + ain_bytes[4*i+1] + ain_bytes[4*i+2] + ain_bytes[4*i+3])
+
+        self.__ha_value = AnalogInputValue(
+            ains=ains,
+        )
+
+    def __decode_ti3(self) -> None:
+        """Decode status of TI3-10B, TI3-40B, TI3-60M."""
+        temps = []
+        temp_bytes = self.__trim_inels_status_bytes(
+            INELS_DEVICE_TYPE_DATA_STRUCT_DATA[self.__inels_type],
+            TEMP_IN,
+        )
+
+        for i in range(int(len(temp_bytes)/2)):
+            temps.append(temp_bytes[2*i] + temp_bytes[2*i+1])
+
+        self.__ha_value = TempsValue(
+            temps=temps
+        )
+
+    def __decode_idrt3_1(self) -> None:
+        """Decode status of IDRT3-1."""
+        inputs = self.__trim_inels_status_bits(IDRT3_1_DATA, SW)
+
+        interface = []
+        din = []
+        for i in range(2):
+            din.append(inputs[i])
+            interface.append(inputs[i + 2])
+
+        temp_in = self.__trim_inels_status_values(IDRT3_1_DATA, TEMP_IN, "")
+        temp_out = self.__trim_inels_status_values(IDRT3_1_DATA, TEMP_OUT, "")
+
+        self.__ha_value = IDRT3_1Value(
+            interface=interface,
+            din=din,
+            temp_in=temp_in,
+            temp_out=temp_out,
+        )
+
+    def __decode_gsb3_v2(self) -> None:
+        """Decode status of GSB3 V2 and MSB3 button arrays."""
+        fields = self.__decode_layout(GSB3_V2_LAYOUT)
+        switches = fields[SW]
+        digital_inputs = fields[DIN]
+
+        interface=[]
+
+        # Determine the number of buttons to process based on INTERFACE_BUTTON_COUNT
+        gsb3_amount = GSB3_AMOUNTS[self.__inels_type]
+        num_buttons = gsb3_amount if gsb3_amount < 8 else gsb3_amount - 1
+
+        # Append states from 'switches' based on the number of buttons
+        for i in range(num_buttons):
+            interface.append(switches[i])
+
+        # If there are 8 or more buttons, use the last digital input for the button
+        if gsb3_amount >= 8:
+            interface.append(digital_inputs[0])
+
+        din=[digital_inputs[1]]
+        prox=digital_inputs[3]
+
+        temp_in = fields[TEMP_IN]
+
+        light_in = fields[LIGHT_IN]
+
+        ain = fields[AIN]
+
+        humidity = fields[HUMIDITY]
+
+        dewpoint = fields[DEW_POINT]
+
+        self.__ha_value = GlassControllerV2Value(
+            interface=interface,
+            din=din,
+            prox=prox,
+            temp_in=temp_in,
+            light_in=light_in,
+            ain=ain,
+            humidity=humidity,
+            dewpoint=dewpoint,
+        )
+
+    def __decode_rf_dimmer(self) -> None:
+        """Decode status of Single dimmer, Dimmer."""
+        if self.__inels_status_value is None:
+            _LOGGER.info("inels_status_value was None for RFDAC")
+            self.__inels_set_value = DEVICE_TYPE_05_COMM_TEST
+            self.__ha_value = None
+        else:
+            brightness = self.__trim_inels_status_int(DEVICE_TYPE_05_DATA, RF_DIMMER)
+            brightness = int((((0xFFFF - brightness) - 10000)/1000)*5)
+            brightness = round(brightness, -1)
+
+            simple_light = []
+            simple_light.append(
+                SimpleLight(brightness=brightness)
+            )
+            self.__ha_value = SimpleLightValue(simple_light=simple_light)
+
+    def __decode_rf_dimmer_rgb(self) -> None:
+        """Decode status of RGB dimmer."""
+        if self.__inels_status_value is None:
+            _LOGGER.info("inels_status_value was None for %s", RF_DIMMER_RGB)
+            self.__inels_set_value = DEVICE_TYPE_13_COMM_TEST
+            self.__ha_value = None
+        else:
+            red = self.__trim_inels_status_int(DEVICE_TYPE_06_DATA, RED)
+            green = self.__trim_inels_status_int(DEVICE_TYPE_06_DATA, GREEN)
+            blue = self.__trim_inels_status_int(DEVICE_TYPE_06_DATA, BLUE)
+            brightness = int(self.__trim_inels_status_int(DEVICE_TYPE_06_DATA, OUT)* 100.0/255.0)
+
+            rgb=[]
+            rgb.append(
+                RGBLight(
+                    r=red,
+                    g=green,
+                    b=blue,
+                    brightness=brightness,
+                )
+            )
+
+            self.__ha_value=RGBLightValue(
+                rgb=rgb
+            )
+
+    def __decode_rf_light_bulb(self) -> None:
+        """Decode status of Light bulb."""
+        if self.__inels_status_value is None:
+            _LOGGER.info("inels_status_value was None for %s", RF_LIGHT_BULB)
+            self.__inels_set_value = DEVICE_TYPE_13_COMM_TEST
+            self.__ha_value = None
+        else:
+            warm_light = []
+            warm_light.append(
+                WarmLight(
+                        brightness=round(
+                            self.__trim_inels_status_int(DEVICE_TYPE_13_DATA, OUT) * 100.0/255.0
                         ),
-                    )
-                elif self.__inels_type is VIRT_HEAT_REG:
-                    state=int(self.__trim_inels_status_values(
-                        VIRT_REG_DATA, STATE, ""
-                    ), 16)
-                    
-                    reg=self.__trim_inels_status_values(
-                        VIRT_REG_DATA, VIRT_HEAT_REG, ""
-                    )
-                    reg = f"{int(reg, 16):0>8b}"
-
-                    heat_reg=reg[7] == "1"
-                    heat_source = reg[6] == "1"
-                    
-                    self.__ha_value = new_object(
-                        heating_out = heat_reg
-                    )
-                elif self.__inels_type is VIRT_COOL_REG:
-                    state=int(self.__trim_inels_status_values(
-                        VIRT_REG_DATA, STATE, ""
-                    ), 16)
-                    
-                    reg=self.__trim_inels_status_values(
-                        VIRT_REG_DATA, VIRT_HEAT_REG, ""
-                    )
-                    reg = f"{int(reg, 16):0>8b}"
-
-                    cool_reg=reg[7] == "1"
-                    cool_source = reg[6] == "1"
-                    
-                    self.__ha_value = new_object(
-                        cooling_out=cool_reg,
-                    )
-            elif self.__device_type is BUTTON:
-                if self.__inels_type is RF_CONTROLLER:
-                    if self.__inels_status_value is None:
-                        #No connection can be made, so just communicate low battery
-                        self.__ha_value = new_object(
-                            low_battery = True,
-                            btn = [False, False, False, False]
-                        )
-                    else:
-                        state = self.__trim_inels_status_values(DEVICE_TYPE_19_DATA, STATE, "")
-                        state_hex_str = f"0x{state}"  # 0xSTATE
-                        # interpret the value and write it in binary
-                        state_bin_str = f"{int(state_hex_str, 16):0>8b}"
-
-                        # read which button was last pressed
-                        identity = self.__trim_inels_status_values(
-                            DEVICE_TYPE_19_DATA, IDENTITY, ""
+                        relative_ct=round(
+                            self.__trim_inels_status_int(DEVICE_TYPE_13_DATA, WHITE) * 100.0/255.0
                         )
+                    ),
+                )
 
+            self.__ha_value=WarmLightValue(warm_light=warm_light)
 
-                        #NEW
-                        low_battery = state_bin_str[4] == "1" # 1 -> low
-                        pressed = state_bin_str[3] == "1"
-                        if self.__last_value is None:
-                            btn = [
-                                False,
-                                False,
-                                False,
-                                False,
-                            ]
-                        else:
-                            btn = self.__last_value.ha_value.btn
-
-                        if identity in BUTTON_NUMBER:
-                            number = BUTTON_NUMBER[identity]
-                            if number <= 4:
-                                btn[number-1] = pressed
-
-                        self.__ha_value = new_object(
-                            low_battery=low_battery,
-                            btn=btn
-                        )
-                elif self.__inels_type is RF_2_BUTTON_CONTROLLER:
-                    if self.__inels_status_value is None:
-                        self.__ha_value = new_object(
-                            low_battery=True,
-                            btn=[False, False]
-                        )
-                    else:
-                        state = self.__trim_inels_status_values(DEVICE_TYPE_19_DATA, STATE, "")
-                        state = f"0x{state}"  # 0xSTATE
-                        state = f"{int(state, 16):0>8b}"
-
-                        identity = self.__trim_inels_status_values(DEVICE_TYPE_19_DATA, IDENTITY, "")
-
-                        low_battery = state[4] == "1"
-                        pressed = state[3] == "1"
-                        if self.__last_value is None:
-                            btn = [False, False]
-                        else:
-                            btn = self.__last_value.ha_value.btn
-                        
-                        if identity in BUTTON_NUMBER:
-                            number = BUTTON_NUMBER[identity]
-                            if number <= 2:
-                                btn[number-1] = pressed
-
-                        self.__ha_value = new_object(
-                            low_battery=low_battery,
-                            btn=btn,
-                        )
-                elif self.__inels_type is GSB3_90SX:
-                    digital_inputs = self.__trim_inels_status_values(
-                        GSB3_90SX_DATA, GSB3_90SX, "")
-                    digital_inputs = f"0x{digital_inputs}"
-                    digital_inputs = f"{int(digital_inputs, 16):0>16b}"
-                    
-                    
-                    temp = self.__trim_inels_status_values(
-                        GSB3_90SX_DATA, TEMP_IN, "")
-
-                    light_in = self.__trim_inels_status_values(
-                        GSB3_90SX_DATA, LIGHT_IN, "")
-
-                    ain = self.__trim_inels_status_values(
-                        GSB3_90SX_DATA, AIN, "")
-
-                    humidity = self.__trim_inels_status_values(
-                        GSB3_90SX_DATA, HUMIDITY, "")
-
-                    dewpoint = self.__trim_inels_status_values(
-                        GSB3_90SX_DATA, DEW_POINT, "")
-
-                    self.__ha_value = new_object(
-                        interface=[
-                            digital_inputs[7] == "1",#0
-                            digital_inputs[6] == "1",
-                            digital_inputs[5] == "1",
-                            digital_inputs[4] == "1",
-                            digital_inputs[3] == "1",
-                            digital_inputs[2] == "1",
-                            digital_inputs[1] == "1",
-                            digital_inputs[0] == "1",
-                            digital_inputs[15] == "1",#8
-                        ],
-                        din=[
-                            digital_inputs[14] == "1",#9
-                            digital_inputs[13] == "1",#10
-                        ],
-                        prox=digital_inputs[12] == "1",#11
-
-                        # Actually important:
-                        # temperature
-                        temp_in=temp,
-
-                        # light in
-                        light_in=light_in,
-
-                        # AIN
-                        ain=ain,
-
-                        # humidity
-                        humidity=humidity,
-
-                        # dewpoint
-                        dewpoint=dewpoint,
-
-                        # disabled
-                        disabled=False,
-                        # backlit
-                        backlit=False,
-                    )
-                elif self.__inels_type in [GSB3_20SX, GSB3_40SX, GSB3_60SX, GBP3_60]:
-                    switches = self.__trim_inels_status_values(
-                        GLASS_CONTROLLER_DATA, SW, "")
-                    switches = f"0x{switches}"
-                    switches = f"{int(switches, 16):0>8b}"
-                    
-                    digital_inputs = self.__trim_inels_status_values(
-                        GLASS_CONTROLLER_DATA, SW, "")
-                    digital_inputs = f"0x{digital_inputs}"
-                    digital_inputs = f"{int(digital_inputs, 16):0>8b}"
-                    
-                    interface = []
-                    for i in range(GSB3_AMOUNTS[self.__inels_type]):
-                        interface.append(switches[7-i] == "1")
-                    
-                    din = []
-                    for i in range(2):
-                        din.append(digital_inputs[7-i] == "1")
-                    
-                    temp = self.__trim_inels_status_values(
-                        GLASS_CONTROLLER_DATA, TEMP_IN, "")
-
-                    light_in = self.__trim_inels_status_values(
-                        GLASS_CONTROLLER_DATA, LIGHT_IN, "")
-
-                    ain = self.__trim_inels_status_values(
-                        GLASS_CONTROLLER_DATA, AIN, "")
-
-                    self.__ha_value = new_object(
-                        interface=interface,
-                        din=din,
-                        # temperature
-                        temp_in=temp,
-
-                        # light in
-                        light_in=light_in,
-
-                        # AIN
-                        ain=ain,
-                    )
-                elif self.__inels_type is GSP3_100:
-                    switches = self.__trim_inels_status_values(
-                        GLASS_CONTROLLER_DATA, SW, "")
-                    switches = f"0x{switches}"
-                    switches = f"{int(switches, 16):0>8b}"
-                    
-                    digital_inputs = self.__trim_inels_status_values(
-                        GLASS_CONTROLLER_DATA, SW, "")
-                    digital_inputs = f"0x{digital_inputs}"
-                    digital_inputs = f"{int(digital_inputs, 16):0>8b}"
-
-                    interface = []
-                    for i in range(8):
-                        interface.append(switches[7-i] == "1")
-                    din = []
-                    for i in range(2):
-                        interface.append(digital_inputs[7-i]=="1")
-                        din.append(digital_inputs[5-i]=="1")
-                    
-                    temp_in = self.__trim_inels_status_values(GLASS_CONTROLLER_DATA, TEMP_IN, "")
-                    light_in = self.__trim_inels_status_values(GLASS_CONTROLLER_DATA, LIGHT_IN, "")
-                    ain = self.__trim_inels_status_values(GLASS_CONTROLLER_DATA, AIN, "")
-                    self.__ha_value = new_object(
-                        interface=interface,
-                        din=din,
-                        temp_in=temp_in,
-                        light_in=light_in,
-                        ain=ain,
-                    )
-                elif self.__inels_type is GDB3_10:
-                    switches = self.__trim_inels_status_values(
-                        GLASS_CONTROLLER_DATA, SW, "")
-                    switches = f"0x{switches}"
-                    switches = f"{int(switches, 16):0>8b}"
-                    
-                    digital_inputs = self.__trim_inels_status_values(
-                        GLASS_CONTROLLER_DATA, DIN, "")
-                    digital_inputs = f"0x{digital_inputs}"
-                    digital_inputs = f"{int(digital_inputs, 16):0>8b}"
-
-                    interface = []
-                    din = []
-                    for i in range(3):
-                        interface.append(switches[6-2*i]=="1")
-                    for i in range(2):
-                        din.append(digital_inputs[7-i]=="1")
-                    
-                    temp_in = self.__trim_inels_status_values(GLASS_CONTROLLER_DATA, TEMP_IN, "")
-                    light_in = self.__trim_inels_status_values(GLASS_CONTROLLER_DATA, LIGHT_IN, "")
-                    ain = self.__trim_inels_status_values(GLASS_CONTROLLER_DATA, AIN, "")
-                    self.__ha_value = new_object(
-                        interface=interface,
-                        din=din,
-                        temp_in=temp_in,
-                        light_in=light_in,
-                        ain=ain,
-                    )
-        except Exception as err:
-            _LOGGER.error("Error making HA value for device of type '%s', status value was '%s'", self.__inels_type, None if not self.inels_status_value else self.inels_status_value.replace("\n", " "))
-            self.__ha_value = dummy_val
-            #raise
+    def __decode_da3_22m(self) -> None:
+        """Decode status of DA3-22M."""
+        temp = self.__trim_inels_status_values(DA3_22M_DATA, TEMP_IN, "")
+
+        state_bits = self.__trim_inels_status_bits(DA3_22M_DATA, DA3_22M)
+
+        toa=[ # thermal overload alarm
+            state_bits[4],
+            state_bits[5],
+        ]
+        coa=[ # current overload alrm
+            state_bits[6], #6
+            state_bits[7], #7
+        ]
+
+        out1 = int(
+            self.__trim_inels_status_values(
+                DA3_22M_DATA, DIM_OUT_1, ""
+            ), 16
+        )
+
+        out2 = int(
+            self.__trim_inels_status_values(
+                DA3_22M_DATA, DIM_OUT_2, ""
+            ), 16
+        )
+        out1 = out1 if out1 <= 100 else 100
+        out2 = out2 if out2 <= 100 else 100
+        out = [out1, out2]
+
+        light_coa_toa = []
+        for i in range(2):
+            light_coa_toa.append(
+                LightCoaToa(
+                    brightness=out[i],
+                    toa=toa[i],
+                    coa=coa[i],
+                )
+            )
+
+        self.__ha_value = DA3_22MValue(
+            #May not be that interesting for HA
+            sw=[
+                state_bits[0], #0
+                state_bits[1], #1
+            ],
+            din=[
+                state_bits[2],
+                state_bits[3]
+            ],
+
+            temp_in=temp,
+            light_coa_toa=light_coa_toa,
+        )
+
+        set_val = "00\n00\n00\n00\n"
+        for i in range(len(self.__ha_value.light_coa_toa)):
+            set_val +=  f"{self.__ha_value.light_coa_toa[i].brightness:02X}\n"
+        self.__inels_set_value = set_val
+
+    def __decode_dac3_04b(self) -> None:
+        """Decode status of DAC3-04B."""
+        temp_out = self.__trim_inels_status_values(DAC3_04_DATA, TEMP_OUT, "")
+
+        aout_alert = self.__trim_inels_status_int(DAC3_04_DATA, ALERT) != 0
+
+        aout_str = self.__trim_inels_status_bytes(DAC3_04_DATA, OUT)
+        aout = []
+        for d in aout_str:
+            d = int(d, 16)
+            d = d if d <= 100 else 100
+            aout.append(
+                AOUTLight(
+                    brightness=d,
+                    aout_coa=aout_alert,
+                )
+            )
+
+        self.__ha_value = DAC3_04Value(
+            temp_out=temp_out,
+            aout=aout,
+        )
+
+        set_val = "00\n" * 4
+        for d in aout:
+            set_val += f"{d.brightness:02X}\n"
+
+    def __decode_dac3_04m(self) -> None:
+        """Decode status of DAC3-04M."""
+        temp_out = self.__trim_inels_status_values(DAC3_04_DATA, TEMP_OUT, "")
+
+        aout_alert_bits = self.__trim_inels_status_bits(DAC3_04_DATA, ALERT)
+        aout_coa=[]
+        for i in range(4):
+            aout_coa.append(aout_alert_bits[i + 1]) #skip first bit
+
+        aout_str = self.__trim_inels_status_bytes(DAC3_04_DATA, OUT)
+        aout_val = []
+        for d in aout_str:
+            d = int(d, 16)
+            d = d if d <= 100 else 100
+            aout_val.append(d)
+
+        aout=[]
+        for i in range(4):
+            aout.append(
+                AOUTLight(
+                    brightness=aout_val[i],
+                    aout_coa=aout_coa[i],
+                )
+            )
+
+        self.__ha_value = DAC3_04Value(
+            temp_out=temp_out,
+            aout=aout,
+        )
+
+        set_val = "00\n" * 4
+        for d in aout:
+            set_val += f"{d.brightness:02X}\n"
+
+    def __decode_dcda_33m(self) -> None:
+        """Decode status of DCDA-33M."""
+        digital_inputs = self.__trim_inels_status_bits(DCDA_33M_DATA, ALERT)
+
+        sw = []
+        coa = []
+        for i in range(3):
+            sw.append(digital_inputs[i])
+            coa.append(digital_inputs[i + 3])
+
+        coa.append(False) #only 3 alerts, so I fake the last one
+
+        aout_val=[]
+        aouts = self.__trim_inels_status_bytes(DCDA_33M_DATA, OUT)
+        for i in range(len(aouts)):
+            brightness = int(aouts[i], 16)
+            brightness = brightness if brightness < 100 else 100
+            aout_val.append(brightness)
+
+        aout=[]
+        for i in range(4):
+            aout.append(AOUTLight(
+                    brightness=aout_val[i],
+                    aout_coa=coa[i],
+                )
+            )
+
+
+        self.__ha_value = DCDA_33MValue(
+            sw=sw,
+            aout=aout,
+        )
+
+        self.__inels_set_value = AOUT_4_SET.render(
+            [aout[i].brightness for i in range(4)]
+        )
+
+    def __decode_da3_66m(self) -> None:
+        """Decode status of DA3-66M."""
+        state = self.__trim_inels_status_bits(DA3_66M_DATA, ALERT)
+
+        toa = []
+        coa = []
+        for i in range (4):
+            toa.append(state[2*i])
+            coa.append(state[2*i + 1])
+        for i in range(2):
+            toa.append(state[2*i + 8])
+            coa.append(state[2*i + 9])
+
+        switches = self.__trim_inels_status_bits(DA3_66M_DATA, SW)
+
+        digital_inputs = self.__trim_inels_status_bits(DA3_66M_DATA, DIN)
+
+        sw = []
+        din = []
+        for i in range(6):
+            sw.append(switches[i])
+            din.append(digital_inputs[i])
+
+        out = []
+        outs = self.__trim_inels_status_bytes(
+            DA3_66M_DATA, OUT
+        )
+
+        for o in outs:
+            out.append(int(o, 16))
+
+        light_coa_toa=[]
+        for i in range(6):
+            light_coa_toa.append(
+                LightCoaToa(
+                    brightness=out[i],
+                    toa=toa[i],
+                    coa=coa[i],
+                )
+            )
+
+        self.__ha_value = DA3_66MValue(
+            sw=sw,
+            din=din,
+            light_coa_toa=light_coa_toa,
+        )
+
+        self.__inels_set_value = DA3_66M_SET.render(
+            [self.__ha_value.light_coa_toa[i].brightness for i in range(6)]
+        )
+
+    def __decode_dali_dmx_unit(self) -> None:
+        """Decode status of DALI-DMX-Unit."""
+        outs = self.__trim_inels_status_bytes(DALI_DMX_UNIT_DATA, OUT)
+        simple_light = []
+        for o in outs:
+            o = int(o, 16)
+            o = o if o < 100 else 100
+            simple_light.append(
+                SimpleLight(
+                    brightness=o,
+                )
+            )
+
+        self.__ha_value = SimpleLightValue(
+            simple_light=simple_light,
+        )
+
+    def __decode_dali_dmx_unit_2(self) -> None:
+        """Decode status of DALI-DMX-Unit-2."""
+        outs = self.__trim_inels_status_bytes(DALI_DMX_UNIT_DATA, OUT)
+        warm_light = []
+        lights = list(zip(outs[::2], outs[1::2]))
+
+        for l in lights:
+            b = min(int(l[0], 16), 100)
+            w = min(int(l[1], 16), 100)
+            warm_light.append(
+                WarmLight(
+                    brightness=b,
+                    relative_ct=w,
+                )
+            )
+
+        self.__ha_value = WarmLightValue(
+            warm_light=warm_light,
+        )
+
+    def __decode_rf_shutters(self) -> None:
+        """Decode status of Shutters."""
+        if self.__inels_status_value is None:
+            _LOGGER.info("inels_status_value was 'None' for %s", RF_SHUTTERS)
+            self.__inels_set_value = DEVICE_TYPE_03_COMM_TEST
+            self.__ha_value = None
+        else:
+            # shutters True -> closed, False -> open
+            shutters = []
+            shutter_val = self.__trim_inels_status_int(DEVICE_TYPE_03_DATA, SHUTTER)
+
+            # So as to continue driving it down if it aisn't closed
+            # and continue opening it if it isn't open
+            if shutter_val not in [Shutter_state.Open, Shutter_state.Closed]: 
+                shutter_val = self.__last_value.shutters[0].state
+            shutters.append(
+                Shutter(
+                    state=shutter_val,
+                    is_closed=(shutter_val is Shutter_state.Closed)
+                )
+            )
+
+            self.__ha_value = ShuttersValue(
+                shutters=shutters,
+            )
+
+            self.__inels_set_value = f"{RF_SHUTTER_STATE_SET[shutters[0].state]}\n00\n00\n"
+
+    def __decode_rf_shutter_unit(self) -> None:
+        """Decode status of Shutter unit."""
+        if self.__inels_status_value is None:
+            _LOGGER.info("inels_status_value was 'None' for %s", RF_SHUTTER_UNIT)
+            self.__inels_set_value = DEVICE_TYPE_03_COMM_TEST
+            self.__ha_value = None
+        else:
+            shutters_with_pos = []
+
+            position = 100 - self.__trim_inels_status_int(DEVICE_TYPE_21_DATA, POSITION)
+
+            shutter_val = int(self.__trim_inels_status_values(DEVICE_TYPE_21_DATA, SHUTTER, ""))
+            shutter_val = ((shutter_val >> 1) & 1) | (shutter_val & 1) << 1 #swap bit 0 with bit 1
+
+            if shutter_val == Shutter_state.Closed and position != 0:
+                shutter_val = Shutter_state.Open
+
+            if (self.__last_value is not None) and (shutter_val not in [Shutter_state.Open, Shutter_state.Closed]):
+                shutter_val = self.__last_value.shutters[0].state
+
+
+            shutters_with_pos.append(
+                Shutter_pos(
+                    state=shutter_val,
+                    is_closed=shutter_val == Shutter_state.Closed,
+                    position=position,
+                    set_pos=False,
+                )
+            )
+
+            self.__ha_value = ShuttersPosValue(
+                shutters_with_pos=shutters_with_pos,
+            )
+            self.__inels_set_value = f"{RF_SHUTTER_STATE_SET[shutters_with_pos[0].state]}\n00\n00\n"
+
+    def __decode_ja3_018m(self) -> None:
+        """Decode status of JA3-018M."""
+        shutter_relays=[]
+        for r in self.__trim_inels_status_ints(JA3_018M_DATA, SHUTTER):
+            shutter_relays.append((r & 1) != 0)
+
+        simple_shutters = []
+        shutters = list(zip(shutter_relays[::2], shutter_relays[1::2]))
+        for s in shutters:
+            if s[0]:
+                state = Shutter_state.Open
+            elif s[1]:
+                state = Shutter_state.Closed
+            else:
+                state = Shutter_state.Stop_down
+            simple_shutters.append(
+                Shutter(
+                    state=state,
+                    is_closed=None
+                )
+            )
+
+        interface=[]
+        digital_inputs = self.__trim_inels_status_bits(JA3_018M_DATA, SW)
+
+        for i in range(8):
+            interface.append(digital_inputs[i])
+        for i in range(8):
+            interface.append(digital_inputs[i + 8])
+
+        alerts = self.__trim_inels_status_bits(JA3_018M_DATA, ALERT)
+
+        for i in range(2):
+            interface.append(alerts[i])
+
+        alert_power = alerts[3]
+        alert_comm = [
+            alerts[4],
+            alerts[5],
+            alerts[6]
+        ]
+
+        overflows = self.__trim_inels_status_bits(JA3_018M_DATA, RELAY_OVERFLOW)
+
+        #TODO add overflows and alerts to the shutters
+        relay_overflow=[]
+        for i in range(8):
+            relay_overflow.append(overflows[i])
+
+        relay_overflow.append(alerts[7])
+
+        #I'll register them as an interface and replace the names to SW 1 up/down, etc...
+
+        self.__ha_value=JA3Value(
+            simple_shutters=simple_shutters,
+            interface=interface,
+
+        )
+
+        self.__inels_set_value = f"{''.join([SIMPLE_SHUTTER_STATE_SET[x.state] for x in simple_shutters])}"
+
+    def __decode_ja3_014m(self) -> None:
+        """Decode status of JA3-014M."""
+        shutter_relays = []
+        for r in self.__trim_inels_status_ints(JA3_014M_DATA, SHUTTER):
+            shutter_relays.append((r & 1) != 0)
+
+        simple_shutters = []
+        shutters = list(zip(shutter_relays[::2], shutter_relays[1::2]))
+
+        for s in shutters:
+            if s[0]:
+                state = Shutter_state.Open
+            elif s[1]:
+                state = Shutter_state.Closed
+            else:
+                state = Shutter_state.Stop_down
+            simple_shutters.append(
+                Shutter(
+                    state=state,
+                    is_closed=None
+                )
+            )
+
+        interface = []
+        digital_inputs = self.__trim_inels_status_bits(JA3_014M_DATA, SW)
+
+        for i in range(8):
+            interface.append(digital_inputs[i])
+        for i in range(6):
+            interface.append(digital_inputs[i + 10])
+
+        alerts = self.__trim_inels_status_bits(JA3_014M_DATA, ALERT)
+
+        for i in range(7):
+            interface.append(alerts[i + 1])
+
+        # alert_power = alerts[3]
+        # alert_comm = [
+        #     alerts[4],
+        #     alerts[5],
+        #     alerts[6]
+        # ]
+
+        overflows = self.__trim_inels_status_bits(JA3_014M_DATA, RELAY_OVERFLOW)
+
+        # TODO add overflows and alerts to the shutters
+        relay_overflow = []
+        for i in range(8):
+            interface.append(overflows[i])
+        for i in range(6):
+            interface.append(overflows[i + 10])
+
+        # relay_overflow.append(alerts[7])
+
+        # I'll register them as an interface and replace the names to SW 1 up/down, etc...
+
+        self.__ha_value = JA3Value(
+            simple_shutters=simple_shutters,
+            interface=interface,
+
+        )
+
+        self.__inels_set_value = f"{''.join([SIMPLE_SHUTTER_STATE_SET[x.state] for x in simple_shutters])}"
+
+    def __decode_rf_wireless_thermovalve(self) -> None:
+        """Decode status of Wireless Thermovalve."""
+        # fetches all the status values and compacts them into a new object
+        temp_current_hex = self.__trim_inels_status_values(
+            DEVICE_TYPE_09_DATA, CURRENT_TEMP, ""
+        )
+        temp_current = int(temp_current_hex, 16) * 0.5
+        temp_required_hex = self.__trim_inels_status_values(
+            DEVICE_TYPE_09_DATA, REQUIRED_TEMP, ""
+        )
+        temp_required = int(temp_required_hex, 16) * 0.5
+        battery = int(self.__trim_inels_status_values(
+            DEVICE_TYPE_09_DATA, BATTERY, ""
+        ), 16)
+        open_to_hex = self.__trim_inels_status_values(
+            DEVICE_TYPE_09_DATA, OPEN_IN_PERCENTAGE, ""
+        )
+        open_to_percentage = int(open_to_hex, 16) * 0.5
+
+        climate_mode = Climate_modes.Off
+        if temp_current < temp_required:
+            climate_mode = Climate_modes.Heat
+
+
+
+        self.__ha_value = ThermovalveValue(
+            low_battery=(battery!=0),
+            thermovalve=ThermovalveStateValue(
+                current=temp_current,
+                required=temp_required,
+                climate_mode=climate_mode,
+                current_action=current_action,
+                open_in_percentage=open_to_percentage,
+            )
+        )             
+
+    def __decode_virt_contr(self) -> None:
+        """Decode status of Virtual controller."""
+        fields = self.__decode_layout(VIRT_CONTR_LAYOUT)
+        temp_current = fields[CURRENT_TEMP]
+        temp_critical_max = fields[CRITICAL_MAX_TEMP] #check if 0x7F FF FF FB -> make it 50
+        temp_required_heat = fields[REQUIRED_HEAT_TEMP]
+        temp_critical_min = fields[CRITICAL_MIN_TEMP] #check if 0x7F FF FF FB -> make it -50
+        temp_required_cool = fields[REQUIRED_COOL_TEMP]
+        temp_correction = fields[TEMP_CORRECTION]
+        holiday_mode = fields[PUBLIC_HOLIDAY]
+        control_mode = int(fields[CONTROL_MODE])
+        #0 -> user control [ONLY IMPLEMENT THIS ONE FOR NOW]
+        #   Has presets (Schedule, Fav1-4 and manual temp)
+        #1 -> 2 temp
+        #2 -> single temp
+
+        binary_vals = fields[VIRT_CONTR]
+
+        controller_on = binary_vals[0] #if controller is on
+        schedule_mode = binary_vals[1] # schedule or a set temperature
+        heating_enabled = binary_vals[2] #if heating is connected
+        cooling_enabled = binary_vals[3] #if cooling is connected
+        vacation = binary_vals[4]
+        regulator_disabled = binary_vals[5] #window detection is on (?)
+
+        climate_mode = Climate_modes.Off 
+        if controller_on: #TODO review all of this
+            if control_mode == 0: #user control
+                if heating_enabled:
+                    climate_mode = Climate_modes.Heat
+                elif cooling_enabled:
+                    climate_mode = Climate_modes.Cool
+            else:
+                climate_mode = Climate_modes.Auto
+
+        current_action = Climate_action.Off
+        if controller_on:
+            current_action = Climate_action.Idle
+            # user controlled and two temp
+            if control_mode == 0: # user control
+                if climate_mode == Climate_modes.Heat and temp_current < temp_required_heat:
+                    current_action = Climate_action.Heating
+                elif climate_mode == Climate_modes.Cool and temp_current > temp_required_cool:
+                    current_action = Climate_action.Cooling
+            elif control_mode == 1: # two temp
+                if temp_current < temp_required_heat:
+                    current_action = Climate_action.Heating
+                elif temp_current > temp_required_cool:
+                    current_action = Climate_action.Cooling
+            elif control_mode == 2: # one temp
+                if temp_current < temp_required_heat:
+                    current_action = Climate_action.Heating
+                else:
+                    current_action = Climate_action.Cooling
+
+        # 1 -> schedule
+        # 6 -> manual
+        preset = 0 if schedule_mode else 5
+
+        self.__ha_value = ClimateControllerValue(
+            climate_controller=ClimateControllerStateValue(
+                current=temp_current, #current_temperature
+
+                required=temp_required_heat, #target_temperature / target_temperature_high
+                required_cool=temp_required_cool, #target_temperature_low
+
+                climate_mode=climate_mode, #hvac_mode: Off/Heat_cool/Heat/Cool
+                # Off -> controller is turned off
+                # Heat_cool -> follow temp range
+                # Heat -> only heating
+                # Cool -> only cooling
+
+                current_action=current_action, #hvac_action: Off/Heating/Cooling/Idle 
+                # Off -> controller is off
+                # Heating -> heating is on
+                # Cooling -> cooling is on
+                # Idle -> temp is in range
+
+                #non exposed
+                critical_temp=temp_critical_max,
+                correction_temp=temp_correction,
+                public_holiday=holiday_mode,
+
+                vacation=vacation,
+
+                control_mode=control_mode,
+                current_preset=preset,
+            ),
+        )
+
+    def __decode_virt_heat_reg(self) -> None:
+        """Decode status of Heat virtual regulator."""
+        state=int(self.__trim_inels_status_values(
+            VIRT_REG_DATA, STATE, ""
+        ), 16)
+
+        reg = self.__trim_inels_status_bits(VIRT_REG_DATA, VIRT_HEAT_REG)
+
+        heat_reg=reg[0]
+        heat_source = reg[1]
+
+        self.__ha_value = HeatRegulatorValue(
+            heating_out = heat_reg
+        )
+
+    def __decode_virt_cool_reg(self) -> None:
+        """Decode status of Cool virtual regulator."""
+        state=int(self.__trim_inels_status_values(
+            VIRT_REG_DATA, STATE, ""
+        ), 16)
+
+        reg = self.__trim_inels_status_bits(VIRT_REG_DATA, VIRT_HEAT_REG)
+
+        cool_reg=reg[0]
+        cool_source = reg[1]
+
+        self.__ha_value = CoolRegulatorValue(
+            cooling_out=cool_reg,
+        )
+
+    def __decode_rf_controller(self) -> None:
+        """Decode status of Controller."""
+        if self.__inels_status_value is None:
+            #No connection can be made, so just communicate low battery
+            self.__ha_value = ControllerValue(
+                low_battery = True,
+                btn = [False, False, False, False]
+            )
+        else:
+            state_bits = self.__trim_inels_status_bits(DEVICE_TYPE_19_DATA, STATE)
+
+            # read which button was last pressed
+            identity = self.__trim_inels_status_values(
+                DEVICE_TYPE_19_DATA, IDENTITY, ""
+            )
+
+
+            #NEW
+            low_battery = state_bits[3] # 1 -> low
+            pressed = state_bits[4]
+            if self.__last_value is None:
+                btn = [
+                    False,
+                    False,
+                    False,
+                    False,
+                ]
+            else:
+                btn = list(self.__last_value.ha_value.btn)
+
+            if identity in BUTTON_NUMBER:
+                number = BUTTON_NUMBER[identity]
+                if number <= 4:
+                    btn[number-1] = pressed
+
+            self.__ha_value = ControllerValue(
+                low_battery=low_battery,
+                btn=btn
+            )
+
+    def __decode_rf_2_button_controller(self) -> None:
+        """Decode status of Two button controller."""
+        if self.__inels_status_value is None:
+            self.__ha_value = ControllerValue(
+                low_battery=True,
+                btn=[False, False]
+            )
+        else:
+            state = self.__trim_inels_status_bits(DEVICE_TYPE_19_DATA, STATE)
+
+            identity = self.__trim_inels_status_values(DEVICE_TYPE_19_DATA, IDENTITY, "")
+
+            low_battery = state[3]
+            pressed = state[4]
+            if self.__last_value is None:
+                btn = [False, False]
+            else:
+                btn = list(self.__last_value.ha_value.btn)
+
+            if identity in BUTTON_NUMBER:
+                number = BUTTON_NUMBER[identity]
+                if number <= 2:
+                    btn[number-1] = pressed
+
+            self.__ha_value = ControllerValue(
+                low_battery=low_battery,
+                btn=btn,
+            )
+
+    def __decode_gsb3_90sx(self) -> None:
+        """Decode status of GSB3-90SX."""
+        digital_inputs = self.__trim_inels_status_bits(GSB3_90SX_DATA, GSB3_90SX)
+
+
+        temp = self.__trim_inels_status_values(
+            GSB3_90SX_DATA, TEMP_IN, "")
+
+        light_in = self.__trim_inels_status_values(
+            GSB3_90SX_DATA, LIGHT_IN, "")
+
+        ain = self.__trim_inels_status_values(
+            GSB3_90SX_DATA, AIN, "")
+
+        humidity = self.__trim_inels_status_values(
+            GSB3_90SX_DATA, HUMIDITY, "")
+
+        dewpoint = self.__trim_inels_status_values(
+            GSB3_90SX_DATA, DEW_POINT, "")
+
+        self.__ha_value = GSB3_90SXValue(
+            interface=[
+                digital_inputs[0],#0
+                digital_inputs[1],
+                digital_inputs[2],
+                digital_inputs[3],
+                digital_inputs[4],
+                digital_inputs[5],
+                digital_inputs[6],
+                digital_inputs[7],
+                digital_inputs[8],#8
+            ],
+            din=[
+                digital_inputs[9],#9
+                digital_inputs[10],#10
+            ],
+            prox=digital_inputs[11],#11
+
+            # Actually important:
+            # temperature
+            temp_in=temp,
+
+            # light in
+            light_in=light_in,
+
+            # AIN
+            ain=ain,
+
+            # humidity
+            humidity=humidity,
+
+            # dewpoint
+            dewpoint=dewpoint,
+
+            # disabled
+            disabled=False,
+            # backlit
+            backlit=False,
+        )
+
+    def __decode_gsb3(self) -> None:
+        """Decode status of GSB3_20Sx, GSB3_40Sx, GSB3-60Sx, GBP3-60."""
+        switches = self.__trim_inels_status_bits(GLASS_CONTROLLER_DATA, SW)
+
+        digital_inputs = self.__trim_inels_status_bits(GLASS_CONTROLLER_DATA, SW)
+
+        interface = []
+        for i in range(GSB3_AMOUNTS[self.__inels_type]):
+            interface.append(switches[i])
+
+        din = []
+        for i in range(2):
+            din.append(digital_inputs[i])
+
+        temp = self.__trim_inels_status_values(
+            GLASS_CONTROLLER_DATA, TEMP_IN, "")
+
+        light_in = self.__trim_inels_status_values(
+            GLASS_CONTROLLER_DATA, LIGHT_IN, "")
+
+        ain = self.__trim_inels_status_values(
+            GLASS_CONTROLLER_DATA, AIN, "")
+
+        self.__ha_value = GlassControllerValue(
+            interface=interface,
+            din=din,
+            # temperature
+            temp_in=temp,
+
+            # light in
+            light_in=light_in,
+
+            # AIN
+            ain=ain,
+        )
+
+    def __decode_gsp3_100(self) -> None:
+        """Decode status of GSP3-100."""
+        switches = self.__trim_inels_status_bits(GLASS_CONTROLLER_DATA, SW)
+
+        digital_inputs = self.__trim_inels_status_bits(GLASS_CONTROLLER_DATA, SW)
+
+        interface = []
+        for i in range(8):
+            interface.append(switches[i])
+        din = []
+        for i in range(2):
+            interface.append(digital_inputs[i])
+            din.append(digital_inputs[i + 2])
+
+        temp_in = self.__trim_inels_status_values(GLASS_CONTROLLER_DATA, TEMP_IN, "")
+        light_in = self.__trim_inels_status_values(GLASS_CONTROLLER_DATA, LIGHT_IN, "")
+        ain = self.__trim_inels_status_values(GLASS_CONTROLLER_DATA, AIN, "")
+        self.__ha_value = GlassControllerValue(
+            interface=interface,
+            din=din,
+            temp_in=temp_in,
+            light_in=light_in,
+            ain=ain,
+        )
+
+    def __decode_gdb3_10(self) -> None:
+        """Decode status of GDB3-10."""
+        switches = self.__trim_inels_status_bits(GLASS_CONTROLLER_DATA, SW)
+
+        digital_inputs = self.__trim_inels_status_bits(GLASS_CONTROLLER_DATA, DIN)
+
+        interface = []
+        din = []
+        for i in range(3):
+            interface.append(switches[2*i + 1])
+        for i in range(2):
+            din.append(digital_inputs[i])
+
+        temp_in = self.__trim_inels_status_values(GLASS_CONTROLLER_DATA, TEMP_IN, "")
+        light_in = self.__trim_inels_status_values(GLASS_CONTROLLER_DATA, LIGHT_IN, "")
+        ain = self.__trim_inels_status_values(GLASS_CONTROLLER_DATA, AIN, "")
+        self.__ha_value = GlassControllerValue(
+            interface=interface,
+            din=din,
+            temp_in=temp_in,
+            light_in=light_in,
+            ain=ain,
+        )
+
+    def __split_inels_status(self) -> "tuple[str, ...]":
+        """Split inels status from broker into its hex bytes.
+
+        The status is split only once, every field extraction of the
+        decoder then indexes into the same tuple. Plain uppercase
+        payloads are not decoded at all, their tokens are shared strings.
+
+        Returns:
+            tuple[str, ...]: hex byte strings of the status
+        """
+        if self.__status_bytes is None:
+            ints = self.__split_inels_status_ints()
+            if ints is not None and self.__status_upper:
+                self.__status_bytes = tuple([_HEX_BYTES[i] for i in ints])
+            else:
+                self.__status_bytes = tuple(self.inels_status_value.split("\n")[:-1])
+        return self.__status_bytes
+
+    def __split_inels_status_ints(self) -> Optional[bytes]:
+        """Parse inels status straight from the payload into integers.
+
+        Every hex byte of the payload becomes one int, without creating
+        a str per byte.
+
+        Returns:
+            Optional[bytes]: value of every status byte, None when the
+            status is not made of plain two digit hex bytes
+        """
+        if not self.__status_ints_parsed:
+            self.__status_ints_parsed = True
+            raw = self.__inels_status_value
+            try:
+                if isinstance(raw, str):
+                    ints = bytes.fromhex(raw)
+                    separators = raw.count("\n")
+                    self.__status_upper = _LOWER_HEX.search(raw) is None
+                else:
+                    ints = binascii.unhexlify(raw.replace(b"\n", b""))
+                    separators = raw.count(b"\n")
+                    self.__status_upper = _LOWER_HEX_BYTES.search(raw) is None
+            except (ValueError, TypeError):
+                return None
+
+            # tokens must line up with __split_inels_status
+            if len(ints) == separators and len(raw) == 3 * separators:
+                self.__status_ints = ints
+        return self.__status_ints
+
+    def __decode_layout(self, layout: Layout) -> "dict[str, Any]":
+        """Fields of inels status read by a compiled layout."""
+        ints = self.__split_inels_status_ints()
+        if ints is None or not self.__status_upper:
+            return layout.decode_tokens(self.__split_inels_status())
+        return layout.decode(ints)
 
     def __trim_inels_status_values(
         self, selector: "dict[str, Any]", fragment: str, jointer: str
     ) -> str:
         """Trim inels status from broker into the pure string."""
-        data = self.__inels_status_value.split("\n")[:-1]
-
-        selected = itemgetter(*selector[fragment])(data)
+        selected = itemgetter(*selector[fragment])(self.__split_inels_status())
         return jointer.join(selected)
 
     def __trim_inels_status_bytes(
         self, selector: "dict[str, Any]", fragment: str) -> "list[str]":
         """Split inels status section into its constituting bytes"""
-        data = self.__inels_status_value.split("\n")[:-1]
-
-        selected = itemgetter(*selector[fragment])(data)
+        selected = itemgetter(*selector[fragment])(self.__split_inels_status())
         return selected
 
+    def __trim_inels_status_int(
+        self, selector: "dict[str, Any]", fragment: str) -> int:
+        """Value of inels status section, its bytes read as big endian."""
+        ints = self.__split_inels_status_ints()
+        if ints is None:
+            return int(self.__trim_inels_status_values(selector, fragment, ""), 16)
+
+        value = 0
+        for i in selector[fragment]:
+            value = value << 8 | ints[i]
+        return value
+
+    def __trim_inels_status_bits(
+        self, selector: "dict[str, Any]", fragment: str) -> "tuple[bool, ...]":
+        """Bits of inels status section, bit 0 to 7 of every byte in turn."""
+        ints = self.__split_inels_status_ints()
+        if ints is None:
+            width = 8 * len(selector[fragment])
+            bits = f"{self.__trim_inels_status_int(selector, fragment):0>{width}b}"
+            return tuple(bits[8 * (n // 8) + 7 - n % 8] == "1" for n in range(width))
+
+        return unpack_bits(*[ints[i] for i in selector[fragment]])
+
+    def __trim_inels_status_ints(
+        self, selector: "dict[str, Any]", fragment: str) -> "tuple[int, ...]":
+        """Values of the bytes of inels status section."""
+        ints = self.__split_inels_status_ints()
+        if ints is None:
+            return tuple(
+                int(b, 16) for b in self.__trim_inels_status_bytes(selector, fragment)
+            )
+
+        return tuple(ints[i] for i in selector[fragment])
+
     # Forms a set value from the ha value
     def __find_inels_value(self) -> None:
         """Find inels mqtt value for specific device."""
         if self.__ha_value is not dummy_val:
+            encoder = self.__INELS_ENCODERS.get((self.__device_type, self.__inels_type)) \
+                or self.__INELS_ENCODERS.get((self.__device_type, None))
+            if encoder is None:
+                return
+
             try:
-                if self.__device_type is SWITCH:
-                    if self.__inels_type is RF_SINGLE_SWITCH:
-                        if self.__ha_value is None:
-                            self.__inels_set_value = DEVICE_TYPE_07_COMM_TEST
-                        else:
-                            self.__inels_set_value = f"{(2 - (self.__ha_value.simple_relay[0].is_on)):02X}\n00\n"
-                    elif self.__inels_type is RF_SWITCHING_UNIT:
-                        if self.__ha_value is None:
-                            self.__inels_set_value = DEVICE_TYPE_02_COMM_TEST
-                        else:
-                            self.__inels_set_value = f"{(2 - (self.__ha_value.simple_relay[0].is_on)):02X}\n00\n00\n"
-                    elif self.__inels_type is RF_SWITCHING_UNIT_WITH_EXTERNAL_TEMPERATURE_SENSOR:
-                        if self.__ha_value is None:
-                            self.__inels_set_value = DEVICE_TYPE_07_COMM_TEST
-                        else:
-                            self.__inels_set_value = SWITCH_WITH_TEMP_SET[self.__ha_value.simple_relay[0].is_on]            
-                    elif self.__inels_type in [SA3_01B, SA3_02B, SA3_02M, SA3_04M, SA3_06M, SA3_012M, SA3_014M, IOU3_108M]:
-                        value = ""
-                        if hasattr(self.__ha_value, "simple_relay"):
-                            for re in self.__ha_value.simple_relay:
-                                value += RELAY_SET[re.is_on]
-                            self.__inels_set_value = value
-                        elif hasattr(self.__ha_value, "relay"):
-                            for re in self.__ha_value.relay:
-                                value += RELAY_SET[re.is_on]
-                            self.__inels_set_value = value
-                    elif self.__inels_type is SA3_022M:
-                        value = ""
-                        for r in self.__ha_value.relay:
-                            value += RELAY_SET[r.is_on]
-                        for s in self.__ha_value.simple_shutters:
-                            value += SIMPLE_SHUTTER_STATE_SET[s.state]
-                        for v in self.__ha_value.valve:
-                            value += RELAY_SET[v]
-                        self.__inels_set_value = value
-                    elif self.__inels_type is IOU3_108M:
-                        set_val = ""
-                        for r in self.__ha_value.relay:
-                            set_val += RELAY_SET[r.is_on]
-                        self.__inels_set_value = set_val
-                    elif self.__inels_type is RC3_610DALI:
-                        set_val = "00\n" * 4 #4 bytes
-                        for a in self.__ha_value.aout:
-                            set_val += f"{a.brightness:02X}\n"
-                        set_val += "00\n" * 2 #8 bytes
-                        for r in self.__ha_value.relay:
-                            set_val += RELAY_SET[r.is_on] #16 bytes
-                        set_val += "00\n" * 4 #20 bytes
-                        for i in range(4):
-                            set_val += f"{self.__ha_value.dali[i].brightness:02X}\n"
-                        set_val += "00\n" * 4
-                        for i in range(4, 8):
-                            set_val += f"{self.__ha_value.dali[i].brightness:02X}\n"
-                        set_val += "00\n" * 4
-                        for i in range(8, 12):
-                            set_val += f"{self.__ha_value.dali[i].brightness:02X}\n"
-                        set_val += "00\n" * 4
-                        for i in range(12, 16):
-                            set_val += f"{self.__ha_value.dali[i].brightness:02X}\n"
-                            
-                        self.__inels_set_value = set_val
-                    elif self.__inels_type is FA3_612M:
-                        original_status = self.ha_value.last_status_val.split("\n")
-                        
-                        set_val = "00\n" * 4
-                        for a in self.ha_value.aout:
-                            set_val += f"{a.brightness:02X}\n"
-                        for i in range(4):
-                            set_val += f"{original_status[8 + i]}\n"
-                        fan_val = ""
-                        for i in range(3):
-                            fan_val += RELAY_SET[self.ha_value.fan_speed == (i + 1)]
-                        set_val += fan_val
-                        set_val += f"{original_status[15]}\n"
-                        
-                        self.__inels_set_value = set_val
-                    elif self.__inels_type in [GCR3_11, GCH3_31]:
-                        set_val = "04\n" if self.ha_value.simple_relay[0].is_on else "00\n"
-                        set_val += "00\n" * 9
-                        self.__inels_set_value = set_val
-                    elif self.__inels_type is BITS:
-                        set_val = {}
-                        for bit in self.ha_value.bit:
-                            set_val[bit.addr] = int(bit.is_on)
-
-                        self.__inels_set_value = json.dumps({"cmd": set_val})
-                elif self.__device_type is NUMBER:
-                    set_val = {}
-                    for number in self.ha_value.number:
-                        set_val[number.addr] = int(number.value)
-
-                    self.__inels_set_value = json.dumps({"cmd": set_val})
-                elif self.__device_type is LIGHT:
-                    if self.__inels_type in [RF_SINGLE_DIMMER, RF_DIMMER]:
-                        if self.__ha_value is None:
-                            self.__inels_set_value = DEVICE_TYPE_05_COMM_TEST
-                        else:
-                            out = round(self.__ha_value.simple_light[0].brightness, -1)
-                            out = out if out < 100 else 100
-
-                            b = int((((0xFFFF - out) + 10000) * 1000) / 5)
-                            b = 0xFFFF - ((int(out/5)*1000) + 10000)
-                            b_str = f"{b:04X}"
-                            self.__inels_set_value = f"01\n{b_str[0]}{b_str[1]}\n{b_str[2]}{b_str[3]}\n"
-                    elif self.__inels_type is RF_DIMMER_RGB:
-                        if self.__ha_value is None:
-                            self.__inels_set_value = DEVICE_TYPE_13_COMM_TEST
-                        else:
-                            rgb = self.__ha_value.rgb[0]
-                            self.__inels_set_value = f"01\n{rgb.r:02X}\n{rgb.g:02X}\n{rgb.b:02X}\n{int(rgb.brightness*2.55):02X}\n00\n"
-                    elif self.__inels_type is RF_LIGHT_BULB:
-                        if self.__ha_value is None:
-                            self.__inels_set_value = DEVICE_TYPE_13_COMM_TEST
-                        else:
-                            self.__inels_set_value = f"0F\n00\n00\n00\n{round(self.ha_value.warm_light[0].brightness*2.55):02X}\n{round(self.ha_value.warm_light[0].relative_ct*2.55):02X}\n"
-                    elif self.__inels_type is DA3_22M:
-                        # correct the values
-                        out1 = round(self.__ha_value.light_coa_toa[0].brightness, -1)
-                        out1 = out1 if out1 < 100 else 100
-
-                        out2 = round(self.__ha_value.light_coa_toa[1].brightness, -1)
-                        out2 = out2 if out2 < 100 else 100
-
-                        out1_str = f"{out1:02X}\n"
-                        out2_str = f"{out2:02X}\n"
-
-                        # EX: 00\n00\n00\n00\n64\n64\n # 100%/100%
-                        self.__inels_set_value = "".join(["00\n" * 4, out1_str, out2_str])
-                    elif self.__inels_type in [DAC3_04B, DAC3_04M]:
-                        set_val = "00\n" * 4
-                        for d in self.ha_value.aout:
-                            set_val += f"{d.brightness:02X}\n"
-                        self.__inels_set_value = set_val
-                    elif self.__inels_type in DCDA_33M:
-                        set_val = "00\n"*4
-                        for i in range(4):
-                            aout = self.__ha_value.aout[i].brightness
-                            set_val += f"{aout:02X}\n"
-                        self.__inels_set_value = set_val
-                    elif self.__inels_type is DA3_66M:
-                        set_val = "00\n"*4
-                        for i in range(4):
-                            out = self.__ha_value.light_coa_toa[i].brightness
-                            out = out if out <= 100 else 100
-                            set_val += f"{out:02X}\n"
-                        set_val += "00\n"*4
-                        for i in range(4, 6):
-                            out = self.__ha_value.light_coa_toa[i].brightness
-                            out = out if out <= 100 else 100
-                            set_val += f"{out:02X}\n"
-                        set_val += "00\n"*12
-                        self.__inels_set_value = set_val
-                    elif self.__inels_type is DALI_DMX_UNIT:
-                        set_val = "00\n"*4
-                        for i in range(4):
-                            out = self.__ha_value.simple_light[i].brightness
-                            out = out if out <= 100 else 100
-                            set_val += f"{out:02X}\n"
-                        self.__inels_set_value = set_val
-                    elif self.__inels_type is DALI_DMX_UNIT_2:
-                        set_val = "00\n"*4
-                        for i in range(2):
-                            out = self.__ha_value.warm_light[i].brightness
-                            out = min(out, 100)
-
-                            white = self.__ha_value.warm_light[i].relative_ct
-                            white = min(white, 100)
-
-                            set_val += f"{out:02X}\n{white:02X}\n"
-                        self.__inels_set_value = set_val
-                elif self.__device_type is COVER:
-                    if self.__inels_type is RF_SHUTTERS:
-                        if self.__ha_value is None:
-                            self.__inels_set_value = DEVICE_TYPE_03_COMM_TEST
-                        else:
-                            shutter_set = RF_SHUTTER_STATE_SET[self.__ha_value.shutters[0].state]
-                            self.__inels_set_value = shutter_set + "00\n00\n"
-                    elif self.__inels_type is RF_SHUTTER_UNIT:
-                        if self.__ha_value is None:
-                            self.__inels_set_value = DEVICE_TYPE_03_COMM_TEST
-                        else:
-                            if self.__ha_value.shutters_with_pos[0].set_pos:
-                                shutter_set = f"0A\n00\n{100 - round(self.__ha_value.shutters_with_pos[0].position):02X}\n"
-                            else:
-                                shutter_set = RF_SHUTTER_STATE_SET[self.__ha_value.shutters_with_pos[0].state] + "00\n00\n"
-                            self.__inels_set_value = shutter_set
-                    elif self.__inels_type in [JA3_018M, JA3_014M]:
-                        self.__inels_set_value = f"{''.join([SIMPLE_SHUTTER_STATE_SET[x.state] for x in self.__ha_value.simple_shutters])}"
-                elif self.__device_type is CLIMATE:
-                    if self.__inels_type is RF_WIRELESS_THERMOVALVE:
-                        required_temp = int(round(self.__ha_value.thermovalve.required * 2, 0))
-                        self.__inels_set_value = f"00\n{required_temp:02X}\n00\n"
-                    elif self.__inels_type is VIRT_CONTR:
-                        cc = self.ha_value.climate_controller
-
-                        current_temp = f"{int(cc.current * 100):08X}"
-                        current_temp = break_into_bytes(current_temp)
-                        current_temp.reverse()
-
-                        critical_temp = f"{int(cc.critical_temp * 100):08X}"
-                        critical_temp = break_into_bytes(critical_temp)
-                        critical_temp.reverse()
-
-                        manual_temp = f"{int((cc.required + cc.correction_temp) * 100):08X}"
-                        manual_temp = break_into_bytes(manual_temp)
-                        manual_temp.reverse()
-
-                        manual_cool_temp = f"{int((cc.required_cool + cc.correction_temp) * 100):08X}"
-                        manual_cool_temp = break_into_bytes(manual_cool_temp)
-                        manual_cool_temp.reverse()
-
-                        plan_in = "00\n"
-                        if cc.public_holiday > 0:
-                            plan_in = "80\n"
-                        elif cc.vacation:
-                            plan_in = "40\n"
-
-                        manual_in = 0
-                        if cc.current_preset == 5: #manual mode (in HA, this is the 4th preset, includes a default)
-                            manual_in = 7
-                        else:
-                            manual_in = cc.current_preset
-
-                        # off
-                        byte18 = 0  #TODO review this
-                        if cc.climate_mode != Climate_modes.Off:
-                            if cc.climate_mode == Climate_modes.Cool:
-                                byte18 = 3
-                            else:
-                                byte18 = 1
-
-                        set_val = "\n".join(current_temp) + "\n"
-                        set_val += "\n".join(critical_temp) + "\n"
-                        set_val += "\n".join(manual_temp) + "\n"
-                        set_val += "\n".join(manual_cool_temp) + "\n"
-                        set_val += plan_in
-                        set_val += f"{manual_in:02X}\n"
-                        set_val += f"{byte18:02X}\n"
-
-                        self.__inels_set_value = set_val
+                encoder(self)
             except Exception as err:
                 _LOGGER.error("Error making 'set' value for device of type '%s', status value was '%s'", self.__inels_type, None if not self.inels_status_value else self.inels_status_value.replace("\n", " "))
                 raise
 
+    def __encode_rf_single_switch(self) -> None:
+        """Encode set value of Single switching unit."""
+        if self.__ha_value is None:
+            self.__inels_set_value = DEVICE_TYPE_07_COMM_TEST
+        else:
+            self.__inels_set_value = f"{(2 - (self.__ha_value.simple_relay[0].is_on)):02X}\n00\n"
+
+    def __encode_rf_switching_unit(self) -> None:
+        """Encode set value of Switching unit."""
+        if self.__ha_value is None:
+            self.__inels_set_value = DEVICE_TYPE_02_COMM_TEST
+        else:
+            self.__inels_set_value = f"{(2 - (self.__ha_value.simple_relay[0].is_on)):02X}\n00\n00\n"
+
+    def __encode_rf_switching_unit_with_temp(self) -> None:
+        """Encode set value of Switching unit with external temperature sensor."""
+        if self.__ha_value is None:
+            self.__inels_set_value = DEVICE_TYPE_07_COMM_TEST
+        else:
+            self.__inels_set_value = SWITCH_WITH_TEMP_SET[self.__ha_value.simple_relay[0].is_on]            
+
+    def __encode_relays(self) -> None:
+        """Encode set value of SA3 relay modules and IOU3-108M."""
+        value = ""
+        if hasattr(self.__ha_value, "simple_relay"):
+            for re in self.__ha_value.simple_relay:
+                value += RELAY_SET[re.is_on]
+            self.__inels_set_value = value
+        elif hasattr(self.__ha_value, "relay"):
+            for re in self.__ha_value.relay:
+                value += RELAY_SET[re.is_on]
+            self.__inels_set_value = value
+
+    def __encode_sa3_022m(self) -> None:
+        """Encode set value of SA3-022M."""
+        value = ""
+        for r in self.__ha_value.relay:
+            value += RELAY_SET[r.is_on]
+        for s in self.__ha_value.simple_shutters:
+            value += SIMPLE_SHUTTER_STATE_SET[s.state]
+        for v in self.__ha_value.valve:
+            value += RELAY_SET[v]
+        self.__inels_set_value = value
+
+    def __encode_rc3_610dali(self) -> None:
+        """Encode set value of RC3-610DALI."""
+        values = [a.brightness for a in self.__ha_value.aout]
+        values += [RELAY_SET_BYTE[r.is_on] for r in self.__ha_value.relay]
+        values += [self.__ha_value.dali[i].brightness for i in range(16)]
+        self.__inels_set_value = RC3_610DALI_SET.render(values)
+
+    def __encode_fa3_612m(self) -> None:
+        """Encode set value of FA3-612M."""
+        original_status = self.ha_value.last_status_val.split("\n")
+
+        set_val = "00\n" * 4
+        for a in self.ha_value.aout:
+            set_val += f"{a.brightness:02X}\n"
+        for i in range(4):
+            set_val += f"{original_status[8 + i]}\n"
+        fan_val = ""
+        for i in range(3):
+            fan_val += RELAY_SET[self.ha_value.fan_speed == (i + 1)]
+        set_val += fan_val
+        set_val += f"{original_status[15]}\n"
+
+        self.__inels_set_value = set_val
+
+    def __encode_card_reader(self) -> None:
+        """Encode set value of GCR3-11, GCH3-31."""
+        self.__inels_set_value = CARD_READER_SET.render(
+            [0x04 if self.ha_value.simple_relay[0].is_on else 0x00]
+        )
+
+    def __encode_bits(self) -> None:
+        """Encode set value of BITS."""
+        set_val = {}
+        for bit in self.ha_value.bit:
+            set_val[bit.addr] = int(bit.is_on)
+
+        self.__inels_set_value = json.dumps({"cmd": set_val})
+
+    def __encode_number(self) -> None:
+        """Encode set value of virtual integers."""
+        set_val = {}
+        for number in self.ha_value.number:
+            set_val[number.addr] = int(number.value)
+
+        self.__inels_set_value = json.dumps({"cmd": set_val})
+
+    def __encode_rf_dimmer(self) -> None:
+        """Encode set value of Single dimmer, Dimmer."""
+        if self.__ha_value is None:
+            self.__inels_set_value = DEVICE_TYPE_05_COMM_TEST
+        else:
+            out = round(self.__ha_value.simple_light[0].brightness, -1)
+            out = out if out < 100 else 100
+
+            b = int((((0xFFFF - out) + 10000) * 1000) / 5)
+            b = 0xFFFF - ((int(out/5)*1000) + 10000)
+            b_str = f"{b:04X}"
+            self.__inels_set_value = f"01\n{b_str[0]}{b_str[1]}\n{b_str[2]}{b_str[3]}\n"
+
+    def __encode_rf_dimmer_rgb(self) -> None:
+        """Encode set value of RGB dimmer."""
+        if self.__ha_value is None:
+            self.__inels_set_value = DEVICE_TYPE_13_COMM_TEST
+        else:
+            rgb = self.__ha_value.rgb[0]
+            self.__inels_set_value = f"01\n{rgb.r:02X}\n{rgb.g:02X}\n{rgb.b:02X}\n{int(rgb.brightness*2.55):02X}\n00\n"
+
+    def __encode_rf_light_bulb(self) -> None:
+        """Encode set value of Light bulb."""
+        if self.__ha_value is None:
+            self.__inels_set_value = DEVICE_TYPE_13_COMM_TEST
+        else:
+            self.__inels_set_value = f"0F\n00\n00\n00\n{round(self.ha_value.warm_light[0].brightness*2.55):02X}\n{round(self.ha_value.warm_light[0].relative_ct*2.55):02X}\n"
+
+    def __encode_da3_22m(self) -> None:
+        """Encode set value of DA3-22M."""
+        # correct the values
+        out1 = round(self.__ha_value.light_coa_toa[0].brightness, -1)
+        out1 = out1 if out1 < 100 else 100
+
+        out2 = round(self.__ha_value.light_coa_toa[1].brightness, -1)
+        out2 = out2 if out2 < 100 else 100
+
+        # EX: 00\n00\n00\n00\n64\n64\n # 100%/100%
+        self.__inels_set_value = DA3_22M_SET.render([out1, out2])
+
+    def __encode_dac3_04(self) -> None:
+        """Encode set value of DAC3-04B, DAC3-04M."""
+        self.__inels_set_value = AOUT_4_SET.render(
+            [d.brightness for d in self.ha_value.aout]
+        )
+
+    def __encode_dcda_33m(self) -> None:
+        """Encode set value of DCDA-33M."""
+        self.__inels_set_value = AOUT_4_SET.render(
+            [self.__ha_value.aout[i].brightness for i in range(4)]
+        )
+
+    def __encode_da3_66m(self) -> None:
+        """Encode set value of DA3-66M."""
+        values = []
+        for i in range(6):
+            out = self.__ha_value.light_coa_toa[i].brightness
+            values.append(out if out <= 100 else 100)
+        self.__inels_set_value = DA3_66M_SET.render(values)
+
+    def __encode_dali_dmx_unit(self) -> None:
+        """Encode set value of DALI-DMX-Unit."""
+        values = []
+        for i in range(4):
+            out = self.__ha_value.simple_light[i].brightness
+            values.append(out if out <= 100 else 100)
+        self.__inels_set_value = AOUT_4_SET.render(values)
+
+    def __encode_dali_dmx_unit_2(self) -> None:
+        """Encode set value of DALI-DMX-Unit-2."""
+        values = []
+        for i in range(2):
+            out = self.__ha_value.warm_light[i].brightness
+            out = min(out, 100)
+
+            white = self.__ha_value.warm_light[i].relative_ct
+            white = min(white, 100)
+
+            values += [out, white]
+        self.__inels_set_value = AOUT_4_SET.render(values)
+
+    def __encode_rf_shutters(self) -> None:
+        """Encode set value of Shutters."""
+        if self.__ha_value is None:
+            self.__inels_set_value = DEVICE_TYPE_03_COMM_TEST
+        else:
+            shutter_set = RF_SHUTTER_STATE_SET[self.__ha_value.shutters[0].state]
+            self.__inels_set_value = shutter_set + "00\n00\n"
+
+    def __encode_rf_shutter_unit(self) -> None:
+        """Encode set value of Shutter unit."""
+        if self.__ha_value is None:
+            self.__inels_set_value = DEVICE_TYPE_03_COMM_TEST
+        else:
+            if self.__ha_value.shutters_with_pos[0].set_pos:
+                shutter_set = f"0A\n00\n{100 - round(self.__ha_value.shutters_with_pos[0].position):02X}\n"
+            else:
+                shutter_set = RF_SHUTTER_STATE_SET[self.__ha_value.shutters_with_pos[0].state] + "00\n00\n"
+            self.__inels_set_value = shutter_set
+
+    def __encode_ja3(self) -> None:
+        """Encode set value of JA3-018M, JA3-014M."""
+        self.__inels_set_value = f"{''.join([SIMPLE_SHUTTER_STATE_SET[x.state] for x in self.__ha_value.simple_shutters])}"
+
+    def __encode_rf_wireless_thermovalve(self) -> None:
+        """Encode set value of Wireless Thermovalve."""
+        required_temp = int(round(self.__ha_value.thermovalve.required * 2, 0))
+        self.__inels_set_value = f"00\n{required_temp:02X}\n00\n"
+
+    def __encode_virt_contr(self) -> None:
+        """Encode set value of Virtual controller."""
+        cc = self.ha_value.climate_controller
+
+        plan_in = 0
+        if cc.public_holiday > 0:
+            plan_in = 0x80
+        elif cc.vacation:
+            plan_in = 0x40
+
+        manual_in = 0
+        if cc.current_preset == 5: #manual mode (in HA, this is the 4th preset, includes a default)
+            manual_in = 7
+        else:
+            manual_in = cc.current_preset
+
+        # off
+        byte18 = 0  #TODO review this
+        if cc.climate_mode != Climate_modes.Off:
+            if cc.climate_mode == Climate_modes.Cool:
+                byte18 = 3
+            else:
+                byte18 = 1
+
+        self.__inels_set_value = VIRT_CONTR_SET_LAYOUT.encode({
+            CURRENT_TEMP: cc.current,
+            CRITICAL_MAX_TEMP: cc.critical_temp,
+            REQUIRED_HEAT_TEMP: cc.required + cc.correction_temp,
+            REQUIRED_COOL_TEMP: cc.required_cool + cc.correction_temp,
+            PUBLIC_HOLIDAY: plan_in,
+            CONTROL_MODE: manual_in,
+            VIRT_CONTR: byte18,
+        })
+
     def __find_keys_by_value(self, array: dict, value, last_value) -> Any:
         """Return key from dict by value
 
@@ -2521,7 +2944,9 @@ class DeviceValue(object):
         Returns:
             str: quated string from mqtt broker
         """
-        return self.__inels_status_value
+        if self.__inels_status_str is None and self.__inels_status_value is not None:
+            self.__inels_status_str = self.__inels_status_value.decode()
+        return self.__inels_status_str
 
     @property
     def inels_set_value(self) -> str:
@@ -2532,6 +2957,151 @@ class DeviceValue(object):
         """
         return self.__inels_set_value
 
+    @classmethod
+    def depends_on_last_value(cls, device_type: str, inels_type: str) -> bool:
+        """Whether decoding depends on the last value of the device
+
+        Args:
+            device_type (str): type of the device, e.g. switch
+            inels_type (str): inels type of the device
+
+        Returns:
+            bool: True when the same payload may decode differently
+        """
+        decoder = cls.__HA_DECODERS.get((device_type, inels_type)) \
+            or cls.__HA_DECODERS.get((device_type, None))
+        return decoder in cls.__STATEFUL_DECODERS
+
+    # (device type, inels type) -> status decoder, built once at import;
+    # an inels type of None matches any type of that device type
+    __HA_DECODERS = {
+        (SWITCH, RF_SINGLE_SWITCH): __decode_rf_single_switch,
+        (SWITCH, RF_SWITCHING_UNIT): __decode_rf_switching_unit,
+        (SWITCH, RF_SWITCHING_UNIT_WITH_EXTERNAL_TEMPERATURE_SENSOR): __decode_rf_switching_unit_with_temp,
+        (SWITCH, SA3_01B): __decode_sa3_01b,
+        (SWITCH, SA3_02B): __decode_sa3_02b,
+        (SWITCH, SA3_02M): __decode_sa3_02m,
+        (SWITCH, SA3_04M): __decode_sa3_04m,
+        (SWITCH, SA3_06M): __decode_sa3_06m,
+        (SWITCH, SA3_012M): __decode_sa3_012m,
+        (SWITCH, SA3_014M): __decode_sa3_014m,
+        (SWITCH, SA3_022M): __decode_sa3_022m,
+        (SWITCH, IOU3_108M): __decode_iou3_108m,
+        (SWITCH, RC3_610DALI): __decode_rc3_610dali,
+        (SWITCH, FA3_612M): __decode_fa3_612m,
+        (SWITCH, GCR3_11): __decode_card_reader,
+        (SWITCH, GCH3_31): __decode_card_reader,
+        (SWITCH, BITS): __decode_bits,
+        (NUMBER, None): __decode_number,
+        (SENSOR, RF_TEMPERATURE_INPUT): __decode_rf_temperature_input,
+        (SENSOR, RF_THERMOSTAT): __decode_rf_thermostat,
+        (SENSOR, RF_FLOOD_DETECTOR): __decode_rf_flood_detector,
+        (SENSOR, RF_DETECTOR): __decode_rf_detector,
+        (SENSOR, RF_MOTION_DETECTOR): __decode_rf_motion_detector,
+        (SENSOR, RF_TEMPERATURE_HUMIDITY_SENSOR): __decode_rf_temperature_humidity_sensor,
+        (SENSOR, GRT3_50): __decode_grt3_50,
+        (SENSOR, WSB3_20): __decode_wsb3,
+        (SENSOR, WSB3_40): __decode_wsb3,
+        (SENSOR, WSB3_20H): __decode_wsb3_hum,
+        (SENSOR, WSB3_40H): __decode_wsb3_hum,
+        (SENSOR, IM3_20B): __decode_im3_240b,
+        (SENSOR, IM3_40B): __decode_im3_240b,
+        (SENSOR, IM3_80B): __decode_im3_80b,
+        (SENSOR, IM3_140M): __decode_im3_140m,
+        (SENSOR, DMD3_1): __decode_dmd3_1,
+        (SENSOR, ADC3_60M): __decode_adc3_60m,
+        (SENSOR, TI3_10B): __decode_ti3,
+        (SENSOR, TI3_40B): __decode_ti3,
+        (SENSOR, TI3_60M): __decode_ti3,
+        (SENSOR, IDRT3_1): __decode_idrt3_1,
+        (SENSOR, GSB3_40_V2): __decode_gsb3_v2,
+        (SENSOR, GSB3_60_V2): __decode_gsb3_v2,
+        (SENSOR, GSB3_90_V2): __decode_gsb3_v2,
+        (SENSOR, GSB3_40SX_V2): __decode_gsb3_v2,
+        (SENSOR, GSB3_60SX_V2): __decode_gsb3_v2,
+        (SENSOR, GSB3_90SX_V2): __decode_gsb3_v2,
+        (SENSOR, MSB3_40): __decode_gsb3_v2,
+        (SENSOR, MSB3_60): __decode_gsb3_v2,
+        (SENSOR, MSB3_90): __decode_gsb3_v2,
+        (LIGHT, RF_SINGLE_DIMMER): __decode_rf_dimmer,
+        (LIGHT, RF_DIMMER): __decode_rf_dimmer,
+        (LIGHT, RF_DIMMER_RGB): __decode_rf_dimmer_rgb,
+        (LIGHT, RF_LIGHT_BULB): __decode_rf_light_bulb,
+        (LIGHT, DA3_22M): __decode_da3_22m,
+        (LIGHT, DAC3_04B): __decode_dac3_04b,
+        (LIGHT, DAC3_04M): __decode_dac3_04m,
+        (LIGHT, DCDA_33M): __decode_dcda_33m,
+        (LIGHT, DA3_66M): __decode_da3_66m,
+        (LIGHT, DALI_DMX_UNIT): __decode_dali_dmx_unit,
+        (LIGHT, DALI_DMX_UNIT_2): __decode_dali_dmx_unit_2,
+        (COVER, RF_SHUTTERS): __decode_rf_shutters,
+        (COVER, RF_SHUTTER_UNIT): __decode_rf_shutter_unit,
+        (COVER, JA3_018M): __decode_ja3_018m,
+        (COVER, JA3_014M): __decode_ja3_014m,
+        (CLIMATE, RF_WIRELESS_THERMOVALVE): __decode_rf_wireless_thermovalve,
+        (CLIMATE, VIRT_CONTR): __decode_virt_contr,
+        (CLIMATE, VIRT_HEAT_REG): __decode_virt_heat_reg,
+        (CLIMATE, VIRT_COOL_REG): __decode_virt_cool_reg,
+        (BUTTON, RF_CONTROLLER): __decode_rf_controller,
+        (BUTTON, RF_2_BUTTON_CONTROLLER): __decode_rf_2_button_controller,
+        (BUTTON, GSB3_90SX): __decode_gsb3_90sx,
+        (BUTTON, GSB3_20SX): __decode_gsb3,
+        (BUTTON, GSB3_40SX): __decode_gsb3,
+        (BUTTON, GSB3_60SX): __decode_gsb3,
+        (BUTTON, GBP3_60): __decode_gsb3,
+        (BUTTON, GSP3_100): __decode_gsp3_100,
+        (BUTTON, GDB3_10): __decode_gdb3_10,
+    }
+
+    # (device type, inels type) -> set value encoder, built once at import
+    __INELS_ENCODERS = {
+        (SWITCH, RF_SINGLE_SWITCH): __encode_rf_single_switch,
+        (SWITCH, RF_SWITCHING_UNIT): __encode_rf_switching_unit,
+        (SWITCH, RF_SWITCHING_UNIT_WITH_EXTERNAL_TEMPERATURE_SENSOR): __encode_rf_switching_unit_with_temp,
+        (SWITCH, SA3_01B): __encode_relays,
+        (SWITCH, SA3_02B): __encode_relays,
+        (SWITCH, SA3_02M): __encode_relays,
+        (SWITCH, SA3_04M): __encode_relays,
+        (SWITCH, SA3_06M): __encode_relays,
+        (SWITCH, SA3_012M): __encode_relays,
+        (SWITCH, SA3_014M): __encode_relays,
+        (SWITCH, IOU3_108M): __encode_relays,
+        (SWITCH, SA3_022M): __encode_sa3_022m,
+        (SWITCH, RC3_610DALI): __encode_rc3_610dali,
+        (SWITCH, FA3_612M): __encode_fa3_612m,
+        (SWITCH, GCR3_11): __encode_card_reader,
+        (SWITCH, GCH3_31): __encode_card_reader,
+        (SWITCH, BITS): __encode_bits,
+        (NUMBER, None): __encode_number,
+        (LIGHT, RF_SINGLE_DIMMER): __encode_rf_dimmer,
+        (LIGHT, RF_DIMMER): __encode_rf_dimmer,
+        (LIGHT, RF_DIMMER_RGB): __encode_rf_dimmer_rgb,
+        (LIGHT, RF_LIGHT_BULB): __encode_rf_light_bulb,
+        (LIGHT, DA3_22M): __encode_da3_22m,
+        (LIGHT, DAC3_04B): __encode_dac3_04,
+        (LIGHT, DAC3_04M): __encode_dac3_04,
+        (LIGHT, DCDA_33M): __encode_dcda_33m,
+        (LIGHT, DA3_66M): __encode_da3_66m,
+        (LIGHT, DALI_DMX_UNIT): __encode_dali_dmx_unit,
+        (LIGHT, DALI_DMX_UNIT_2): __encode_dali_dmx_unit_2,
+        (COVER, RF_SHUTTERS): __encode_rf_shutters,
+        (COVER, RF_SHUTTER_UNIT): __encode_rf_shutter_unit,
+        (COVER, JA3_018M): __encode_ja3,
+        (COVER, JA3_014M): __encode_ja3,
+        (CLIMATE, RF_WIRELESS_THERMOVALVE): __encode_rf_wireless_thermovalve,
+        (CLIMATE, VIRT_CONTR): __encode_virt_contr,
+    }
+
+    # decoders which read the last value, their result is not given
+    # by the payload alone
+    __STATEFUL_DECODERS = frozenset((
+        __decode_card_reader,
+        __decode_rf_shutters,
+        __decode_rf_shutter_unit,
+        __decode_rf_controller,
+        __decode_rf_2_button_controller,
+    ))
+
 
 def get_value(status: GetMessageType, platform: str) -> Any:
     """Get value from pyload message."""
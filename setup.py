@@ -21,5 +21,7 @@ setup(
         "Programming Language :: Python :: 3.9",
     ],
     packages=find_packages(),
+    # numpy parses discovery payloads of one length together, see batch.py
+    extras_require={"fast": ["numpy"]},
     test_suite="unittest",
 )
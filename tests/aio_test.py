@@ -0,0 +1,194 @@
+"""Unit tests for AsyncInelsMqtt class
+    driving mqtt communication from the event loop.
+"""
+import asyncio
+import socket
+import time
+from unittest.mock import patch, Mock
+from unittest import IsolatedAsyncioTestCase
+
+from inelsmqttnew.aio import AsyncInelsMqtt
+from inelsmqttnew.const import (
+    MQTT_HOST,
+    MQTT_PORT,
+    MQTT_TIMEOUT,
+    MQTT_DISCOVERY_IDLE,
+)
+
+from tests.const import (
+    TEST_INELS_MQTT_NAMESPACE,
+    TEST_HOST,
+    TEST_PORT,
+)
+
+
+class AsyncInelsMqttTest(IsolatedAsyncioTestCase):
+    """Testing class for AsyncInelsMqtt."""
+
+    def setUp(self) -> None:
+        """Create client over a mocked paho client."""
+        self.patches = [
+            patch(f"{TEST_INELS_MQTT_NAMESPACE}.mqtt.Client", return_value=Mock()),
+        ]
+
+        for item in self.patches:
+            item.start()
+
+        self.mqtt = AsyncInelsMqtt(
+            {
+                MQTT_HOST: TEST_HOST,
+                MQTT_PORT: TEST_PORT,
+                MQTT_TIMEOUT: 1,
+                MQTT_DISCOVERY_IDLE: 0.1,
+            }
+        )
+        self.mqtt.client.is_connected = Mock(return_value=True)
+
+    def tearDown(self) -> None:
+        """Stop all patches."""
+        patch.stopall()
+        self.patches = None
+
+    async def test_async_publish_waits_for_ack(self) -> None:
+        """Test publish resolves when its mid is acknowledged on the loop."""
+        self.mqtt.client.publish = Mock(
+            return_value=Mock(mid=3, rc=0, is_published=Mock(return_value=False))
+        )
+        asyncio.get_running_loop().call_later(
+            0.05, self.mqtt.client.on_publish, self.mqtt.client, None, 3
+        )
+
+        self.assertTrue(await self.mqtt.async_publish("inels/set/45464654/02/1", "01\n"))
+
+    async def test_async_publish_times_out_without_ack(self) -> None:
+        """Test publish returns False when the ack never comes."""
+        self.mqtt.client.publish = Mock(
+            return_value=Mock(mid=4, rc=0, is_published=Mock(return_value=False))
+        )
+
+        self.assertFalse(await self.mqtt.async_publish("inels/set/45464654/02/1", "01\n"))
+
+    async def test_async_discovery_stops_when_quiet(self) -> None:
+        """Test discovery collects topics and ends after the idle time."""
+        loop = asyncio.get_running_loop()
+        for i in range(3):
+            msg = Mock(topic=f"inels/status/45464654/02/{i}", payload=b"01\n")
+            loop.call_later(
+                0.05 * (i + 1), lambda msg=msg: self.mqtt.client.on_message(None, None, msg)
+            )
+
+        devices = await self.mqtt.async_discovery_all()
+
+        self.assertEqual(len(devices), 3)
+        self.assertLess(self.mqtt.discovery_duration, 1)
+        self.assertRaises(RuntimeError, self.mqtt.discovery_all)
+
+    async def test_blocking_methods_are_not_available(self) -> None:
+        """Test methods which could only block the loop raise instead."""
+        self.assertRaises(RuntimeError, self.mqtt.test_connection)
+        self.assertRaises(RuntimeError, self.mqtt.subscribe_many, ["inels/status/45464654/02/1"])
+
+    async def test_async_subscribe_waits_for_suback(self) -> None:
+        """Test subscribe resolves when the broker acknowledges its mid."""
+        topic = "inels/status/45464654/02/1"
+        self.mqtt.client.subscribe = Mock(return_value=(0, 5))
+        asyncio.get_running_loop().call_later(
+            0.05, self.mqtt.client.on_subscribe, self.mqtt.client, None, 5, (0,)
+        )
+
+        start = time.monotonic()
+        self.assertIsNone(await self.mqtt.async_subscribe(topic))
+
+        self.assertLess(time.monotonic() - start, 0.5)
+        self.assertTrue(self.mqtt.is_subscribed(topic))
+        self.mqtt.client.subscribe.assert_called_once_with([(topic, 0)])
+
+    async def test_publish_many_queues_without_waiting(self) -> None:
+        """Test bulk publish reports queued messages and async variant acks."""
+        mids = iter((1, 2))
+        self.mqtt.client.publish = Mock(
+            side_effect=lambda *args: Mock(
+                mid=next(mids), rc=0, is_published=Mock(return_value=False)
+            )
+        )
+        messages = [
+            ("inels/set/45464654/02/1", "01\n", 0, True),
+            ("inels/set/45464654/02/2", "00\n", 0, True),
+        ]
+
+        self.assertDictEqual(
+            self.mqtt.publish_many(messages),
+            {"inels/set/45464654/02/1": True, "inels/set/45464654/02/2": True},
+        )
+
+        mids = iter((3, 4))
+        loop = asyncio.get_running_loop()
+        loop.call_later(0.05, self.mqtt.client.on_publish, self.mqtt.client, None, 3)
+        self.assertDictEqual(
+            await self.mqtt.async_publish_many(messages),
+            {"inels/set/45464654/02/1": True, "inels/set/45464654/02/2": False},
+        )
+
+    async def test_async_connect_does_not_block_the_loop(self) -> None:
+        """Test the blocking connect runs off the loop, its socket is watched on it."""
+        loop = asyncio.get_running_loop()
+        sock, other = socket.socketpair()
+        self.addCleanup(sock.close)
+        self.addCleanup(other.close)
+        ticks = []
+
+        def connect(*args) -> None:
+            """Resolve and open the socket slowly, like paho does."""
+            time.sleep(0.2)
+            self.mqtt.client.on_socket_open(self.mqtt.client, None, sock)
+            self.mqtt.client.on_socket_register_write(self.mqtt.client, None, sock)
+            loop.call_soon_threadsafe(
+                self.mqtt.client.on_connect, self.mqtt.client, None, {}, 0
+            )
+
+        async def tick() -> None:
+            while True:
+                ticks.append(time.monotonic())
+                await asyncio.sleep(0.02)
+
+        self.mqtt.client.is_connected = Mock(return_value=False)
+        self.mqtt.client.connect = Mock(side_effect=connect)
+        ticker = asyncio.create_task(tick())
+        try:
+            self.assertTrue(await self.mqtt.async_connect())
+        finally:
+            ticker.cancel()
+
+        self.assertGreater(len(ticks), 5)
+        self.mqtt.client.connect.assert_called_once_with(TEST_HOST, TEST_PORT)
+        self.assertTrue(loop.remove_reader(sock))
+        self.assertTrue(loop.remove_writer(sock))
+        self.mqtt.close()
+
+    async def test_async_connect_retries_after_failure(self) -> None:
+        """Test a failed connect raises and the next call connects anew."""
+        self.mqtt.client.is_connected = Mock(return_value=False)
+        self.mqtt.client.connect = Mock(side_effect=ConnectionRefusedError)
+
+        with self.assertRaises(ConnectionRefusedError):
+            await self.mqtt.async_connect()
+        with self.assertRaises(ConnectionRefusedError):
+            await self.mqtt.async_connect()
+
+        self.assertEqual(self.mqtt.client.connect.call_count, 2)
+
+    @patch(f"{TEST_INELS_MQTT_NAMESPACE}.aio.RECONNECT_MIN_DELAY_IN_SEC", 0.01)
+    async def test_reconnects_after_unexpected_disconnect(self) -> None:
+        """Test a dropped connection is reopened with backoff from the loop."""
+        await self.mqtt.async_connect()
+        self.mqtt.client.reconnect = Mock(side_effect=[OSError("refused"), 0])
+
+        self.mqtt.client.on_disconnect(self.mqtt.client, None, 7)
+        await asyncio.sleep(0.1)
+
+        self.assertEqual(self.mqtt.client.reconnect.call_count, 2)
+
+        self.mqtt.client.on_disconnect(self.mqtt.client, None, 0)
+        await asyncio.sleep(0.05)
+
+        self.assertEqual(self.mqtt.client.reconnect.call_count, 2)
@@ -0,0 +1,64 @@
+"""Unit tests for bulk decoding of status payloads."""
+from unittest import TestCase
+from unittest.mock import patch
+
+from inelsmqttnew.batch import decode_batch, parse_status_batch
+from inelsmqttnew.const import SA3_04M, SWITCH
+from inelsmqttnew.util import DeviceValue
+
+from tests.const import TEST_INELS_MQTT_NAMESPACE
+
+PAYLOADS = [
+    b"01\n00\n01\n00\n0A\n00\n00\n",
+    "00\n01\n00\n01\n0B\n00\n00\n",
+    b"01\n00\n01\n00\n0a\n00\n00\n",
+    b"1\n00\n01\n00\n0A\n00\n00\n",
+    b"01\n00\n01\n00\n0A\n00\n00",
+    None,
+]
+
+
+class BatchTest(TestCase):
+    """Testing bulk decoding with and without numpy."""
+
+    def check_parse(self) -> None:
+        """Only plain uppercase payloads are parsed."""
+        self.assertListEqual(
+            parse_status_batch(PAYLOADS),
+            [
+                bytes([1, 0, 1, 0, 10, 0, 0]),
+                bytes([0, 1, 0, 1, 11, 0, 0]),
+                None,
+                None,
+                None,
+                None,
+            ],
+        )
+
+    def check_decode(self) -> None:
+        """Batch values equal values decoded one by one."""
+        values = decode_batch(SWITCH, SA3_04M, PAYLOADS)
+
+        self.assertEqual(len(values), len(PAYLOADS))
+        for payload, value in zip(PAYLOADS, values):
+            single = DeviceValue(SWITCH, SA3_04M, inels_value=payload)
+            self.assertEqual(value.ha_value, single.ha_value)
+            self.assertEqual(value.inels_status_value, single.inels_status_value)
+
+    def test_parse(self) -> None:
+        """Test parsing with numpy, when installed."""
+        self.check_parse()
+
+    def test_decode(self) -> None:
+        """Test decoding with numpy, when installed."""
+        self.check_decode()
+
+    @patch(f"{TEST_INELS_MQTT_NAMESPACE}.batch.np", None)
+    def test_parse_without_numpy(self) -> None:
+        """Test parsing payload by payload."""
+        self.check_parse()
+
+    @patch(f"{TEST_INELS_MQTT_NAMESPACE}.batch.np", None)
+    def test_decode_without_numpy(self) -> None:
+        """Test decoding payload by payload."""
+        self.check_decode()
@@ -0,0 +1,79 @@
+"""Unit tests for DecodeCache class
+    sharing decoded values between devices with the same payload
+"""
+from copy import deepcopy
+from dataclasses import FrozenInstanceError
+from unittest import TestCase
+
+from inelsmqttnew.cache import DecodeCache
+from inelsmqttnew.const import BUTTON, RF_CONTROLLER, SA3_04M, SWITCH
+from inelsmqttnew.util import DeviceValue
+
+ON = "01\n00\n01\n00\n03\n"
+OFF = "00\n00\n00\n00\n00\n"
+
+
+class DecodeCacheTest(TestCase):
+    """Testing class for DecodeCache."""
+
+    def test_equal_payloads_share_value(self) -> None:
+        """Test that a repeated payload is answered from the cache."""
+        cache = DecodeCache(4)
+
+        first = cache.decode(SWITCH, SA3_04M, ON)
+        second = cache.decode(SWITCH, SA3_04M, ON)
+
+        self.assertIs(first, second)
+        self.assertEqual(
+            first.ha_value, DeviceValue(SWITCH, SA3_04M, inels_value=ON).ha_value
+        )
+        stats = cache.stats
+        self.assertEqual((stats.entries, stats.hits, stats.misses), (1, 1, 1))
+
+    def test_capacity_drops_least_recently_used(self) -> None:
+        """Test that a hit protects the value from eviction."""
+        cache = DecodeCache(2)
+
+        on = cache.decode(SWITCH, SA3_04M, ON)
+        cache.decode(SWITCH, SA3_04M, OFF)
+        cache.decode(SWITCH, SA3_04M, ON)
+        cache.decode(SWITCH, SA3_04M, "01\n01\n01\n01\n00\n")
+
+        self.assertIs(cache.decode(SWITCH, SA3_04M, ON), on)
+        stats = cache.stats
+        self.assertEqual(stats.entries, 2)
+        self.assertEqual(stats.evictions, 1)
+        self.assertEqual(stats.misses, 3)
+
+    def test_shared_value_is_frozen(self) -> None:
+        """Test that the shared value can only be changed on a copy."""
+        value = DecodeCache(4).decode(SWITCH, SA3_04M, ON).ha_value
+
+        self.assertTrue(value.frozen)
+        with self.assertRaises(FrozenInstanceError):
+            value.simple_relay = []
+        with self.assertRaises(FrozenInstanceError):
+            value.simple_relay[0].is_on = False
+        with self.assertRaises(TypeError):
+            value.sw[0] = True
+
+        copied = deepcopy(value)
+        copied.simple_relay[0].is_on = False
+        self.assertFalse(copied.frozen)
+        self.assertTrue(value.simple_relay[0].is_on)
+        self.assertNotEqual(copied, value)
+
+    def test_stateful_and_disabled_are_not_cached(self) -> None:
+        """Test that decoders reading the last value always decode anew."""
+        cache = DecodeCache(4)
+        payload = "01\n00\n00\n"
+
+        first = cache.decode(BUTTON, RF_CONTROLLER, payload)
+        self.assertIsNot(cache.decode(BUTTON, RF_CONTROLLER, payload, first), first)
+        self.assertFalse(first.ha_value.frozen)
+
+        disabled = DecodeCache(0)
+        self.assertIsNot(
+            disabled.decode(SWITCH, SA3_04M, ON), disabled.decode(SWITCH, SA3_04M, ON)
+        )
+        self.assertEqual(cache.stats.hits + disabled.stats.misses, 0)
@@ -127,3 +127,13 @@ TEST_BUTTONARRAY_GSB3_90X_STATE_VALUE = b"00\n00\n0A\nC4\n00\n00\n00\n00\n00\n00
 #   ??  HUMIDITY
 #   ??  DEWPOINT
 #   ??  DEWPOINT
+
+# RF controller
+TEST_CONTROLLER_MAC_ADDRESS = "???"
+TEST_CONTROLLER_ADDRESS = "XXXXX"
+
+TEST_CONTROLLER_RF_TOPIC_STATE = f"inels/status/{TEST_CONTROLLER_MAC_ADDRESS}/19/{TEST_CONTROLLER_ADDRESS}"
+TEST_CONTROLLER_RF_BTN_1_PRESSED = b"10\n01\n"
+TEST_CONTROLLER_RF_BTN_1_RELEASED = b"00\n01\n"
+#   10  STATE (bit 4 pressed)
+#   01  IDENTITY (button 1)
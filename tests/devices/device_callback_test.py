@@ -0,0 +1,150 @@
+"""Unit tests for Device class
+    decoding status messages and notifying entity callbacks
+"""
+from unittest.mock import Mock, patch
+from unittest import TestCase
+
+from inelsmqttnew import InelsMqtt
+from inelsmqttnew.util import DeviceValue
+from inelsmqttnew.devices import Device
+from inelsmqttnew.const import (
+    BUTTON,
+    MQTT_HOST,
+    MQTT_PORT,
+    MQTT_USERNAME,
+    MQTT_PASSWORD,
+    MQTT_PROTOCOL,
+    PROTO_5,
+)
+
+from tests.const import (
+    TEST_INELS_MQTT_NAMESPACE,
+    TEST_INELS_MQTT_CLASS_NAMESPACE,
+    TEST_HOST,
+    TEST_PORT,
+    TEST_USER_NAME,
+    TEST_PASSWORD,
+    TEST_RELAY_SA3_01B_TOPIC_STATE,
+    TEST_RELAY_SA3_01B_STATE_VALUE,
+    TEST_CONTROLLER_RF_TOPIC_STATE,
+    TEST_CONTROLLER_RF_BTN_1_PRESSED,
+    TEST_CONTROLLER_RF_BTN_1_RELEASED,
+)
+
+
+class DeviceCallbackTest(TestCase):
+    """Device callback tests
+
+    Args:
+        TestCase (_type_): Base class of unit testing
+    """
+
+    def setUp(self) -> None:
+        """Setup all patches and instances for device testing"""
+        self.patches = [
+            patch(f"{TEST_INELS_MQTT_NAMESPACE}.mqtt.Client", return_value=Mock()),
+            patch(
+                f"{TEST_INELS_MQTT_NAMESPACE}.mqtt.Client.username_pw_set",
+                return_value=Mock(),
+            ),
+            patch(f"{TEST_INELS_MQTT_CLASS_NAMESPACE}.subscribe", return_value=Mock()),
+            patch(
+                f"{TEST_INELS_MQTT_CLASS_NAMESPACE}.is_subscribed", return_value=Mock()
+            ),
+            patch(f"{TEST_INELS_MQTT_NAMESPACE}._LOGGER", return_value=Mock()),
+        ]
+
+        for item in self.patches:
+            item.start()
+
+        config = {
+            MQTT_HOST: TEST_HOST,
+            MQTT_PORT: TEST_PORT,
+            MQTT_USERNAME: TEST_USER_NAME,
+            MQTT_PASSWORD: TEST_PASSWORD,
+            MQTT_PROTOCOL: PROTO_5,
+        }
+
+        self.relay = Device(InelsMqtt(config), TEST_RELAY_SA3_01B_TOPIC_STATE, "Relay")
+
+    def tearDown(self) -> None:
+        """Destroy all instances and stop patches"""
+        self.relay = None
+        patch.stopall()
+
+    def test_device_decodes_each_message_once(self) -> None:
+        """Test that an update decodes only the new payload, the last one is rotated"""
+        states = (
+            TEST_RELAY_SA3_01B_STATE_VALUE,
+            b"01\n00\n0A\nC4\n00\n",
+            TEST_RELAY_SA3_01B_STATE_VALUE,
+        )
+        callback = Mock()
+        self.relay.add_ha_callback("relay", 0, callback)
+
+        # devices decode through the decode cache of their client
+        with patch("inelsmqttnew.cache.DeviceValue", wraps=DeviceValue) as decode:
+            for i, payload in enumerate(states):
+                msg = Mock(topic=TEST_RELAY_SA3_01B_TOPIC_STATE, payload=payload)
+                self.relay.mqtt._InelsMqtt__on_message(  # pylint: disable=protected-access
+                    self.relay.mqtt, Mock(), msg
+                )
+                decode.reset_mock()
+                self.relay.callback(False)
+
+                # the first message also decodes the initial missing last value
+                self.assertEqual(decode.call_count, 2 if i == 0 else 1)
+
+        self.assertEqual(callback.call_count, 2)
+        self.assertFalse(self.relay.state.relay[0].is_on)
+
+    def test_late_callbacks_see_every_change_once(self) -> None:
+        """Test callbacks running behind the messages, as on a busy dispatch worker"""
+        relay, temp = Mock(), Mock()
+        self.relay.add_ha_callback("relay", 0, relay)
+        self.relay.add_ha_callback("temp_in", -1, temp)
+
+        def receive(payload: bytes) -> None:
+            msg = Mock(topic=TEST_RELAY_SA3_01B_TOPIC_STATE, payload=payload)
+            self.relay.mqtt._InelsMqtt__on_message(  # pylint: disable=protected-access
+                self.relay.mqtt, Mock(), msg
+            )
+
+        receive(TEST_RELAY_SA3_01B_STATE_VALUE)
+        self.relay.callback(False)
+
+        # relay switched on, then temperature changed, both before any callback ran
+        receive(b"01\n00\n0A\nC4\n00\n")
+        receive(b"01\n00\n0A\nD0\n00\n")
+        self.relay.callback(False)
+        self.relay.callback(False)
+
+        self.assertEqual((relay.call_count, temp.call_count), (1, 1))
+
+        # switched off and republished unchanged before the callback ran
+        receive(b"00\n00\n0A\nD0\n00\n")
+        receive(b"00\n00\n0A\nD0\n00\n")
+        self.relay.callback(False)
+
+        self.assertEqual((relay.call_count, temp.call_count), (2, 1))
+        self.assertFalse(self.relay.state.relay[0].is_on)
+
+    def test_rf_controller_button_callbacks(self) -> None:
+        """Test that every press and release of a controller button is notified"""
+        controller = Device(self.relay.mqtt, TEST_CONTROLLER_RF_TOPIC_STATE, BUTTON)
+        pressed = []
+        controller.add_ha_callback("btn", 0, lambda: pressed.append(controller.state.btn[0]))
+
+        for payload in (
+            TEST_CONTROLLER_RF_BTN_1_RELEASED,
+            TEST_CONTROLLER_RF_BTN_1_PRESSED,
+            TEST_CONTROLLER_RF_BTN_1_RELEASED,
+            TEST_CONTROLLER_RF_BTN_1_PRESSED,
+        ):
+            msg = Mock(topic=TEST_CONTROLLER_RF_TOPIC_STATE, payload=payload)
+            controller.mqtt._InelsMqtt__on_message(  # pylint: disable=protected-access
+                controller.mqtt, Mock(), msg
+            )
+            controller.callback(False)
+
+        self.assertListEqual(pressed, [True, False, True])
@@ -91,3 +91,30 @@ class DiscoveryTest(TestCase):
 
         mock_discovery_all.assert_called()
         mock_discovery_all.assert_called_once()
+
+    @patch(f"{TEST_INELS_MQTT_CLASS_NAMESPACE}.subscribe_many")
+    @patch(
+        f"{TEST_INELS_MQTT_CLASS_NAMESPACE}.discovery_all",
+        return_value={
+            "45464654/02/457544": b"02\n01\n",
+            "45464654/02/74544": b"02\n00\n",
+        },
+    )
+    def test_discovery_subscribes_devices_in_one_batch(
+        self, mock_discovery_all, mock_subscribe_many
+    ) -> None:
+        """Test devices are built without blocking per-device subscribes."""
+        devices = self.i_dis.discovery()
+
+        self.assertEqual(len(devices), 2)
+        InelsMqtt.subscribe.assert_not_called()
+        mock_subscribe_many.assert_called_once()
+        self.assertListEqual(
+            list(mock_subscribe_many.call_args.args[0]),
+            [
+                "inels/status/45464654/02/457544",
+                "inels/connected/45464654/02/457544",
+                "inels/status/45464654/02/74544",
+                "inels/connected/45464654/02/74544",
+            ],
+        )
@@ -0,0 +1,78 @@
+"""Unit tests for ListenerDispatcher class
+    running listener callbacks off the network thread
+"""
+import threading
+from unittest import TestCase
+
+from inelsmqttnew.dispatcher import ListenerDispatcher
+
+
+class ListenerDispatcherTest(TestCase):
+    """Testing class for ListenerDispatcher."""
+
+    def setUp(self) -> None:
+        """Create dispatcher with several workers."""
+        self.dispatcher = ListenerDispatcher(4, 100)
+
+    def tearDown(self) -> None:
+        """Stop the workers."""
+        self.dispatcher.stop()
+
+    def test_keeps_order_per_key(self) -> None:
+        """Test that callbacks of one key run in order on one thread."""
+        calls: dict[str, list[tuple[int, str]]] = {"a": [], "b": []}
+
+        def record(key: str, i: int) -> None:
+            calls[key].append((i, threading.current_thread().name))
+
+        for i in range(200):
+            for key in calls:
+                self.dispatcher.dispatch(key, record, key, i)
+        self.dispatcher.join()
+
+        for key, seen in calls.items():
+            self.assertListEqual([i for i, _ in seen], list(range(200)))
+            self.assertEqual(len({name for _, name in seen}), 1)
+            self.assertNotEqual(seen[0][1], threading.current_thread().name)
+
+    def test_failing_callback_does_not_stop_worker(self) -> None:
+        """Test that an exception in a callback is logged and skipped."""
+        done = []
+
+        def fail() -> None:
+            raise ValueError("listener failed")
+
+        self.dispatcher.dispatch("a", fail)
+        self.dispatcher.dispatch("a", done.append, True)
+        self.dispatcher.join()
+
+        self.assertListEqual(done, [True])
+
+    def test_restarts_after_stop(self) -> None:
+        """Test that a stopped dispatcher starts its workers on dispatch."""
+        done = []
+        self.dispatcher.stop()
+        self.dispatcher.dispatch("a", done.append, 1)
+        self.dispatcher.join()
+        self.dispatcher.stop()
+
+        self.assertFalse(
+            any(t.name.startswith("inels-dispatch") for t in threading.enumerate())
+        )
+        self.dispatcher.dispatch("a", done.append, 2)
+        self.dispatcher.join()
+
+        self.assertListEqual(done, [1, 2])
+
+    def test_stats(self) -> None:
+        """Test that metrics count every dispatched callback."""
+        for i in range(10):
+            self.dispatcher.dispatch(str(i), lambda: None)
+        self.dispatcher.join()
+
+        stats = self.dispatcher.stats
+        self.assertEqual(stats.dispatched, 10)
+        self.assertEqual(stats.completed, 10)
+        self.assertEqual(stats.queue_depth, 0)
+        self.assertGreaterEqual(stats.max_queue_depth, 1)
+        self.assertGreaterEqual(stats.max_latency, stats.mean_latency)
@@ -1,11 +1,14 @@
 """Unit tests for InelsMqtt class
     handling mqtt broker communication.
 """
+import threading
+import time
 from typing import Any
 from unittest.mock import patch, Mock
 from unittest import TestCase
 
 from inelsmqttnew import InelsMqtt
+from inelsmqttnew.mqtt_client import OfflineQueueStats, ParsedTopic
 from inelsmqttnew.const import (
     MQTT_HOST,
     MQTT_PASSWORD,
@@ -13,6 +16,11 @@ from inelsmqttnew.const import (
     MQTT_USERNAME,
     PROTO_5,
     MQTT_PROTOCOL,
+    MQTT_DISPATCH_WORKERS,
+    MQTT_OFFLINE_QUEUE_SIZE,
+    MQTT_SET_INTERVAL,
+    MQTT_STORE_CAPACITY,
+    Connection_state,
 )
 
 from tests.const import (
@@ -102,6 +110,113 @@ class InelsMqttTest(TestCase):
         on_connect(self, 135)
         self.assertEqual(self.mqtt.is_available, False)
 
+    def test_connection_state_follows_connect_and_disconnect(self) -> None:
+        """Test the state machine wakes waiters and tracks reconnects."""
+        self.mqtt.client.connect = Mock(
+            side_effect=lambda *_: threading.Timer(
+                0.05,
+                self.mqtt._InelsMqtt__on_connect,  # pylint: disable=protected-access
+                args=(self.mqtt.client, None, None, 0),
+            ).start()
+        )
+
+        start = time.monotonic()
+        self.mqtt._InelsMqtt__connect()  # pylint: disable=protected-access
+        self.assertLess(time.monotonic() - start, 1)
+        self.assertEqual(self.mqtt.connection_state, Connection_state.Connected)
+
+        # connected, next operation does not touch the client
+        self.mqtt._InelsMqtt__connect()  # pylint: disable=protected-access
+        self.mqtt.client.connect.assert_called_once()
+
+        # unexpected disconnect is retried by the paho loop
+        self.mqtt._InelsMqtt__on_disconnect(  # pylint: disable=protected-access
+            self.mqtt.client, None, 7
+        )
+        self.assertEqual(self.mqtt.connection_state, Connection_state.Connecting)
+        self.assertFalse(self.mqtt.wait_connected(0))
+
+        self.mqtt.disconnect()
+        self.assertEqual(self.mqtt.connection_state, Connection_state.Disconnected)
+
+    @patch(
+        f"{TEST_INELS_MQTT_CLASS_NAMESPACE}._InelsMqtt__connect", return_value=Mock()
+    )
+    def test_set_commands_coalesce_within_interval(self, mock_connect) -> None:
+        """Test rapid set commands send the first and the last only."""
+        self.mqtt = InelsMqtt({**self.config, MQTT_SET_INTERVAL: 0.1})
+        self.mqtt.client.publish = Mock(
+            return_value=Mock(mid=1, rc=0, is_published=Mock(return_value=True))
+        )
+
+        for i in range(10):
+            self.assertTrue(self.mqtt.publish("inels/set/45464654/02/1", f"{i:02X}\n"))
+        self.assertEqual(self.mqtt.client.publish.call_count, 1)
+
+        time.sleep(0.3)
+        self.assertListEqual(
+            [c.args[1] for c in self.mqtt.client.publish.call_args_list],
+            ["00\n", "09\n"],
+        )
+        self.assertEqual(self.mqtt.coalesced_commands, 8)
+
+    @patch(
+        f"{TEST_INELS_MQTT_CLASS_NAMESPACE}._InelsMqtt__connect", return_value=Mock()
+    )
+    def test_publish_many_supersedes_held_set_command(self, mock_connect) -> None:
+        """Test a bulk publish replaces the command held for set_interval."""
+        self.mqtt = InelsMqtt({**self.config, MQTT_SET_INTERVAL: 0.1})
+        self.mqtt.client.publish = Mock(
+            return_value=Mock(mid=1, rc=0, is_published=Mock(return_value=True))
+        )
+        topic = "inels/set/45464654/02/1"
+
+        self.assertTrue(self.mqtt.publish(topic, "01\n"))
+        self.assertTrue(self.mqtt.publish(topic, "02\n"))
+        self.assertDictEqual(self.mqtt.publish_many([(topic, "03\n", 0, True)]), {topic: True})
+
+        time.sleep(0.3)
+        self.assertListEqual(
+            [c.args[1] for c in self.mqtt.client.publish.call_args_list],
+            ["01\n", "03\n"],
+        )
+        self.assertEqual(self.mqtt.coalesced_commands, 1)
+
+        # the bulk publish starts a new interval
+        self.mqtt.publish_many([(topic, "04\n", 0, True)])
+        self.assertTrue(self.mqtt.publish(topic, "05\n"))
+        self.assertEqual(self.mqtt.client.publish.call_count, 3)
+        time.sleep(0.3)
+        self.assertEqual(self.mqtt.client.publish.call_args.args[1], "05\n")
+
+    def test_offline_commands_coalesce_and_replay_on_connect(self) -> None:
+        """Test set commands are queued while reconnecting and replayed."""
+        self.mqtt = InelsMqtt({**self.config, MQTT_OFFLINE_QUEUE_SIZE: 2})
+        self.mqtt._InelsMqtt__on_disconnect(  # pylint: disable=protected-access
+            self.mqtt.client, None, 7
+        )
+
+        self.assertTrue(self.mqtt.publish("inels/set/45464654/02/1", "01\n"))
+        self.assertTrue(self.mqtt.publish("inels/set/45464654/02/2", "01\n"))
+        self.assertTrue(self.mqtt.publish("inels/set/45464654/02/1", "00\n"))
+        self.assertTrue(self.mqtt.publish("inels/set/45464654/02/3", "01\n"))
+        self.mqtt.client.publish.assert_not_called()
+        self.assertEqual(
+            self.mqtt.offline_stats, OfflineQueueStats(2, 1, 1, 0)
+        )
+
+        self.mqtt._InelsMqtt__on_connect(  # pylint: disable=protected-access
+            self.mqtt.client, None, None, 0
+        )
+
+        self.assertListEqual(
+            [c.args[:2] for c in self.mqtt.client.publish.call_args_list],
+            [("inels/set/45464654/02/1", "00\n"), ("inels/set/45464654/02/3", "01\n")],
+        )
+        self.assertEqual(
+            self.mqtt.offline_stats, OfflineQueueStats(0, 1, 1, 2)
+        )
+
     @patch(
         f"{TEST_INELS_MQTT_CLASS_NAMESPACE}._InelsMqtt__connect", return_value=Mock()
     )
@@ -128,6 +243,137 @@ class InelsMqttTest(TestCase):
         devices = self.mqtt.discovery_all()
         self.assertEqual(len(devices), 3)
 
+    @patch(
+        f"{TEST_INELS_MQTT_CLASS_NAMESPACE}._InelsMqtt__connect", return_value=Mock()
+    )
+    def test_discovery_all_stops_when_burst_goes_quiet(self, mock_connect) -> None:
+        """Test discovery ends after the idle window instead of the timeout."""
+        self.mqtt._InelsMqtt__discovery_idle = 0.2  # pylint: disable=protected-access
+
+        def subscribe(topic, *args) -> None:
+            """Deliver retained messages shortly after subscribing."""
+            if topic == "inels/status/#":
+                for i in range(3):
+                    msg = type(
+                        "msg",
+                        (object,),
+                        {"topic": f"inels/status/45464654/02/{i}", "payload": b"02\n01\n"},
+                    )
+                    threading.Timer(
+                        0.05 * (i + 1),
+                        self.mqtt._InelsMqtt__on_discover,  # pylint: disable=protected-access
+                        (self.mqtt.client, None, msg),
+                    ).start()
+
+        self.mqtt.client.subscribe = Mock(side_effect=subscribe)
+
+        devices = self.mqtt.discovery_all()
+
+        self.assertEqual(len(devices), 3)
+        self.assertGreaterEqual(self.mqtt.discovery_duration, 0.35)
+        self.assertLess(self.mqtt.discovery_duration, 1)
+
+    def __deliver_discovered(self, delays: dict[str, float]) -> None:
+        """Deliver a status of every topic after its delay once subscribed."""
+
+        def subscribe(topic, *args) -> None:
+            if topic == "inels/status/#":
+                for status_topic, delay in delays.items():
+                    msg = type(
+                        "msg", (object,), {"topic": status_topic, "payload": b"02\n01\n"}
+                    )
+                    threading.Timer(
+                        delay,
+                        self.mqtt._InelsMqtt__on_discover,  # pylint: disable=protected-access
+                        (self.mqtt.client, None, msg),
+                    ).start()
+
+        self.mqtt.client.subscribe = Mock(side_effect=subscribe)
+
+    @patch(
+        f"{TEST_INELS_MQTT_CLASS_NAMESPACE}._InelsMqtt__connect", return_value=Mock()
+    )
+    def test_discovery_all_idle_starts_with_first_message(self, mock_connect) -> None:
+        """Test a slow broker does not end discovery before it sends anything."""
+        self.mqtt._InelsMqtt__discovery_idle = 0.2  # pylint: disable=protected-access
+        self.__deliver_discovered({"inels/status/45464654/02/1": 0.5})
+
+        devices = self.mqtt.discovery_all()
+
+        self.assertListEqual(list(devices), ["45464654/02/1"])
+        self.assertGreaterEqual(self.mqtt.discovery_duration, 0.5)
+        self.assertLess(self.mqtt.discovery_duration, 2)
+
+    @patch(
+        f"{TEST_INELS_MQTT_CLASS_NAMESPACE}._InelsMqtt__connect", return_value=Mock()
+    )
+    def test_discovery_all_waits_for_awaited_devices(self, mock_connect) -> None:
+        """Test devices answering a comm test late are still discovered."""
+        self.mqtt._InelsMqtt__discovery_idle = 0.2  # pylint: disable=protected-access
+        self.__deliver_discovered(
+            {"inels/status/45464654/02/1": 0.05, "inels/status/45464654/02/2": 0.8}
+        )
+
+        devices = self.mqtt.discovery_all(["45464654/02/2"])
+
+        self.assertEqual(len(devices), 2)
+        self.assertGreaterEqual(self.mqtt.discovery_duration, 0.8)
+        self.assertLess(self.mqtt.discovery_duration, 2)
+
+    @patch(
+        f"{TEST_INELS_MQTT_CLASS_NAMESPACE}._InelsMqtt__connect", return_value=Mock()
+    )
+    def test_discovery_all_keeps_devices_over_store_capacity(self, mock_connect) -> None:
+        """Test the store does not drop devices found by discovery."""
+        self.mqtt = InelsMqtt({**self.config, MQTT_STORE_CAPACITY: 2})
+        self.mqtt._InelsMqtt__discovery_idle = 0.2  # pylint: disable=protected-access
+        self.__deliver_discovered(
+            {f"inels/status/45464654/02/{i}": 0.02 * (i + 1) for i in range(5)}
+        )
+
+        devices = self.mqtt.discovery_all()
+
+        self.assertEqual(len(devices), 5)
+        self.assertEqual(len(self.mqtt.messages()), 5)
+
+        # a later status of a device without listener is bounded again
+        self.mqtt._InelsMqtt__on_message(  # pylint: disable=protected-access
+            self.mqtt.client, None, Mock(topic="inels/status/45464654/02/5", payload=b"01\n")
+        )
+        self.assertEqual(len(devices), 5)
+
+    @patch(
+        f"{TEST_INELS_MQTT_CLASS_NAMESPACE}._InelsMqtt__connect", return_value=Mock()
+    )
+    def test_discovery_all_ignores_chatter_of_seen_topics(self, mock_connect) -> None:
+        """Test repeated and unknown topics do not keep discovery running."""
+        self.mqtt._InelsMqtt__discovery_idle = 0.2  # pylint: disable=protected-access
+        chatter = [
+            "inels/status/45464654/02/1",
+            "inels/status/45464654/unknown/2",
+            "inels/status/45464654/gw/3",
+        ]
+
+        def subscribe(topic, *args) -> None:
+            """Deliver the same topics over and over once subscribed."""
+            if topic == "inels/status/#":
+                for i, status_topic in enumerate(chatter * 20):
+                    msg = type(
+                        "msg", (object,), {"topic": status_topic, "payload": b"02\n01\n"}
+                    )
+                    threading.Timer(
+                        0.05 * (i + 1),
+                        self.mqtt._InelsMqtt__on_discover,  # pylint: disable=protected-access
+                        (self.mqtt.client, None, msg),
+                    ).start()
+
+        self.mqtt.client.subscribe = Mock(side_effect=subscribe)
+
+        devices = self.mqtt.discovery_all()
+
+        self.assertListEqual(list(devices), ["45464654/02/1"])
+        self.assertLess(self.mqtt.discovery_duration, 1.5)
+
     @patch(
         f"{TEST_INELS_MQTT_CLASS_NAMESPACE}._InelsMqtt__connect", return_value=Mock()
     )
@@ -150,6 +396,320 @@ class InelsMqttTest(TestCase):
 
         self.assertEqual(msg.payload, payload)
 
+    @patch(
+        f"{TEST_INELS_MQTT_CLASS_NAMESPACE}._InelsMqtt__connect", return_value=Mock()
+    )
+    def test_publish_waits_only_for_own_ack(self, mock_connect) -> None:
+        """Test publish returns as soon as the ack of its own mid arrives."""
+
+        def publish(*args) -> Mock:
+            """Ack a foreign mid first, then the published one."""
+            for mid, delay in ((6, 0.05), (7, 0.1)):
+                threading.Timer(
+                    delay,
+                    self.mqtt._InelsMqtt__on_publish,  # pylint: disable=protected-access
+                    (self.mqtt.client, None, mid),
+                ).start()
+            return Mock(mid=7, rc=0, is_published=Mock(return_value=False))
+
+        self.mqtt.client.publish = Mock(side_effect=publish)
+
+        start = time.monotonic()
+        self.assertTrue(self.mqtt.publish("inels/set/45464654/02/457544", "01\n"))
+        elapsed = time.monotonic() - start
+
+        self.assertGreaterEqual(elapsed, 0.08)
+        self.assertLess(elapsed, 1)
+
+    @patch(
+        f"{TEST_INELS_MQTT_CLASS_NAMESPACE}._InelsMqtt__connect", return_value=Mock()
+    )
+    def test_publish_times_out_without_ack(self, mock_connect) -> None:
+        """Test publish returns False when the broker never acks."""
+        self.mqtt._InelsMqtt__timeout = 0.1  # pylint: disable=protected-access
+        self.mqtt.client.publish = Mock(
+            return_value=Mock(mid=3, rc=0, is_published=Mock(return_value=False))
+        )
+
+        self.assertFalse(self.mqtt.publish("inels/set/45464654/02/457544", "01\n"))
+
+    @patch(
+        f"{TEST_INELS_MQTT_CLASS_NAMESPACE}._InelsMqtt__connect", return_value=Mock()
+    )
+    def test_publish_fails_at_once_when_not_sent(self, mock_connect) -> None:
+        """Test publish does not wait for an ack of a message paho refused."""
+        self.mqtt._InelsMqtt__timeout = 5  # pylint: disable=protected-access
+        self.mqtt.client.publish = Mock(
+            return_value=Mock(mid=3, rc=4, is_published=Mock(return_value=False))
+        )
+
+        start = time.monotonic()
+        self.assertFalse(self.mqtt.publish("inels/set/45464654/02/457544", "01\n"))
+        self.assertDictEqual(
+            self.mqtt.publish_many([("inels/set/45464654/02/457544", "01\n", 0, True)]),
+            {"inels/set/45464654/02/457544": False},
+        )
+        self.assertLess(time.monotonic() - start, 1)
+
+    @patch(
+        f"{TEST_INELS_MQTT_CLASS_NAMESPACE}._InelsMqtt__connect", return_value=Mock()
+    )
+    def test_publish_many_waits_for_all_acks_together(self, mock_connect) -> None:
+        """Test bulk publish sends everything first and reports per topic."""
+        mids = iter((1, 2, 3))
+
+        def publish(*args) -> Mock:
+            """Publish and let the broker ack every message except mid 2."""
+            mid = next(mids)
+            if mid != 2:
+                threading.Timer(
+                    0.05,
+                    self.mqtt._InelsMqtt__on_publish,  # pylint: disable=protected-access
+                    (self.mqtt.client, None, mid),
+                ).start()
+            return Mock(mid=mid, rc=0, is_published=Mock(return_value=False))
+
+        self.mqtt.client.publish = Mock(side_effect=publish)
+
+        start = time.monotonic()
+        results = self.mqtt.publish_many(
+            [
+                ("inels/set/45464654/02/1", "01\n", 0, True),
+                ("inels/set/45464654/02/2", "01\n", 0, True),
+                ("inels/set/45464654/02/3", "02\n", 0, True),
+            ],
+            timeout=0.3,
+        )
+
+        self.assertLess(time.monotonic() - start, 1)
+        self.assertEqual(self.mqtt.client.publish.call_count, 3)
+        self.assertDictEqual(
+            results,
+            {
+                "inels/set/45464654/02/1": True,
+                "inels/set/45464654/02/2": False,
+                "inels/set/45464654/02/3": True,
+            },
+        )
+
+    @patch(
+        f"{TEST_INELS_MQTT_CLASS_NAMESPACE}._InelsMqtt__connect", return_value=Mock()
+    )
+    def test_ack_from_network_thread_during_publish(self, mock_connect) -> None:
+        """Test that an ack handled while publishing does not deadlock."""
+        # paho holds its out message lock while calling on_publish
+        out_message_lock = threading.Lock()
+        acking = threading.Event()
+        mids = iter((1, 2))
+
+        def ack(mid: int) -> None:
+            """Handle puback on the network thread."""
+            with out_message_lock:
+                acking.set()
+                self.mqtt._InelsMqtt__on_publish(  # pylint: disable=protected-access
+                    self.mqtt.client, None, mid
+                )
+
+        def publish(*args) -> Mock:
+            """Publish while the ack of the previous message is handled."""
+            mid = next(mids)
+            with out_message_lock:
+                pass
+            acking.clear()
+            threading.Thread(target=ack, args=(mid,), daemon=True).start()
+            acking.wait(1)
+            return Mock(mid=mid, rc=0, is_published=Mock(return_value=True))
+
+        self.mqtt.client.publish = Mock(side_effect=publish)
+        results = {}
+        sender = threading.Thread(
+            target=lambda: results.update(
+                self.mqtt.publish_many(
+                    [
+                        ("inels/set/45464654/02/1", "01\n", 1, True),
+                        ("inels/set/45464654/02/2", "01\n", 1, True),
+                    ],
+                    timeout=1,
+                )
+            ),
+            daemon=True,
+        )
+        sender.start()
+        sender.join(3)
+
+        self.assertFalse(sender.is_alive())
+        self.assertDictEqual(
+            results,
+            {"inels/set/45464654/02/1": True, "inels/set/45464654/02/2": True},
+        )
+
+    def test_unchanged_republish_is_not_notified(self) -> None:
+        """Test that an identical status payload only refreshes last seen."""
+        topic = "inels/status/45464654/02/457544"
+        listener = Mock()
+        self.mqtt.subscribe_listener(topic, "unique", listener)
+
+        for payload in (b"01\n00\n", b"01\n00\n", b"02\n00\n"):
+            msg = Mock(topic=topic, payload=payload)
+            self.mqtt._InelsMqtt__on_message(  # pylint: disable=protected-access
+                self.mqtt, Mock(), msg
+            )
+            if payload == b"01\n00\n":
+                first_seen = self.mqtt.last_seen(topic)
+
+        self.assertEqual(listener.call_count, 2)
+        self.assertEqual(self.mqtt.duplicate_messages, 1)
+        self.assertEqual(self.mqtt.last_value(topic), b"01\n00\n")
+        self.assertEqual(self.mqtt.messages()[topic], b"02\n00\n")
+        self.assertGreaterEqual(self.mqtt.last_seen(topic), first_seen)
+
+    @patch(
+        f"{TEST_INELS_MQTT_CLASS_NAMESPACE}._InelsMqtt__connect", return_value=Mock()
+    )
+    def test_unchanged_status_after_command_is_notified(self, mock_connect) -> None:
+        """Test that the status answering a command corrects the device."""
+        topic = "inels/status/45464654/02/457544"
+        listener = Mock()
+        self.mqtt.subscribe_listener(topic, "unique", listener)
+        self.mqtt.client.publish = Mock(
+            return_value=Mock(mid=1, rc=0, is_published=Mock(return_value=True))
+        )
+
+        def receive() -> None:
+            self.mqtt._InelsMqtt__on_message(  # pylint: disable=protected-access
+                self.mqtt, Mock(), Mock(topic=topic, payload=b"01\n00\n")
+            )
+
+        receive()
+        self.assertTrue(self.mqtt.publish("inels/set/45464654/02/457544", "02\n00\n"))
+        receive()
+        receive()
+
+        self.assertEqual(listener.call_count, 2)
+        self.assertEqual(self.mqtt.duplicate_messages, 1)
+
+    def test_parsed_topic_fragments(self) -> None:
+        """Test that topic is split into its fragments once."""
+        parsed = ParsedTopic.parse("inels/status/45464654/02/457544")
+        gateway = ParsedTopic.parse("inels/connected/45464654/gw")
+
+        self.assertEqual(parsed.domain, "inels")
+        self.assertEqual(parsed.action, "status")
+        self.assertEqual(parsed.serial, "45464654")
+        self.assertEqual(parsed.device_type, "02")
+        self.assertEqual(parsed.unique_id, "457544")
+        self.assertEqual(parsed.stripped, "45464654/02/457544")
+        self.assertEqual(gateway.device_type, "gw")
+        self.assertIsNone(gateway.unique_id)
+
+    def test_gateway_connected_notifies_its_devices(self) -> None:
+        """Test that gateway availability reaches every device behind it."""
+        listener = Mock()
+        other = Mock()
+        self.mqtt.subscribe_listener("inels/status/45464654/02/1", "first", listener)
+        self.mqtt.subscribe_listener("inels/status/45464654/02/2", "second", listener)
+        self.mqtt.subscribe_listener("inels/status/454646549/02/1", "other", other)
+
+        msg = Mock(topic="inels/connected/45464654/gw", payload=b'{"status": true}')
+        self.mqtt._InelsMqtt__on_message(  # pylint: disable=protected-access
+            self.mqtt, Mock(), msg
+        )
+
+        self.assertEqual(listener.call_count, 2)
+        listener.assert_called_with(True)
+        other.assert_not_called()
+
+    def test_listeners_run_on_dispatch_workers(self) -> None:
+        """Test that configured workers take listener calls off the network thread."""
+        mqtt = InelsMqtt({**self.config, MQTT_DISPATCH_WORKERS: 2})
+        topic = "inels/status/45464654/02/457544"
+        threads = []
+        mqtt.subscribe_listener(
+            topic, "unique", lambda _: threads.append(threading.current_thread())
+        )
+
+        for payload in (b"01\n", b"02\n"):
+            mqtt._InelsMqtt__on_message(  # pylint: disable=protected-access
+                mqtt, Mock(), Mock(topic=topic, payload=payload)
+            )
+        mqtt._InelsMqtt__dispatcher.join()  # pylint: disable=protected-access
+
+        self.assertEqual(len(threads), 2)
+        self.assertNotIn(threading.current_thread(), threads)
+        self.assertEqual(mqtt.dispatch_stats.completed, 2)
+        self.assertIsNone(self.mqtt.dispatch_stats)
+
+    def test_disconnect_stops_dispatch_workers(self) -> None:
+        """Test that disconnect stops the workers and a reconnect restarts them."""
+        mqtt = InelsMqtt({**self.config, MQTT_DISPATCH_WORKERS: 2})
+        topic = "inels/status/45464654/02/457544"
+        listener = Mock()
+        mqtt.subscribe_listener(topic, "unique", listener)
+
+        def receive(payload: bytes) -> None:
+            mqtt._InelsMqtt__on_message(  # pylint: disable=protected-access
+                mqtt, Mock(), Mock(topic=topic, payload=payload)
+            )
+
+        receive(b"01\n")
+        mqtt.disconnect()
+
+        self.assertEqual(listener.call_count, 1)
+        self.assertFalse(
+            any(t.name.startswith("inels-dispatch") for t in threading.enumerate())
+        )
+
+        receive(b"02\n")
+        mqtt._InelsMqtt__dispatcher.join()  # pylint: disable=protected-access
+        mqtt.disconnect()
+
+        self.assertEqual(listener.call_count, 2)
+
+    def test_store_capacity_forgets_quiet_topics(self) -> None:
+        """Test that topics dropped by the store leave all bookkeeping."""
+        mqtt = InelsMqtt({**self.config, MQTT_STORE_CAPACITY: 2})
+
+        for i in range(3):
+            mqtt._InelsMqtt__on_message(  # pylint: disable=protected-access
+                mqtt.client, None, Mock(topic=f"inels/status/45464654/02/{i}", payload=b"01\n")
+            )
+
+        self.assertNotIn("inels/status/45464654/02/0", mqtt.messages())
+        self.assertIsNone(mqtt.last_value("inels/status/45464654/02/0"))
+        self.assertIsNone(mqtt.last_seen("inels/status/45464654/02/0"))
+        self.assertEqual(len(mqtt.messages()), 2)
+        self.assertEqual(mqtt.store_stats.entries, 2)
+        self.assertEqual(mqtt.store_stats.evictions, 1)
+
+    @patch(
+        f"{TEST_INELS_MQTT_CLASS_NAMESPACE}._InelsMqtt__connect", return_value=Mock()
+    )
+    def test_store_keeps_watched_and_availability_topics(self, mock_connect) -> None:
+        """Test that the store never forgets what devices and reconnects need."""
+        mqtt = InelsMqtt({**self.config, MQTT_STORE_CAPACITY: 1})
+        mqtt.client.subscribe = Mock(return_value=(0, 1))
+        watched = "inels/status/45464654/02/0"
+        mqtt.subscribe_many([watched, "inels/status/45464654/02/1"])
+        mqtt.subscribe_listener(watched, "0", Mock())
+
+        for topic in (
+            "inels/connected/45464654/gw",
+            "inels/connected/45464654/02/0",
+            watched,
+            "inels/status/45464654/02/1",
+            "inels/status/45464654/02/2",
+        ):
+            mqtt._InelsMqtt__on_message(  # pylint: disable=protected-access
+                mqtt.client, None, Mock(topic=topic, payload=b"01\n")
+            )
+
+        self.assertIn(watched, mqtt.messages())
+        self.assertIn("inels/connected/45464654/02/0", mqtt.messages())
+        self.assertIn("inels/connected/45464654/gw", mqtt.messages())
+        self.assertNotIn("inels/status/45464654/02/1", mqtt.messages())
+        self.assertTrue(mqtt.is_subscribed("inels/status/45464654/02/1"))
+        self.assertEqual(mqtt.store_stats.evictions, 1)
+
     def test_message_property(self) -> None:
         """Test if message property returns right data."""
         dictionary = {
@@ -0,0 +1,57 @@
+"""Unit tests for InelsMqttClient class
+    wrapping external mqtt client.
+"""
+import asyncio
+from unittest import IsolatedAsyncioTestCase
+from unittest.mock import patch
+
+from inelsmqttnew.mqtt_client import InelsMqttClient
+
+from tests.const import TEST_INELS_MQTT_NAMESPACE
+
+
+class InelsMqttClientTest(IsolatedAsyncioTestCase):
+    """Testing class for InelsMqttClient."""
+
+    async def asyncSetUp(self) -> None:
+        """Create client recording every publish."""
+        self.published: list[tuple[str, str, float]] = []
+
+        async def pub(topic, payload, qos, retain) -> None:
+            self.published.append((topic, payload, asyncio.get_running_loop().time()))
+
+        async def sub(state, topics) -> dict:
+            return {}
+
+        async def un_sub(state) -> dict:
+            return {}
+
+        self.client = InelsMqttClient(sub, un_sub, pub)
+
+    @patch(f"{TEST_INELS_MQTT_NAMESPACE}.mqtt_client.PUBLISH_DELAY_IN_SEC", 0.1)
+    async def test_publish_with_delay_restarts_on_repeat(self) -> None:
+        """Test repeated message is published once, delay counted from the last."""
+        start = asyncio.get_running_loop().time()
+        for _ in range(5):
+            await self.client.publish_with_delay("01\n", "inels/set/45464654/02/1")
+            await asyncio.sleep(0.03)
+
+        await asyncio.sleep(0.2)
+
+        self.assertEqual(len(self.published), 1)
+        self.assertGreaterEqual(self.published[0][2] - start, 0.22)
+
+    @patch(f"{TEST_INELS_MQTT_NAMESPACE}.mqtt_client.PUBLISH_DELAY_IN_SEC", 0.1)
+    async def test_publish_with_delay_uses_single_task(self) -> None:
+        """Test many delayed messages share one task and flush together."""
+        tasks = len(asyncio.all_tasks())
+        for i in range(200):
+            await self.client.publish_with_delay("01\n", f"inels/set/45464654/02/{i}")
+
+        self.assertEqual(len(asyncio.all_tasks()), tasks + 1)
+        self.assertEqual(len(self.client._scheduler), 200)  # pylint: disable=protected-access
+
+        await asyncio.sleep(0.2)
+
+        self.assertEqual(len(self.published), 200)
+        self.assertEqual(len(self.client._scheduler), 0)  # pylint: disable=protected-access
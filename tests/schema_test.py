@@ -0,0 +1,113 @@
+"""Unit tests for compiled payload layouts."""
+from unittest import TestCase
+
+from inelsmqttnew.schema import (
+    Field,
+    Field_kind,
+    SetTemplate,
+    compile_layout,
+    unpack_bits,
+)
+
+DATA = {
+    "temp": [3, 2, 1, 0],
+    "mode": [4],
+    "relay": [5, 6],
+    "sw": [7, 8],
+    "light": [9, 10],
+}
+
+FIELDS = {
+    "temp": Field(scale=100, sentinels={0x7FFFFFFB: 0}),
+    "mode": Field(mask=0x0F),
+    "relay": Field(kind=Field_kind.Flags, mask=1),
+    "sw": Field(kind=Field_kind.Bits),
+    "light": Field(kind=Field_kind.Hex),
+}
+
+STATUS = "D2\n04\n00\n00\n15\n07\n06\n81\n02\nAB\n01\n"
+
+
+class SchemaTest(TestCase):
+    """Testing layouts compiled into decode and encode."""
+
+    def setUp(self) -> None:
+        """Compile layout"""
+        self.layout = compile_layout(DATA, FIELDS)
+
+    def tearDown(self) -> None:
+        """Destroy layout"""
+        self.layout = None
+
+    def test_decode(self) -> None:
+        """Test reading every kind of field."""
+        fields = self.layout.decode(bytes.fromhex(STATUS))
+
+        self.assertEqual(fields["temp"], 12.34)
+        self.assertEqual(fields["mode"], 5)
+        self.assertListEqual(fields["relay"], [True, False])
+        self.assertListEqual(
+            fields["sw"], [True] + [False] * 6 + [True] + [False, True] + [False] * 6
+        )
+        self.assertEqual(fields["light"], "AB01")
+        self.assertEqual(self.layout.size, 11)
+
+    def test_decode_tokens(self) -> None:
+        """Test reading hex strings gives the same fields."""
+        tokens = STATUS.split("\n")[:-1]
+
+        self.assertDictEqual(
+            self.layout.decode_tokens(tokens), self.layout.decode(bytes.fromhex(STATUS))
+        )
+
+    def test_sentinel(self) -> None:
+        """Test sentinel value is not scaled."""
+        status = bytes.fromhex(STATUS.replace("D2\n04\n00\n00\n", "FB\nFF\nFF\n7F\n"))
+
+        self.assertEqual(self.layout.decode(status)["temp"], 0)
+
+    def test_encode(self) -> None:
+        """Test encoding the decoded fields, masked bits are dropped."""
+        fields = self.layout.decode(bytes.fromhex(STATUS))
+
+        self.assertEqual(
+            self.layout.encode(fields), "D2\n04\n00\n00\n05\n01\n00\n81\n02\nAB\n01\n"
+        )
+
+    def test_encode_little_endian(self) -> None:
+        """Test little endian field is written least significant first."""
+        layout = compile_layout(
+            {"temp": [0, 1, 2, 3], "mode": [5]},
+            {"temp": Field(scale=100, little_endian=True), "mode": Field()},
+        )
+
+        self.assertEqual(
+            layout.encode({"temp": 21.5, "mode": 7}), "66\n08\n00\n00\n00\n07\n"
+        )
+        self.assertEqual(layout.decode(bytes([0x66, 8, 0, 0, 0, 7]))["temp"], 21.5)
+
+    def test_unpack_bits(self) -> None:
+        """Test bits of every mask are listed from bit 0."""
+        self.assertTupleEqual(unpack_bits(0x05), (True, False, True) + (False,) * 5)
+        self.assertTupleEqual(
+            unpack_bits(0x80, 0x01), (False,) * 7 + (True, True) + (False,) * 7
+        )
+        for value in range(256):
+            self.assertEqual(
+                unpack_bits(value), tuple(f"{value:0>8b}"[7 - i] == "1" for i in range(8))
+            )
+
+    def test_set_template(self) -> None:
+        """Test only the slots of the template are filled."""
+        template = SetTemplate(6, [1, 4])
+
+        self.assertEqual(template.render([0x0A, 0xFF]), "00\n0A\n00\n00\nFF\n00\n")
+        self.assertEqual(template.render([0, 0]), "00\n" * 6)
+
+    def test_set_template_not_byte(self) -> None:
+        """Test values which are not bytes are formatted as they are."""
+        template = SetTemplate(3, [0, 2])
+
+        self.assertEqual(template.render([0x12C, 1]), "12C\n00\n01\n")
+        self.assertRaises(ValueError, template.render, [1.5, 1])
+        self.assertRaises(ValueError, template.render, [1])
@@ -0,0 +1,110 @@
+"""Unit tests for TopicStore class
+    bounding received topics kept in memory
+"""
+import sys
+import threading
+from unittest import TestCase
+from unittest.mock import patch
+
+from inelsmqttnew.store import TopicStore
+
+from tests.const import TEST_INELS_MQTT_NAMESPACE
+
+
+class TopicStoreTest(TestCase):
+    """Testing class for TopicStore."""
+
+    def test_capacity_drops_least_recently_seen(self) -> None:
+        """Test that touching a topic protects it from eviction."""
+        store = TopicStore(2, 0)
+
+        self.assertListEqual(store.touch("inels/status/1/02/1", b"01\n"), [])
+        self.assertListEqual(store.touch("inels/status/1/02/2", b"01\n"), [])
+        self.assertListEqual(store.touch("inels/status/1/02/1", b"00\n"), [])
+        self.assertListEqual(
+            store.touch("inels/status/1/02/3", b"01\n"), ["inels/status/1/02/2"]
+        )
+
+        stats = store.stats
+        self.assertEqual(stats.entries, 2)
+        self.assertEqual(stats.evictions, 1)
+        self.assertNotIn("inels/status/1/02/2", store)
+
+    @patch(f"{TEST_INELS_MQTT_NAMESPACE}.store.time.time")
+    def test_ttl_drops_quiet_topics(self, mock_time) -> None:
+        """Test that topics quiet longer than ttl are dropped."""
+        store = TopicStore(0, 60)
+
+        mock_time.return_value = 1000
+        store.touch("inels/status/1/02/1", b"01\n")
+        store.touch("inels/status/1/02/2", b"01\n")
+        mock_time.return_value = 1030
+        store.touch("inels/status/1/02/2", b"00\n")
+        mock_time.return_value = 1070
+
+        self.assertListEqual(
+            store.touch("inels/status/1/02/3", b"01\n"), ["inels/status/1/02/1"]
+        )
+        self.assertEqual(store.last_seen("inels/status/1/02/2"), 1030)
+        self.assertEqual(store.stats.expirations, 1)
+
+    def test_bytes_follow_payloads(self) -> None:
+        """Test that byte usage is replaced, not summed, on repeated touch."""
+        store = TopicStore(0, 0)
+
+        store.touch("inels/status/1/02/1", b"01\n")
+        size = store.stats.bytes
+        store.touch("inels/status/1/02/1", b"01\n")
+
+        self.assertGreater(size, 0)
+        self.assertEqual(store.stats.bytes, size)
+
+    def test_pinned_topics_are_never_dropped(self) -> None:
+        """Test that pinned topics outlive capacity and ttl until unpinned."""
+        store = TopicStore(1, 60)
+
+        with patch(f"{TEST_INELS_MQTT_NAMESPACE}.store.time.time", return_value=1000):
+            store.touch("inels/connected/1/02/1", b"on\n", pinned=True)
+            store.touch("inels/status/1/02/1", b"01\n")
+            store.pin("inels/status/1/02/1")
+
+        with patch(f"{TEST_INELS_MQTT_NAMESPACE}.store.time.time", return_value=1100):
+            self.assertListEqual(store.touch("inels/status/1/02/2", b"01\n"), [])
+            self.assertListEqual(
+                store.touch("inels/status/1/02/1", b"00\n"), ["inels/status/1/02/2"]
+            )
+
+        self.assertIn("inels/connected/1/02/1", store)
+        self.assertEqual(store.last_seen("inels/connected/1/02/1"), 1000)
+        self.assertEqual(store.stats.entries, 2)
+
+    def test_pin_and_touch_from_several_threads(self) -> None:
+        """Test that the store stays consistent under concurrent use."""
+        store = TopicStore(10, 0)
+        topics = [f"inels/status/1/02/{i}" for i in range(100)]
+
+        def touch() -> None:
+            for _ in range(20):
+                for topic in topics:
+                    store.touch(topic, b"01\n")
+
+        def pin() -> None:
+            for _ in range(20):
+                for topic in topics[:5]:
+                    store.pin(topic)
+                    store.last_seen(topic)
+
+        threads = [threading.Thread(target=fnc) for fnc in (touch, touch, pin)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        tracked = [topic for topic in topics if topic in store]
+        stats = store.stats
+        self.assertLessEqual(stats.entries, 15)
+        self.assertEqual(stats.entries, len(tracked))
+        self.assertEqual(
+            stats.bytes,
+            sum(sys.getsizeof(topic) + sys.getsizeof(b"01\n") for topic in tracked),
+        )
@@ -0,0 +1,71 @@
+"""Unit test for DeviceValue decoding
+    of status payloads into ha values
+"""
+
+from unittest import TestCase
+
+from inelsmqttnew.const import (
+    SA3_02M,
+    SWITCH,
+)
+from inelsmqttnew.util import DeviceValue, HaValue, RelaySwitchValue, SimpleRelay
+
+
+class DeviceValueTest(TestCase):
+    """DeviceValue class tests
+
+    Args:
+        TestCase (_type_): Base class of unit testing
+    """
+
+    def test_decoded_value_is_slotted_instance(self) -> None:
+        """Test that decoding yields an instance of the family's value type."""
+        value = DeviceValue(SWITCH, SA3_02M, inels_value="01\n00\n00\n00\n00\n00\n").ha_value
+
+        self.assertIsInstance(value, RelaySwitchValue)
+        self.assertFalse(hasattr(value, "__dict__"))
+        self.assertEqual(value.simple_relay, [SimpleRelay(is_on=True), SimpleRelay(is_on=False)])
+
+    def test_bytes_payload_decodes_like_str(self) -> None:
+        """Test that a raw bytes payload is decoded without changing values."""
+        for payload in ("01\n00\n00\n00\n00\n00\n", "0a\n01\n00\n00\n00\n00\n"):
+            from_str = DeviceValue(SWITCH, SA3_02M, inels_value=payload)
+            from_bytes = DeviceValue(SWITCH, SA3_02M, inels_value=payload.encode())
+
+            self.assertEqual(from_bytes.ha_value, from_str.ha_value)
+            self.assertEqual(from_bytes.inels_status_value, payload)
+
+    def test_values_compare_by_fields(self) -> None:
+        """Test that equal payloads decode to equal values."""
+        first = DeviceValue(SWITCH, SA3_02M, inels_value="01\n00\n00\n00\n00\n00\n").ha_value
+        second = DeviceValue(SWITCH, SA3_02M, inels_value="01\n00\n00\n00\n00\n00\n").ha_value
+        third = DeviceValue(SWITCH, SA3_02M, inels_value="00\n00\n00\n00\n00\n00\n").ha_value
+
+        self.assertEqual(first, second)
+        self.assertNotEqual(first, third)
+
+    def test_value_rejects_undeclared_fields(self) -> None:
+        """Test that a value type only accepts its declared fields."""
+        self.assertRaises(TypeError, RelaySwitchValue, simple_relay=[])
+        self.assertRaises(TypeError, RelaySwitchValue, simple_relay=[], sw=[], temp=0)
+        self.assertTrue(issubclass(RelaySwitchValue, HaValue))
+
+    def test_diff_returns_changed_keys(self) -> None:
+        """Test that diff lists changed list items and scalar fields."""
+        last = RelaySwitchValue(
+            simple_relay=[SimpleRelay(is_on=True), SimpleRelay(is_on=False)], sw=[False, False]
+        )
+        curr = RelaySwitchValue(
+            simple_relay=[SimpleRelay(is_on=True), SimpleRelay(is_on=True)], sw=[False, False]
+        )
+
+        self.assertListEqual(curr.diff(last), [("simple_relay", 1)])
+        self.assertListEqual(curr.diff(curr), [])
+
+    def test_diff_against_other_value_changes_everything(self) -> None:
+        """Test that diff against a failed decode reports every key."""
+        curr = RelaySwitchValue(simple_relay=[SimpleRelay(is_on=True)], sw=[False, True])
+
+        self.assertListEqual(
+            curr.diff(None), [("simple_relay", 0), ("sw", 0), ("sw", 1)]
+        )